@@ -0,0 +1,93 @@
+import argparse
+from typing import List, Optional
+
+from rasa.cli import SubParsersAction
+from rasa.engine.caching import CACHE_SIZE_ENV, LocalTrainingCache
+import rasa.shared.utils.cli
+
+
+def add_subparser(
+    subparsers: SubParsersAction, parents: List[argparse.ArgumentParser]
+) -> None:
+    """Add all training cache parsers.
+
+    Args:
+        subparsers: subparser we are going to attach to
+        parents: Parent parsers, needed to ensure tree structure in argparse
+    """
+    cache_parser = subparsers.add_parser(
+        "cache",
+        parents=parents,
+        help="Inspects and prunes the cache of training results.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+
+    cache_subparsers = cache_parser.add_subparsers()
+    cache_info_parser = cache_subparsers.add_parser(
+        "info",
+        parents=parents,
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+        help="Shows the number of cache entries and the size of the cache.",
+    )
+    cache_info_parser.set_defaults(func=show_cache_info)
+
+    cache_prune_parser = cache_subparsers.add_parser(
+        "prune",
+        parents=parents,
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+        help="Deletes the least recently used cached results and files in the "
+        "cache directory which the cache doesn't track.",
+    )
+    cache_prune_parser.add_argument(
+        "--max-size",
+        type=float,
+        default=None,
+        help=f"Size in MiB which the cached results may take up after pruning. "
+        f"Use `0` to delete all cached results. Defaults to the maximum cache size "
+        f"which is configured with the environment variable '{CACHE_SIZE_ENV}'.",
+    )
+    cache_prune_parser.set_defaults(func=prune_cache)
+    cache_parser.set_defaults(func=show_cache_info)
+
+
+def _create_cache(read_only: bool = False) -> LocalTrainingCache:
+    cache = LocalTrainingCache(read_only)
+    if cache.max_size_in_mb == 0:
+        rasa.shared.utils.cli.print_error_and_exit(
+            f"The cache is disabled as the environment variable '{CACHE_SIZE_ENV}' "
+            f"is set to 0."
+        )
+    return cache
+
+
+def show_cache_info(_: argparse.Namespace) -> None:
+    """Shows the number of cache entries and the size of the cache."""
+    cache = _create_cache(read_only=True)
+    statistics = cache.statistics()
+
+    rasa.shared.utils.cli.print_info(
+        f"Cache location: {cache.location}\n"
+        f"Cache entries: {statistics.number_of_entries}\n"
+        f"Cached results: {statistics.number_of_results}\n"
+        f"Size of cached results: {statistics.size_in_bytes / 1_048_576:.2f} MiB "
+        f"(maximum: {cache.max_size_in_mb:.2f} MiB)"
+    )
+
+
+def prune_cache(args: argparse.Namespace) -> None:
+    """Deletes the least recently used cached results."""
+    cache = _create_cache()
+    max_size: Optional[float] = args.max_size
+    if max_size is None:
+        max_size = cache.max_size_in_mb
+    elif max_size < 0:
+        rasa.shared.utils.cli.print_error_and_exit(
+            f"The maximum size has to be at least 0, but it is {max_size}."
+        )
+
+    number_of_deleted_results = cache.prune(max_size)
+
+    rasa.shared.utils.cli.print_success(
+        f"Deleted {number_of_deleted_results} cached results. The cached results "
+        f"take up {cache.statistics().size_in_bytes / 1_048_576:.2f} MiB now."
+    )
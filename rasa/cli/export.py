@@ -13,6 +13,7 @@ from rasa.cli.arguments import export as arguments
 from rasa.shared.constants import DOCS_URL_EVENT_BROKERS, DOCS_URL_TRACKER_STORES
 from rasa.exceptions import PublishingError
 from rasa.shared.exceptions import RasaException
+from rasa.core.brokers.kafka import KafkaEventBroker, QUEUE_FULL_POLICY_SPILL
 from rasa.core.brokers.pika import PikaEventBroker
 
 if typing.TYPE_CHECKING:
@@ -154,6 +155,9 @@ def _prepare_event_broker(event_broker: "EventBroker") -> None:
     the instance is launched as part of this short-lived export script, meaning the
     object is destroyed before it might be published.
 
+    A `KafkaEventBroker` spills events to disk instead of dropping them when its
+    queue is full, since the export publishes events faster than they are produced.
+
     In addition, wait until the event broker reports a `ready` state.
 
     """
@@ -161,6 +165,9 @@ def _prepare_event_broker(event_broker: "EventBroker") -> None:
         event_broker.should_keep_unpublished_messages = False
         event_broker.raise_on_failure = True
 
+    if isinstance(event_broker, KafkaEventBroker):
+        event_broker.queue_full_policy = QUEUE_FULL_POLICY_SPILL
+
     if not event_broker.is_ready():
         rasa.shared.utils.cli.print_error_and_exit(
             f"Event broker of type '{type(event_broker)}' is not ready. Exiting."
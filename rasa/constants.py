@@ -32,6 +32,15 @@ DEFAULT_SANIC_WORKERS = 1
 ENV_SANIC_WORKERS = "SANIC_WORKERS"
 ENV_SANIC_BACKLOG = "SANIC_BACKLOG"
 
+DEFAULT_MAX_PARSE_BATCH_SIZE = 64
+ENV_MAX_PARSE_BATCH_SIZE = "MAX_PARSE_BATCH_SIZE"
+
+DEFAULT_TRACKER_GENERATION_PROCESSES = 1
+ENV_TRACKER_GENERATION_PROCESSES = "TRACKER_GENERATION_PROCESSES"
+
+DEFAULT_MODEL_ARCHIVE_FORMAT = "tar.gz"
+ENV_MODEL_ARCHIVE_FORMAT = "MODEL_ARCHIVE_FORMAT"
+
 ENV_GPU_CONFIG = "TF_GPU_MEMORY_ALLOC"
 ENV_CPU_INTER_OP_CONFIG = "TF_INTER_OP_PARALLELISM_THREADS"
 ENV_CPU_INTRA_OP_CONFIG = "TF_INTRA_OP_PARALLELISM_THREADS"
@@ -1,6 +1,10 @@
 import copy
 import json
 import logging
+import uuid
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import (
     List,
     Text,
@@ -15,7 +19,14 @@ from typing import (
 
 import aiohttp
 import rasa.core
-from rasa.core.actions.constants import DEFAULT_SELECTIVE_DOMAIN, SELECTIVE_DOMAIN
+from rasa.core.actions.constants import (
+    DEFAULT_SELECTIVE_DOMAIN,
+    DEFAULT_TRACKER_EVENTS_DELTA,
+    MAX_TRACKED_TRACKER_REVISIONS,
+    SELECTIVE_DOMAIN,
+    TRACKER_EVENTS_DELTA,
+    TRACKER_REVISION_KEY,
+)
 from rasa.core.constants import (
     DEFAULT_REQUEST_TIMEOUT,
     COMPRESS_ACTION_SERVER_REQUEST_ENV_NAME,
@@ -81,6 +92,7 @@ from rasa.shared.nlu.constants import (
 )
 from rasa.shared.utils.schemas.events import EVENTS_SCHEMA
 import rasa.shared.utils.io
+from rasa.shared.utils.io import DEFAULT_ENCODING
 from rasa.utils.common import get_bool_env_variable
 from rasa.utils.endpoints import EndpointConfig, ClientResponseError
 
@@ -642,6 +654,66 @@ class ActionDeactivateLoop(Action):
         return [ActiveLoop(None), SlotSet(REQUESTED_SLOT, None)]
 
 
+@dataclass
+class SentTrackerRevision:
+    """Describes the events of a conversation which the action server received."""
+
+    revision: Text
+    number_of_events: int
+    latest_event_type: Optional[Text]
+    latest_event_timestamp: Optional[float]
+
+
+class SentTrackerRevisions:
+    """Remembers the tracker revisions which an action server received.
+
+    The revisions are kept for every action endpoint and dropped together with the
+    endpoint.
+    """
+
+    _revisions_by_endpoint: Dict[int, "SentTrackerRevisions"] = {}
+
+    def __init__(self) -> None:
+        """Creates an empty collection of revisions."""
+        self._revisions: "OrderedDict[Text, SentTrackerRevision]" = OrderedDict()
+
+    @classmethod
+    def of_endpoint(cls, action_endpoint: EndpointConfig) -> "SentTrackerRevisions":
+        """Returns the revisions which were sent to `action_endpoint`."""
+        # `EndpointConfig` isn't hashable, hence the endpoints are identified by
+        # their `id` as long as they are alive
+        key = id(action_endpoint)
+        if key not in cls._revisions_by_endpoint:
+            cls._revisions_by_endpoint[key] = cls()
+            weakref.finalize(action_endpoint, cls._forget_endpoint, key)
+
+        return cls._revisions_by_endpoint[key]
+
+    @classmethod
+    def _forget_endpoint(cls, key: int) -> None:
+        cls._revisions_by_endpoint.pop(key, None)
+
+    def get(self, sender_id: Text) -> Optional[SentTrackerRevision]:
+        """Returns the revision which was sent for a conversation."""
+        return self._revisions.get(sender_id)
+
+    def remember(self, sender_id: Text, revision: SentTrackerRevision) -> None:
+        """Stores the revision which was sent for a conversation.
+
+        Only the revisions of the `MAX_TRACKED_TRACKER_REVISIONS` most recently
+        active conversations are kept.
+        """
+        self._revisions[sender_id] = revision
+        self._revisions.move_to_end(sender_id)
+
+        while len(self._revisions) > MAX_TRACKED_TRACKER_REVISIONS:
+            self._revisions.popitem(last=False)
+
+    def __len__(self) -> int:
+        """Returns the number of conversations with a known revision."""
+        return len(self._revisions)
+
+
 class RemoteAction(Action):
     def __init__(self, name: Text, action_endpoint: Optional[EndpointConfig]) -> None:
 
@@ -652,19 +724,31 @@ class RemoteAction(Action):
         self,
         tracker: "DialogueStateTracker",
         domain: "Domain",
+        send_all_events: bool = False,
     ) -> Dict[Text, Any]:
-        """Create the request json send to the action server."""
-        from rasa.shared.core.trackers import EventVerbosity
+        """Create the request json send to the action server.
 
-        tracker_state = tracker.current_state(EventVerbosity.ALL)
+        Args:
+            tracker: The tracker of the conversation.
+            domain: The model's domain.
+            send_all_events: If `True`, all events are sent even if the action
+                server already received some of them.
+        """
+        from rasa.shared.core.trackers import EventVerbosity
 
-        result = {
+        result: Dict[Text, Any] = {
             "next_action": self._name,
             "sender_id": tracker.sender_id,
-            "tracker": tracker_state,
             "version": rasa.__version__,
         }
 
+        if self._is_tracker_events_delta_enabled():
+            result["tracker"], result[TRACKER_REVISION_KEY] = self._tracker_delta(
+                tracker, send_all_events
+            )
+        else:
+            result["tracker"] = tracker.current_state(EventVerbosity.ALL)
+
         if (
             not self._is_selective_domain_enabled()
             or domain.does_custom_action_explicitly_need_domain(self.name())
@@ -673,6 +757,143 @@ class RemoteAction(Action):
 
         return result
 
+    def _tracker_delta(
+        self, tracker: "DialogueStateTracker", send_all_events: bool
+    ) -> Tuple[Dict[Text, Any], Dict[Text, Any]]:
+        """Returns the tracker state with the events the action server doesn't know.
+
+        Args:
+            tracker: The tracker of the conversation.
+            send_all_events: If `True`, all events are included.
+
+        Returns:
+            The tracker state and the revision of the tracker. The revision
+            contains the revision which the events are based on (`base`) and the
+            number of events which were omitted from the tracker state.
+        """
+        from rasa.shared.core.trackers import EventVerbosity
+
+        tracker_state = tracker.current_state(EventVerbosity.NONE)
+        events = list(tracker.events)
+
+        sent_revision = (
+            None if send_all_events else self._sent_revision(events, tracker)
+        )
+        number_of_sent_events = sent_revision.number_of_events if sent_revision else 0
+
+        tracker_state["events"] = [
+            event.as_dict() for event in events[number_of_sent_events:]
+        ]
+        tracker_revision = {
+            "base": sent_revision.revision if sent_revision else None,
+            "revision": uuid.uuid4().hex,
+            "number_of_previous_events": number_of_sent_events,
+        }
+
+        return tracker_state, tracker_revision
+
+    def _sent_revision(
+        self, events: List[Event], tracker: "DialogueStateTracker"
+    ) -> Optional[SentTrackerRevision]:
+        """Returns the revision of the tracker which the action server received.
+
+        `None` is returned if the events of the tracker don't start with the
+        events which were sent, e.g. because the tracker was restored from a
+        different conversation session or old events were dropped from its history.
+        """
+        if self.action_endpoint is None:
+            return None
+
+        sent_revisions = SentTrackerRevisions.of_endpoint(self.action_endpoint)
+        sent_revision = sent_revisions.get(tracker.sender_id)
+        if (
+            not sent_revision
+            or tracker.events.maxlen is not None
+            or sent_revision.number_of_events > len(events)
+        ):
+            return None
+
+        if sent_revision.number_of_events == 0:
+            return sent_revision
+
+        latest_sent_event = events[sent_revision.number_of_events - 1]
+        if (
+            latest_sent_event.type_name != sent_revision.latest_event_type
+            or latest_sent_event.timestamp != sent_revision.latest_event_timestamp
+        ):
+            return None
+
+        return sent_revision
+
+    def _remember_sent_revision(
+        self, tracker: "DialogueStateTracker", json_body: Dict[Text, Any]
+    ) -> None:
+        """Stores which events the action server received."""
+        if TRACKER_REVISION_KEY not in json_body or self.action_endpoint is None:
+            return
+
+        latest_event = tracker.events[-1] if tracker.events else None
+        SentTrackerRevisions.of_endpoint(self.action_endpoint).remember(
+            tracker.sender_id,
+            SentTrackerRevision(
+                json_body[TRACKER_REVISION_KEY]["revision"],
+                len(tracker.events),
+                latest_event.type_name if latest_event else None,
+                latest_event.timestamp if latest_event else None,
+            ),
+        )
+
+    def _is_tracker_events_delta_enabled(self) -> bool:
+        if self.action_endpoint is None:
+            return False
+        return bool(
+            self.action_endpoint.kwargs.get(
+                TRACKER_EVENTS_DELTA, DEFAULT_TRACKER_EVENTS_DELTA
+            )
+        )
+
+    async def _request(
+        self,
+        action_endpoint: EndpointConfig,
+        json_body: Dict[Text, Any],
+        domain: "Domain",
+        compress: bool,
+    ) -> Any:
+        """Sends the request to run the action to the action server."""
+        modified_json = plugin_manager().hook.prefix_stripping_for_custom_actions(
+            json_body=json_body
+        )
+        if modified_json:
+            request_body: Dict[Text, Any] = {"json": modified_json}
+        else:
+            request_body = {"data": self._serialised_request_body(json_body, domain)}
+
+        response: Any = await action_endpoint.request(
+            method="post",
+            timeout=DEFAULT_REQUEST_TIMEOUT,
+            compress=compress,
+            **request_body,
+        )
+        if modified_json:
+            plugin_manager().hook.prefixing_custom_actions_response(
+                json_body=json_body, response=response
+            )
+
+        return response
+
+    @staticmethod
+    def _serialised_request_body(json_body: Dict[Text, Any], domain: "Domain") -> bytes:
+        """Serialises the request using the cached JSON of the domain."""
+        if json_body.get("domain") is not domain.as_dict():
+            return json.dumps(json_body).encode(DEFAULT_ENCODING)
+
+        body_without_domain = json.dumps(
+            {key: value for key, value in json_body.items() if key != "domain"}
+        )
+        return f'{body_without_domain[:-1]}, "domain": {domain.json_data}}}'.encode(
+            DEFAULT_ENCODING
+        )
+
     def _is_selective_domain_enabled(self) -> bool:
         if self.action_endpoint is None:
             return False
@@ -774,19 +995,28 @@ class RemoteAction(Action):
                 DEFAULT_COMPRESS_ACTION_SERVER_REQUEST,
             )
 
-            modified_json = plugin_manager().hook.prefix_stripping_for_custom_actions(
-                json_body=json_body
-            )
-            response: Any = await self.action_endpoint.request(
-                json=modified_json if modified_json else json_body,
-                method="post",
-                timeout=DEFAULT_REQUEST_TIMEOUT,
-                compress=should_compress,
-            )
-            if modified_json:
-                plugin_manager().hook.prefixing_custom_actions_response(
-                    json_body=json_body, response=response
+            try:
+                response = await self._request(
+                    self.action_endpoint, json_body, domain, should_compress
                 )
+            except ClientResponseError as e:
+                if e.status != 409 or not json_body.get(TRACKER_REVISION_KEY, {}).get(
+                    "base"
+                ):
+                    raise
+                # the action server doesn't know the events the delta is based on
+                logger.debug(
+                    f"Action server doesn't know the revision of the tracker for "
+                    f"conversation '{tracker.sender_id}'. Sending all events."
+                )
+                json_body = self._action_call_format(
+                    tracker, domain, send_all_events=True
+                )
+                response = await self._request(
+                    self.action_endpoint, json_body, domain, should_compress
+                )
+
+            self._remember_sent_revision(tracker, json_body)
             self._validate_action_result(response)
 
             events_json = response.get("events", [])
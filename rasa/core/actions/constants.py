@@ -1,2 +1,8 @@
 DEFAULT_SELECTIVE_DOMAIN = False
 SELECTIVE_DOMAIN = "enable_selective_domain"
+
+DEFAULT_TRACKER_EVENTS_DELTA = False
+TRACKER_EVENTS_DELTA = "enable_tracker_events_delta"
+TRACKER_REVISION_KEY = "tracker_revision"
+# number of conversations for which the events sent to the action server are tracked
+MAX_TRACKED_TRACKER_REVISIONS = 10000
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import asyncio
 from asyncio import AbstractEventLoop, CancelledError
 import functools
 import logging
@@ -12,7 +13,10 @@ from aiohttp import ClientError
 
 from rasa.core import jobs
 from rasa.core.channels.channel import OutputChannel, UserMessage
-from rasa.core.constants import DEFAULT_REQUEST_TIMEOUT
+from rasa.core.constants import (
+    DEFAULT_MODEL_DOWNLOAD_CHUNK_SIZE,
+    DEFAULT_REQUEST_TIMEOUT,
+)
 from rasa.core.http_interpreter import RasaNLUHttpInterpreter
 from rasa.shared.core.domain import Domain
 from rasa.core.exceptions import AgentNotReady
@@ -55,18 +59,25 @@ async def load_from_server(agent: Agent, model_server: EndpointConfig) -> Agent:
     return agent
 
 
-def _load_and_set_updated_model(
+async def _load_and_set_updated_model(
     agent: Agent, model_directory: Text, fingerprint: Text
 ) -> None:
     """Load the persisted model into memory and set the model on the agent.
 
+    The model is loaded and warmed up in a background thread. The agent keeps
+    handling messages with its previous model until the new one is ready.
+
     Args:
         agent: Instance of `Agent` to update with the new model.
         model_directory: Rasa model directory.
         fingerprint: Fingerprint of the supplied model at `model_directory`.
     """
     logger.debug(f"Found new model with fingerprint {fingerprint}. Loading...")
-    agent.load_model(model_directory, fingerprint)
+    loop = asyncio.get_running_loop()
+    processor = await loop.run_in_executor(
+        None, functools.partial(agent.create_processor, model_directory, True)
+    )
+    agent.set_processor(processor, fingerprint)
 
     logger.debug("Finished updating agent to new model.")
 
@@ -83,7 +94,9 @@ async def _update_model_from_server(model_server: EndpointConfig, agent: Agent)
             )
 
             if new_fingerprint:
-                _load_and_set_updated_model(agent, temporary_directory, new_fingerprint)
+                await _load_and_set_updated_model(
+                    agent, temporary_directory, new_fingerprint
+                )
             else:
                 logger.debug(f"No new model found at URL {model_server.url}")
         except Exception:  # skipcq: PYL-W0703
@@ -112,59 +125,62 @@ async def _pull_model_and_fingerprint(
 
     logger.debug(f"Requesting model from server {model_server.url}...")
 
-    async with model_server.session() as session:
-        try:
-            params = model_server.combine_parameters()
-            async with session.request(
-                "GET",
-                model_server.url,
-                timeout=DEFAULT_REQUEST_TIMEOUT,
-                headers=headers,
-                params=params,
-            ) as resp:
-
-                if resp.status in [204, 304]:
-                    logger.debug(
-                        "Model server returned {} status code, "
-                        "indicating that no new model is available. "
-                        "Current fingerprint: {}"
-                        "".format(resp.status, fingerprint)
-                    )
-                    return None
-                elif resp.status == 404:
-                    logger.debug(
-                        "Model server could not find a model at the requested "
-                        "endpoint '{}'. It's possible that no model has been "
-                        "trained, or that the requested tag hasn't been "
-                        "assigned.".format(model_server.url)
-                    )
-                    return None
-                elif resp.status != 200:
-                    logger.debug(
-                        "Tried to fetch model from server, but server response "
-                        "status code is {}. We'll retry later..."
-                        "".format(resp.status)
-                    )
-                    return None
-
-                model_path = Path(model_directory) / resp.headers.get(
-                    "filename", "model.tar.gz"
+    session = model_server.pooled_session()
+    try:
+        params = model_server.combine_parameters()
+        async with session.request(
+            "GET",
+            model_server.url,
+            timeout=DEFAULT_REQUEST_TIMEOUT,
+            headers=headers,
+            params=params,
+        ) as resp:
+
+            if resp.status in [204, 304]:
+                logger.debug(
+                    "Model server returned {} status code, "
+                    "indicating that no new model is available. "
+                    "Current fingerprint: {}"
+                    "".format(resp.status, fingerprint)
                 )
-                with open(model_path, "wb") as file:
-                    file.write(await resp.read())
-
-                logger.debug("Saved model to '{}'".format(os.path.abspath(model_path)))
-
-                # return the new fingerprint
-                return resp.headers.get("ETag")
+                return None
+            elif resp.status == 404:
+                logger.debug(
+                    "Model server could not find a model at the requested "
+                    "endpoint '{}'. It's possible that no model has been "
+                    "trained, or that the requested tag hasn't been "
+                    "assigned.".format(model_server.url)
+                )
+                return None
+            elif resp.status != 200:
+                logger.debug(
+                    "Tried to fetch model from server, but server response "
+                    "status code is {}. We'll retry later..."
+                    "".format(resp.status)
+                )
+                return None
 
-        except aiohttp.ClientError as e:
-            logger.debug(
-                "Tried to fetch model from server, but "
-                "couldn't reach server. We'll retry later... "
-                "Error: {}.".format(e)
+            model_path = Path(model_directory) / resp.headers.get(
+                "filename", "model.tar.gz"
             )
-            return None
+            with open(model_path, "wb") as file:
+                async for chunk in resp.content.iter_chunked(
+                    DEFAULT_MODEL_DOWNLOAD_CHUNK_SIZE
+                ):
+                    file.write(chunk)
+
+            logger.debug("Saved model to '{}'".format(os.path.abspath(model_path)))
+
+            # return the new fingerprint
+            return resp.headers.get("ETag")
+
+    except aiohttp.ClientError as e:
+        logger.debug(
+            "Tried to fetch model from server, but "
+            "couldn't reach server. We'll retry later... "
+            "Error: {}.".format(e)
+        )
+        return None
 
 
 async def _run_model_pulling_worker(model_server: EndpointConfig, agent: Agent) -> None:
@@ -349,7 +365,22 @@ class Agent:
         self, model_path: Union[Text, Path], fingerprint: Optional[Text] = None
     ) -> None:
         """Loads the agent's model and processor given a new model path."""
-        self.processor = MessageProcessor(
+        self.set_processor(self.create_processor(model_path), fingerprint)
+
+    def create_processor(
+        self, model_path: Union[Text, Path], warm_up: bool = False
+    ) -> MessageProcessor:
+        """Creates a processor for a model without setting it on the agent.
+
+        Args:
+            model_path: Path to the model.
+            warm_up: If `True`, run the model once so that it is ready to handle
+                messages right away.
+
+        Returns:
+            The processor.
+        """
+        processor = MessageProcessor(
             model_path=model_path,
             tracker_store=self.tracker_store,
             lock_store=self.lock_store,
@@ -357,6 +388,27 @@ class Agent:
             generator=self.nlg,
             http_interpreter=self.http_interpreter,
         )
+        if warm_up:
+            processor.warm_up()
+
+        return processor
+
+    def set_processor(
+        self, processor: MessageProcessor, fingerprint: Optional[Text] = None
+    ) -> None:
+        """Replaces the agent's processor and updates the agent's domain.
+
+        Args:
+            processor: The new processor.
+            fingerprint: Fingerprint of the processor's model.
+        """
+        previous_processor = self.processor
+        self.processor = processor
+        if previous_processor is not None:
+            # conversations which are still handled by the previous processor
+            # keep using its executor until they are done
+            previous_processor.inference_executor.retire()
+
         self.domain = self.processor.domain
 
         self._set_fingerprint(fingerprint)
@@ -407,6 +459,22 @@ class Agent:
 
         return await self.processor.parse_message(message)  # type: ignore[union-attr]
 
+    @agent_must_be_ready
+    async def parse_messages(self, messages: List[Text]) -> List[Dict[Text, Any]]:
+        """Parses a batch of texts with a single run of the NLU pipeline.
+
+        Args:
+            messages: Texts or intent payloads to parse.
+
+        Returns:
+            The parsed messages in the order of `messages`.
+        """
+        user_messages = [UserMessage(message_data) for message_data in messages]
+
+        return await self.processor.parse_messages(  # type: ignore[union-attr]
+            user_messages
+        )
+
     async def handle_message(
         self, message: UserMessage
     ) -> Optional[List[Dict[Text, Any]]]:
@@ -534,6 +602,13 @@ class Agent:
 
         return InMemoryLockStore()
 
+    async def close_endpoint_sessions(self) -> None:
+        """Closes the pooled HTTP sessions of the agent's endpoints."""
+        nlg_endpoint = getattr(self.nlg, "nlg_endpoint", None)
+        for endpoint in [self.action_endpoint, self.model_server, nlg_endpoint]:
+            if endpoint is not None:
+                await endpoint.close()
+
     def load_model_from_remote_storage(self, model_name: Text) -> None:
         """Loads an Agent from remote storage."""
         from rasa.nlu.persistor import get_persistor
@@ -1,7 +1,7 @@
 from __future__ import annotations
 import logging
 from asyncio import AbstractEventLoop
-from typing import Any, Dict, Text, Optional, Union, TypeVar, Type
+from typing import Any, Dict, List, Text, Optional, Union, TypeVar, Type
 
 import aiormq
 
@@ -64,6 +64,19 @@ class EventBroker:
         """Publishes a json-formatted Rasa Core event into an event queue."""
         raise NotImplementedError("Event broker must implement the `publish` method.")
 
+    def publish_many(self, events: List[Dict[Text, Any]]) -> None:
+        """Publishes multiple json-formatted Rasa Core events into an event queue.
+
+        Event brokers which can publish several events in one round trip should
+        override this method. The default implementation publishes the events one
+        by one.
+
+        Args:
+            events: The serialised events in the order they should be published.
+        """
+        for event in events:
+            self.publish(event)
+
     def is_ready(self) -> bool:
         """Determine whether or not the event broker is ready.
 
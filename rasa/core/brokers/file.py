@@ -2,7 +2,7 @@ import json
 import logging
 import typing
 from asyncio import AbstractEventLoop
-from typing import Optional, Text, Dict
+from typing import Any, Dict, List, Optional, Text
 
 from rasa.core.brokers.broker import EventBroker
 
@@ -15,7 +15,8 @@ logger = logging.getLogger(__name__)
 class FileEventBroker(EventBroker):
     """Log events to a file in json format.
 
-    There will be one event per line and each event is stored as json."""
+    There will be one event per line and each event is stored as json.
+    """
 
     DEFAULT_LOG_FILE_NAME = "rasa_event.log"
 
@@ -38,7 +39,6 @@ class FileEventBroker(EventBroker):
 
     def _event_logger(self) -> logging.Logger:
         """Instantiate the file logger."""
-
         logger_file = self.path
         # noinspection PyTypeChecker
         query_logger = logging.getLogger("event-logger")
@@ -54,6 +54,12 @@ class FileEventBroker(EventBroker):
 
     def publish(self, event: Dict) -> None:
         """Write event to file."""
+        self.publish_many([event])
+
+    def publish_many(self, events: List[Dict[Text, Any]]) -> None:
+        """Write events to file with a single write."""
+        if not events:
+            return
 
-        self.event_logger.info(json.dumps(event))
+        self.event_logger.info("\n".join(json.dumps(event) for event in events))
         self.event_logger.handlers[0].flush()
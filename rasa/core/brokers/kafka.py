@@ -1,10 +1,13 @@
 import asyncio
+import dataclasses
 import os
 import json
 import logging
 import structlog
+import tempfile
 import threading
 from asyncio import AbstractEventLoop
+from dataclasses import dataclass
 from typing import Any, Text, List, Optional, Union, Dict, TYPE_CHECKING
 import time
 
@@ -20,6 +23,29 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 structlogger = structlog.get_logger()
 
+DEFAULT_PUBLISH_QUEUE_SIZE = 10000
+DEFAULT_PUBLISH_BATCH_SIZE = 100
+
+QUEUE_FULL_POLICY_DROP = "drop"
+QUEUE_FULL_POLICY_SPILL = "spill"
+QUEUE_FULL_POLICIES = [QUEUE_FULL_POLICY_DROP, QUEUE_FULL_POLICY_SPILL]
+
+
+@dataclass
+class KafkaPublishMetrics:
+    """Metrics about the queue of events which are waiting to be published."""
+
+    queue_size: int = 0
+    max_queue_size: int = 0
+    number_of_published_events: int = 0
+    number_of_failed_events: int = 0
+    number_of_dropped_events: int = 0
+    number_of_spilled_events: int = 0
+
+    def as_dict(self) -> Dict[Text, Any]:
+        """Returns the metrics as dictionary."""
+        return dataclasses.asdict(self)
+
 
 class KafkaEventBroker(EventBroker):
     """Kafka event broker."""
@@ -38,6 +64,12 @@ class KafkaEventBroker(EventBroker):
         ssl_keyfile: Optional[Text] = None,
         ssl_check_hostname: bool = False,
         security_protocol: Text = "SASL_PLAINTEXT",
+        retries: int = 60,
+        retry_delay_in_seconds: float = 5,
+        publish_queue_size: int = DEFAULT_PUBLISH_QUEUE_SIZE,
+        publish_batch_size: int = DEFAULT_PUBLISH_BATCH_SIZE,
+        queue_full_policy: Text = QUEUE_FULL_POLICY_DROP,
+        spill_path: Optional[Text] = None,
         **kwargs: Any,
     ) -> None:
         """Kafka event broker.
@@ -71,7 +103,28 @@ class KafkaEventBroker(EventBroker):
                 should verify that the certificate matches the broker's hostname.
             security_protocol: Protocol used to communicate with brokers.
                 Valid values are: PLAINTEXT, SSL, SASL_PLAINTEXT, SASL_SSL.
+            retries: Number of attempts to publish a batch of events before the
+                events are given up.
+            retry_delay_in_seconds: Time in seconds between two attempts to
+                publish events.
+            publish_queue_size: Maximum number of events which are waiting to be
+                published.
+            publish_batch_size: Maximum number of events which are produced in one
+                go by the background task.
+            queue_full_policy: What to do with events which are published while the
+                queue is full. `drop` discards them, `spill` writes them to
+                `spill_path` so that they are published once the queue has room
+                again.
+            spill_path: File which events are spilled to. A temporary file is used
+                if `None`.
         """
+        if queue_full_policy not in QUEUE_FULL_POLICIES:
+            raise ValueError(
+                f"Cannot initialise `KafkaEventBroker`: Invalid `queue_full_policy` "
+                f"('{queue_full_policy}'). Valid values are: "
+                f"{', '.join(QUEUE_FULL_POLICIES)}."
+            )
+
         self.producer: Optional[Producer] = None
         self.url = url
         self.topic = topic
@@ -86,13 +139,29 @@ class KafkaEventBroker(EventBroker):
         self.ssl_keyfile = ssl_keyfile
         self.queue_size = kwargs.get("queue_size")
         self.ssl_check_hostname = "https" if ssl_check_hostname else None
+        self.retries = max(retries, 1)
+        self.retry_delay_in_seconds = retry_delay_in_seconds
+        self.publish_queue_size = publish_queue_size
+        self.publish_batch_size = max(publish_batch_size, 1)
+        self.queue_full_policy = queue_full_policy
+        self.spill_path = spill_path
+        self.metrics = KafkaPublishMetrics()
 
         # Async producer implementation followed from confluent-kafka asyncio example:
         # https://github.com/confluentinc/confluent-kafka-python/blob/master/examples/asyncio_example.py#L88  # noqa: E501
         self._loop = asyncio.get_event_loop()
         self._cancelled = False
-        self._poll_thread = threading.Thread(target=self._poll_loop)
-        self._poll_thread.start()
+        self._poll_thread: Optional[threading.Thread] = None
+        self._is_connected = False
+
+        # events are published by a background task so that `publish` never blocks
+        # the event loop, e.g. while Kafka is unavailable
+        self._queue: Optional[asyncio.Queue] = None
+        self._publish_task: Optional[asyncio.Task] = None
+        self._is_queue_full = False
+        self._last_batch_failed = False
+        # position in the spill file of the first event which wasn't queued yet
+        self._spill_offset = 0
 
     @classmethod
     async def from_endpoint_config(
@@ -106,58 +175,212 @@ class KafkaEventBroker(EventBroker):
 
         return cls(broker_config.url, **broker_config.kwargs)
 
-    def publish(
-        self,
-        event: Dict[Text, Any],
-        retries: int = 60,
-        retry_delay_in_seconds: float = 5,
-    ) -> None:
-        """Publishes events."""
-        from confluent_kafka import KafkaException
+    def publish(self, event: Dict[Text, Any]) -> None:
+        """Queues `event` for publishing.
 
-        if retries == 1:
-            retries = 2
+        The event is produced to Kafka by a background task. If the queue of
+        events is full, the event is handled according to `queue_full_policy`.
 
-        if self.producer is None:
-            self.producer = self._create_producer()
+        Args:
+            event: Serialised event to be published.
+        """
+        self.publish_many([event])
+
+    def publish_many(self, events: List[Dict[Text, Any]]) -> None:
+        """Queues `events` for publishing.
+
+        The background task produces the queued events in batches.
+
+        Args:
+            events: Serialised events to be published.
+        """
+        queue = self._ensure_publish_task()
+
+        if self._has_spilled_events():
+            # spilled events have to be published before newer events
+            self._spill(events)
+            return
+
+        for index, event in enumerate(events):
             try:
-                self._check_kafka_connection()
-                logger.debug("Connection to kafka successful.")
-            except KafkaException:
-                logger.debug("Failed to connect kafka.")
-                return
-        while retries:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                self._on_queue_full(events[index:])
+                break
+
+        self._update_queue_size_metrics()
+
+    def _ensure_publish_task(self) -> asyncio.Queue:
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.publish_queue_size)
+
+        if self._publish_task is None or self._publish_task.done():
+            # We need to save a reference to this background task to
+            # make sure it doesn't disappear. See:
+            # https://docs.python.org/3/library/asyncio-task.html#asyncio.create_task
+            self._publish_task = self._loop.create_task(
+                self._run_publish_loop(self._queue)
+            )
+
+        return self._queue
+
+    def _update_queue_size_metrics(self) -> None:
+        queue_size = self._queue.qsize() if self._queue else 0
+        self.metrics.queue_size = queue_size
+        self.metrics.max_queue_size = max(self.metrics.max_queue_size, queue_size)
+
+    def _on_queue_full(self, events: List[Dict[Text, Any]]) -> None:
+        if not self._is_queue_full:
+            self._is_queue_full = True
+            logger.warning(
+                f"The queue of events which are waiting to be published to Kafka "
+                f"is full ({self.publish_queue_size} events). Events are handled "
+                f"according to the '{self.queue_full_policy}' policy until the "
+                f"queue has room again."
+            )
+
+        if self.queue_full_policy == QUEUE_FULL_POLICY_SPILL:
+            self._spill(events)
+        else:
+            self.metrics.number_of_dropped_events += len(events)
+
+    def _spill(self, events: List[Dict[Text, Any]]) -> None:
+        """Appends `events` to the spill file."""
+        if self.spill_path is None:
+            file_descriptor, self.spill_path = tempfile.mkstemp(
+                prefix="rasa-kafka-", suffix=".jsonl"
+            )
+            os.close(file_descriptor)
+
+        with open(self.spill_path, "a", encoding=DEFAULT_ENCODING) as file:
+            for event in events:
+                file.write(json.dumps(event) + "\n")
+
+        self.metrics.number_of_spilled_events += len(events)
+
+    def _has_spilled_events(self) -> bool:
+        return (
+            self.spill_path is not None
+            and os.path.exists(self.spill_path)
+            and os.path.getsize(self.spill_path) > self._spill_offset
+        )
+
+    def _refill_from_spill_file(self) -> None:
+        """Moves as many spilled events to the queue as it has room for.
+
+        The spill file is only read from the position of the first event which
+        wasn't queued yet and emptied once all of its events were queued.
+        """
+        if self._queue is None or not self._has_spilled_events():
+            return
+
+        with open(self.spill_path, "rb") as file:
+            file.seek(self._spill_offset)
+            while not self._queue.full():
+                line = file.readline()
+                if not line:
+                    break
+                self._queue.put_nowait(json.loads(line.decode(DEFAULT_ENCODING)))
+            self._spill_offset = file.tell()
+
+        if not self._has_spilled_events():
+            open(self.spill_path, "w").close()
+            self._spill_offset = 0
+
+        self._update_queue_size_metrics()
+
+    async def _run_publish_loop(self, queue: asyncio.Queue) -> None:
+        """Produces the events of `queue` in batches."""
+        while True:
+            if queue.empty():
+                self._is_queue_full = False
+                self._refill_from_spill_file()
+
+            events = [await queue.get()]
+            while len(events) < self.publish_batch_size and not queue.empty():
+                events.append(queue.get_nowait())
+            self._update_queue_size_metrics()
+
             try:
-                self._publish(event)
-                return
+                await self._publish_batch(events)
+            except Exception as e:
+                logger.error(f"Failed to publish Kafka events. Error: {e}")
+                self.metrics.number_of_failed_events += len(events)
+                self._last_batch_failed = True
+            finally:
+                for _ in events:
+                    queue.task_done()
+
+    async def _publish_batch(self, events: List[Dict[Text, Any]]) -> None:
+        """Produces `events` and retries without blocking the event loop."""
+        retries = self.retries
+        while events and retries:
+            if not await self._ensure_connected():
+                retries -= 1
+                await asyncio.sleep(self.retry_delay_in_seconds)
+                continue
+
+            number_of_produced_events = 0
+            try:
+                for event in events:
+                    self._publish(event)
+                    number_of_produced_events += 1
             except BufferError as e:
-                logger.error(
+                logger.debug(
                     f"Could not publish message to kafka url '{self.url}'. "
                     f"Failed with error: {e}"
                 )
-                self.producer.poll(1)
+                # wait until the producer delivered some messages of its queue
+                if self.producer is not None:
+                    await self._loop.run_in_executor(None, self.producer.poll, 1)
                 retries -= 1
             except Exception as e:
                 logger.error(
                     f"Could not publish message to kafka url '{self.url}'. "
                     f"Failed with error: {e}"
                 )
-                try:
-                    self._check_kafka_connection()
-                except KafkaException:
-                    logger.debug("Connection to kafka lost, reconnecting...")
-                    self.producer = self._create_producer()
-                    try:
-                        self._check_kafka_connection()
-                        logger.debug("Reconnection to kafka successful")
-                        self._publish(event)
-                        return
-                    except KafkaException:
-                        pass
+                self._is_connected = False
                 retries -= 1
-                time.sleep(retry_delay_in_seconds)
+                await asyncio.sleep(self.retry_delay_in_seconds)
+
+            self.metrics.number_of_published_events += number_of_produced_events
+            events = events[number_of_produced_events:]
+
+        self._last_batch_failed = bool(events)
+        if not events:
+            return
+
+        logger.error(f"Failed to publish {len(events)} Kafka event(s).")
+        if self.queue_full_policy == QUEUE_FULL_POLICY_SPILL:
+            self._spill(events)
+        else:
+            self.metrics.number_of_failed_events += len(events)
+
+    async def _ensure_connected(self) -> bool:
+        """Creates the producer and verifies its connection if required.
+
+        Returns:
+            `True` if the producer is connected to Kafka.
+        """
+        from confluent_kafka import KafkaException
 
-        logger.error("Failed to publish Kafka event.")
+        if self.producer is None:
+            self.producer = self._create_producer()
+            self._start_poll_thread()
+
+        if self._is_connected:
+            return True
+
+        try:
+            await self._loop.run_in_executor(None, self._check_kafka_connection)
+        except KafkaException:
+            logger.debug("Failed to connect kafka, reconnecting...")
+            self.producer = self._create_producer()
+            return False
+
+        logger.debug("Connection to kafka successful.")
+        self._is_connected = True
+        return True
 
     def _check_kafka_connection(self) -> None:
         """Verifies connection with Kafka.
@@ -261,24 +484,61 @@ class KafkaEventBroker(EventBroker):
             )
 
     async def close(self) -> None:
+        """Publishes the queued events and closes the producer."""
+        if self._publish_task is not None and self._queue is not None:
+            await self._wait_for_queued_events(self._publish_task, self._queue)
+            self._publish_task.cancel()
+
         self._cancelled = True
-        self._poll_thread.join()
+        if self._poll_thread is not None:
+            await self._loop.run_in_executor(None, self._poll_thread.join)
         if self.producer:
-            self.producer.flush()
+            await self._loop.run_in_executor(None, self.producer.flush)
+
+    async def _wait_for_queued_events(
+        self, publish_task: asyncio.Task, queue: asyncio.Queue
+    ) -> None:
+        """Waits until the queued and spilled events were published.
+
+        Spilled events are not waited for if Kafka is unavailable.
+        """
+        while not publish_task.done():
+            queue_joined = asyncio.ensure_future(queue.join())
+            await asyncio.wait(
+                {queue_joined, publish_task},
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if not queue_joined.done():
+                queue_joined.cancel()
+                return
+
+            if self._last_batch_failed or not self._has_spilled_events():
+                return
+
+            self._refill_from_spill_file()
 
     @rasa.shared.utils.common.lazy_property
     def rasa_environment(self) -> Optional[Text]:
         """Get value of the `RASA_ENVIRONMENT` environment variable."""
         return os.environ.get("RASA_ENVIRONMENT", "RASA_ENVIRONMENT_NOT_SET")
 
+    def _start_poll_thread(self) -> None:
+        if self._poll_thread is None:
+            self._poll_thread = threading.Thread(target=self._poll_loop, daemon=True)
+            self._poll_thread.start()
+
     def _poll_loop(self) -> None:
         """Polls the producer for events.
 
         Required to trigger the on_delivery callback passed to produce method.
         """
-        if self.producer is not None:
-            while not self._cancelled:
-                self.producer.poll(0.1)
+        while not self._cancelled:
+            # the producer is replaced when the connection to Kafka is lost
+            producer = self.producer
+            if producer is not None:
+                producer.poll(0.1)
+            else:
+                time.sleep(0.1)
 
 
 def kafka_error_callback(err: "KafkaError") -> None:
@@ -291,6 +291,33 @@ class PikaEventBroker(EventBroker):
         self._background_tasks.add(task)
         task.add_done_callback(self._background_tasks.discard)
 
+    def publish_many(
+        self,
+        events: List[Dict[Text, Any]],
+        headers: Optional[Dict[Text, Text]] = None,
+    ) -> None:
+        """Publishes `events` to Pika queues using a single background task.
+
+        Args:
+            events: Serialised events to be published.
+            headers: Message headers to append to the published messages.
+        """
+        if not events:
+            return
+
+        task: asyncio.Task = self._loop.create_task(self._publish_many(events, headers))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _publish_many(
+        self,
+        events: List[Dict[Text, Any]],
+        headers: Optional[Dict[Text, Text]] = None,
+    ) -> None:
+        # the messages are sent in order and their confirmations are awaited
+        # together instead of one after another
+        await asyncio.gather(*[self._publish(event, headers) for event in events])
+
     async def _publish(
         self, event: Dict[Text, Any], headers: Optional[Dict[Text, Text]] = None
     ) -> None:
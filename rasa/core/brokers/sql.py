@@ -1,8 +1,11 @@
+import asyncio
 import contextlib
 import json
 import logging
+import zlib
 from asyncio import AbstractEventLoop
-from typing import Any, Dict, Optional, Text, Generator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Set, Text, Generator
 
 from sqlalchemy.orm import Session
 from sqlalchemy.ext.declarative import declarative_base, DeclarativeMeta
@@ -18,8 +21,14 @@ logger = logging.getLogger(__name__)
 class SQLEventBroker(EventBroker):
     """Save events into an SQL database.
 
-    All events will be stored in a table called `events`.
+    All events will be stored in a table called `events`. The inserts run on
+    worker threads so that publishing doesn't block the event loop. Events of the
+    same conversation are always written by the same thread to keep their order.
 
+    Events can optionally be buffered in memory and written in one multi-row insert
+    once `buffer_size` events were published or the oldest buffered event is
+    `flush_interval_in_seconds` old. Buffered events are lost if the process
+    crashes before they were written.
     """
 
     Base: DeclarativeMeta = declarative_base()
@@ -40,9 +49,33 @@ class SQLEventBroker(EventBroker):
         db: Text = "events.db",
         username: Optional[Text] = None,
         password: Optional[Text] = None,
+        pool_size: Optional[int] = None,
+        max_overflow: Optional[int] = None,
+        buffer_size: int = 1,
+        flush_interval_in_seconds: float = 1.0,
     ) -> None:
-        """Initializes `SQLBrokerEvent`."""
-        from rasa.core.tracker_store import SQLTrackerStore
+        """Initializes `SQLBrokerEvent`.
+
+        Args:
+            dialect: SQL database type.
+            host: Database network host.
+            port: Database network port.
+            db: Database name.
+            username: User name to use when connecting to the database.
+            password: Password for database user.
+            pool_size: Number of connections which are kept open.
+            max_overflow: Number of connections which can be opened in addition to
+                `pool_size`.
+            buffer_size: Number of events which are buffered before they are
+                written. `1` writes every event right away.
+            flush_interval_in_seconds: Maximum time in seconds which events are
+                buffered before they are written.
+        """
+        from rasa.core.tracker_store import (
+            SQLTrackerStore,
+            create_engine_kwargs,
+            number_of_sql_workers,
+        )
         import sqlalchemy.orm
 
         engine_url = SQLTrackerStore.get_db_url(
@@ -51,10 +84,25 @@ class SQLEventBroker(EventBroker):
 
         logger.debug(f"SQLEventBroker: Connecting to database: '{engine_url}'.")
 
-        self.engine = sqlalchemy.create_engine(engine_url)
+        engine_kwargs = create_engine_kwargs(engine_url, pool_size, max_overflow)
+        self.engine = sqlalchemy.create_engine(engine_url, **engine_kwargs)
         self.Base.metadata.create_all(self.engine)
         self.sessionmaker = sqlalchemy.orm.sessionmaker(bind=self.engine)
 
+        self._executors: List[ThreadPoolExecutor] = [
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="rasa-sql-broker")
+            for _ in range(number_of_sql_workers(engine_url, engine_kwargs))
+        ]
+        self._pending: Set[Future] = set()
+
+        self.buffer_size = max(buffer_size, 1)
+        self.flush_interval_in_seconds = flush_interval_in_seconds
+        # one buffer per executor so that the events of a conversation stay in order
+        self._buffers: List[List[Dict[Text, Any]]] = [
+            [] for _ in range(max(len(self._executors), 1))
+        ]
+        self._flush_timer: Optional[asyncio.TimerHandle] = None
+
     @classmethod
     async def from_endpoint_config(
         cls,
@@ -75,10 +123,95 @@ class SQLEventBroker(EventBroker):
 
     def publish(self, event: Dict[Text, Any]) -> None:
         """Publishes a json-formatted Rasa Core event into an event queue."""
+        self.publish_many([event])
+
+    def publish_many(self, events: List[Dict[Text, Any]]) -> None:
+        """Publishes events and writes the events of a conversation in one insert."""
+        shards = set()
+        for event in events:
+            shard = self._shard(event)
+            self._buffers[shard].append(event)
+            shards.add(shard)
+
+        for shard in shards:
+            if len(self._buffers[shard]) >= self.buffer_size:
+                self._flush(shard)
+
+        if any(self._buffers):
+            self._schedule_flush()
+
+    def _shard(self, event: Dict[Text, Any]) -> int:
+        """Returns the index of the executor which writes `event`."""
+        if len(self._buffers) == 1:
+            return 0
+
+        sender_id = event.get("sender_id") or ""
+        return zlib.crc32(sender_id.encode()) % len(self._buffers)
+
+    def _schedule_flush(self) -> None:
+        """Flushes the buffered events after `flush_interval_in_seconds`."""
+        if self._flush_timer is not None:
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # without an event loop the events are written once the buffer is full
+            # or the broker is closed
+            return
+
+        self._flush_timer = loop.call_later(
+            self.flush_interval_in_seconds, self._flush_all
+        )
+
+    def _flush_all(self) -> None:
+        self._flush_timer = None
+        for shard in range(len(self._buffers)):
+            self._flush(shard)
+
+    def _flush(self, shard: int) -> None:
+        """Writes the buffered events of `shard`."""
+        events = self._buffers[shard]
+        if not events:
+            return
+        self._buffers[shard] = []
+
+        if not self._executors:
+            self._insert(events)
+            return
+
+        future = self._executors[shard].submit(self._insert, events)
+        self._pending.add(future)
+        future.add_done_callback(self._on_insert_done)
+
+    def _insert(self, events: List[Dict[Text, Any]]) -> None:
+        rows = [
+            {"sender_id": event.get("sender_id"), "data": json.dumps(event)}
+            for event in events
+        ]
         with self.session_scope() as session:
-            session.add(
-                self.SQLBrokerEvent(
-                    sender_id=event.get("sender_id"), data=json.dumps(event)
-                )
-            )
+            session.execute(self.SQLBrokerEvent.__table__.insert(), rows)
             session.commit()
+
+    def _on_insert_done(self, future: Future) -> None:
+        self._pending.discard(future)
+
+        if not future.cancelled() and future.exception():
+            logger.error(
+                f"Failed to write events to the SQL event broker: "
+                f"{future.exception()}"
+            )
+
+    async def close(self) -> None:
+        """Waits until all published events are written and closes the connections."""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+        self._flush_all()
+
+        pending = [asyncio.wrap_future(future) for future in list(self._pending)]
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        for executor in self._executors:
+            executor.shutdown(wait=True)
+        self.engine.dispose()
@@ -22,10 +22,20 @@ DEFAULT_REQUEST_TIMEOUT = 60 * 5  # 5 minutes
 
 DEFAULT_STREAM_READING_TIMEOUT = 10  # in seconds
 
+DEFAULT_MODEL_DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # in bytes
+
 DEFAULT_LOCK_LIFETIME = 60  # in seconds
 
 DEFAULT_KEEP_ALIVE_TIMEOUT = 120  # in seconds
 
+# maximum number of simultaneous connections of an endpoint's connection pool
+DEFAULT_CONNECTION_LIMIT = 100
+
+# maximum number of simultaneous connections per host, `0` means no limit
+DEFAULT_CONNECTION_LIMIT_PER_HOST = 0
+
+DEFAULT_CONNECTION_KEEP_ALIVE_TIMEOUT = 15  # in seconds
+
 BEARER_TOKEN_PREFIX = "Bearer "
 
 # The lowest priority is intended to be used by machine learning policies.
@@ -64,6 +74,16 @@ POSTGRESQL_SCHEMA = "POSTGRESQL_SCHEMA"
 POSTGRESQL_POOL_SIZE = "SQL_POOL_SIZE"
 POSTGRESQL_MAX_OVERFLOW = "SQL_MAX_OVERFLOW"
 
+# Names of the environment variables configuring how graph inference is run by the
+# `MessageProcessor`, see `rasa.core.inference`
+ENV_INFERENCE_EXECUTOR_MODE = "INFERENCE_EXECUTOR_MODE"
+ENV_INFERENCE_EXECUTOR_WORKERS = "INFERENCE_EXECUTOR_WORKERS"
+
+# Names of the environment variables configuring the batching of NLU graph runs for
+# messages which arrive at the same time, see `rasa.core.inference`
+ENV_NLU_BATCH_WINDOW_MS = "NLU_BATCH_WINDOW_MS"
+ENV_NLU_MAX_BATCH_SIZE = "NLU_MAX_BATCH_SIZE"
+
 # File names for testing
 CONFUSION_MATRIX_STORIES_FILE = "story_confusion_matrix.png"
 REPORT_STORIES_FILE = "story_report.json"
@@ -0,0 +1,494 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Text,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+import structlog
+
+from rasa.core.channels.channel import UserMessage
+from rasa.core.constants import (
+    ENV_INFERENCE_EXECUTOR_MODE,
+    ENV_INFERENCE_EXECUTOR_WORKERS,
+    ENV_NLU_BATCH_WINDOW_MS,
+    ENV_NLU_MAX_BATCH_SIZE,
+)
+from rasa.engine.constants import PLACEHOLDER_MESSAGE
+from rasa.engine.runner.interface import GraphRunner
+from rasa.engine.storage.local_model_storage import is_model_directory
+from rasa.shared.exceptions import RasaException
+
+structlogger = structlog.get_logger()
+
+# the graph is run on the event loop (blocks all other requests while it runs)
+INFERENCE_MODE_INLINE = "inline"
+# the graph is run by a pool of threads which share the loaded model
+INFERENCE_MODE_THREAD = "thread"
+# the graph is run by a pool of processes which each hold a copy of the model
+INFERENCE_MODE_PROCESS = "process"
+
+INFERENCE_MODES = [INFERENCE_MODE_INLINE, INFERENCE_MODE_THREAD, INFERENCE_MODE_PROCESS]
+
+DEFAULT_INFERENCE_MODE = INFERENCE_MODE_INLINE
+DEFAULT_INFERENCE_WORKERS = 1
+
+# batching of NLU graph runs is disabled by default
+DEFAULT_NLU_BATCH_WINDOW_MS = 0.0
+DEFAULT_NLU_MAX_BATCH_SIZE = 32
+
+ItemType = TypeVar("ItemType")
+ResultType = TypeVar("ResultType")
+
+# graph runner of the model which is loaded by a worker process of the process pool
+_worker_graph_runner: Optional[GraphRunner] = None
+
+
+class InvalidInferenceExecutorConfig(RasaException):
+    """Raised if the inference executor is configured incorrectly."""
+
+
+@dataclass
+class InferenceMetrics:
+    """Statistics about the graph runs of an `InferenceExecutor`.
+
+    Attributes:
+        queue_depth: Number of graph runs which currently wait for a free worker.
+        max_queue_depth: Highest number of graph runs which waited at the same time.
+        number_of_runs: Number of completed graph runs.
+        total_wait_time: Sum of the seconds the completed runs waited for a worker.
+        max_wait_time: Longest time in seconds a run waited for a worker.
+    """
+
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    number_of_runs: int = 0
+    total_wait_time: float = 0.0
+    max_wait_time: float = 0.0
+
+    @property
+    def average_wait_time(self) -> float:
+        """Returns the average time in seconds a run waited for a worker."""
+        if not self.number_of_runs:
+            return 0.0
+        return self.total_wait_time / self.number_of_runs
+
+    def as_dict(self) -> Dict[Text, Union[int, float]]:
+        """Returns the metrics as JSON serializable dictionary."""
+        return {
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "number_of_runs": self.number_of_runs,
+            "average_wait_time": self.average_wait_time,
+            "max_wait_time": self.max_wait_time,
+        }
+
+
+class InferenceExecutor:
+    """Runs graph inference for the `MessageProcessor` off the event loop.
+
+    Running the graph is CPU bound. If it runs on the event loop, every other
+    conversation served by the same process has to wait until the run finished.
+
+    When the model of the agent is replaced, conversations which are still handled
+    by the previous `MessageProcessor` keep running the graph with its executor.
+    The executor is hence only `retire`d and shuts its workers down once it isn't
+    `in_use` anymore.
+    """
+
+    def __init__(
+        self,
+        mode: Text = DEFAULT_INFERENCE_MODE,
+        max_workers: int = DEFAULT_INFERENCE_WORKERS,
+        model_path: Optional[Union[Text, Path]] = None,
+    ) -> None:
+        """Creates the executor.
+
+        Args:
+            mode: `inline` to run the graph on the event loop, `thread` to run it
+                in a pool of threads, or `process` to run it in a pool of
+                processes which each load their own copy of the model.
+            max_workers: Number of threads or processes.
+            model_path: Path to the model archive. Required for the `process` mode.
+                The worker processes load a copy of the model which the executor
+                owns, so that the model may be deleted once the executor was
+                created.
+
+        Raises:
+            InvalidInferenceExecutorConfig: If the configuration is invalid.
+        """
+        if mode not in INFERENCE_MODES:
+            raise InvalidInferenceExecutorConfig(
+                f"Invalid inference executor mode '{mode}'. Valid modes are: "
+                f"{', '.join(INFERENCE_MODES)}."
+            )
+        if max_workers < 1:
+            raise InvalidInferenceExecutorConfig(
+                f"The inference executor needs at least one worker, got "
+                f"{max_workers}."
+            )
+        if mode == INFERENCE_MODE_PROCESS and model_path is None:
+            raise InvalidInferenceExecutorConfig(
+                f"The '{INFERENCE_MODE_PROCESS}' inference executor mode needs the "
+                f"path to the model which the worker processes load."
+            )
+
+        self.mode = mode
+        self.max_workers = max_workers
+        self.metrics = InferenceMetrics()
+        self._in_flight = 0
+        self._users = 0
+        self._is_retired = False
+        self._model_copy_directory: Optional[Text] = None
+        if mode == INFERENCE_MODE_PROCESS:
+            model_path = self._copy_model(model_path)  # type: ignore[arg-type]
+        self._executor = self._create_executor(mode, max_workers, model_path)
+
+    @classmethod
+    def from_env(cls, model_path: Union[Text, Path]) -> InferenceExecutor:
+        """Creates the executor configured by environment variables.
+
+        Args:
+            model_path: Path to the model archive.
+
+        Returns:
+            The executor.
+        """
+        mode = os.environ.get(ENV_INFERENCE_EXECUTOR_MODE, DEFAULT_INFERENCE_MODE)
+        try:
+            max_workers = int(
+                os.environ.get(
+                    ENV_INFERENCE_EXECUTOR_WORKERS, DEFAULT_INFERENCE_WORKERS
+                )
+            )
+        except ValueError as e:
+            raise InvalidInferenceExecutorConfig(
+                f"Environment variable '{ENV_INFERENCE_EXECUTOR_WORKERS}' has to be "
+                f"an integer."
+            ) from e
+
+        return cls(mode.strip().lower(), max_workers, model_path)
+
+    def _copy_model(self, model_path: Union[Text, Path]) -> Path:
+        self._model_copy_directory = tempfile.mkdtemp(prefix="rasa-inference-")
+        model_path = Path(model_path)
+        model_copy = Path(self._model_copy_directory, model_path.name)
+        if is_model_directory(model_path):
+            shutil.copytree(model_path, model_copy)
+        else:
+            shutil.copy2(model_path, model_copy)
+        return model_copy
+
+    @staticmethod
+    def _create_executor(
+        mode: Text, max_workers: int, model_path: Optional[Union[Text, Path]]
+    ) -> Optional[Executor]:
+        if mode == INFERENCE_MODE_THREAD:
+            return ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="rasa-inference"
+            )
+        if mode == INFERENCE_MODE_PROCESS:
+            # forking a process which has already initialized TensorFlow is unsafe
+            return ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_load_worker_graph_runner,
+                initargs=(str(model_path),),
+            )
+        return None
+
+    async def run(
+        self,
+        graph_runner: GraphRunner,
+        inputs: Dict[Text, Any],
+        targets: List[Text],
+    ) -> Dict[Text, Any]:
+        """Runs the graph without blocking the event loop.
+
+        Args:
+            graph_runner: The runner of the loaded model. Not used in the `process`
+                mode as the worker processes use their own copy of the model.
+            inputs: Inputs of the graph run.
+            targets: Targets of the graph run.
+
+        Returns:
+            The results of the targets.
+        """
+        if self._executor is None:
+            return graph_runner.run(inputs=inputs, targets=targets)
+
+        with self.in_use():
+            self._on_submitted()
+            submitted_at = time.time()
+            loop = asyncio.get_running_loop()
+            try:
+                if self.mode == INFERENCE_MODE_PROCESS:
+                    started_at, results = await loop.run_in_executor(
+                        self._executor,
+                        _run_worker_graph_runner,
+                        _picklable_inputs(inputs),
+                        targets,
+                    )
+                else:
+                    started_at, results = await loop.run_in_executor(
+                        self._executor,
+                        _run_graph_runner,
+                        graph_runner,
+                        inputs,
+                        targets,
+                    )
+            finally:
+                self._in_flight -= 1
+                self.metrics.queue_depth = max(self._in_flight - self.max_workers, 0)
+
+        self._on_completed(max(started_at - submitted_at, 0.0))
+        return results
+
+    def _on_submitted(self) -> None:
+        self._in_flight += 1
+        self.metrics.queue_depth = max(self._in_flight - self.max_workers, 0)
+        self.metrics.max_queue_depth = max(
+            self.metrics.max_queue_depth, self.metrics.queue_depth
+        )
+
+    def _on_completed(self, wait_time: float) -> None:
+        self.metrics.number_of_runs += 1
+        self.metrics.total_wait_time += wait_time
+        self.metrics.max_wait_time = max(self.metrics.max_wait_time, wait_time)
+        structlogger.debug(
+            "inference.executor.run",
+            wait_time=wait_time,
+            queue_depth=self.metrics.queue_depth,
+        )
+
+    @contextlib.contextmanager
+    def in_use(self) -> Iterator[None]:
+        """Keeps the workers running while the context is active.
+
+        A conversation runs the graph several times while a message is handled.
+        Wrapping the handling of the message makes sure that a `retire`d executor
+        isn't shut down between these runs.
+        """
+        self._users += 1
+        try:
+            yield
+        finally:
+            self._users -= 1
+            if self._is_retired and not self._users:
+                self.shutdown()
+
+    def retire(self) -> None:
+        """Shuts the workers down once the executor isn't `in_use` anymore."""
+        self._is_retired = True
+        if not self._users:
+            self.shutdown()
+
+    def shutdown(self) -> None:
+        """Stops the workers once the currently running graph runs finished."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+        if self._model_copy_directory is not None:
+            shutil.rmtree(self._model_copy_directory, ignore_errors=True)
+            self._model_copy_directory = None
+
+
+def _run_graph_runner(
+    graph_runner: GraphRunner, inputs: Dict[Text, Any], targets: List[Text]
+) -> Tuple[float, Dict[Text, Any]]:
+    return time.time(), graph_runner.run(inputs=inputs, targets=targets)
+
+
+def _picklable_inputs(inputs: Dict[Text, Any]) -> Dict[Text, Any]:
+    # the output channel of a message can't be sent to a worker process
+    if PLACEHOLDER_MESSAGE not in inputs:
+        return inputs
+
+    return {
+        **inputs,
+        PLACEHOLDER_MESSAGE: [
+            {
+                "text": message.text,
+                "sender_id": message.sender_id,
+                "parse_data": message.parse_data,
+                "input_channel": message.input_channel,
+                "message_id": message.message_id,
+                "metadata": message.metadata,
+            }
+            for message in inputs[PLACEHOLDER_MESSAGE]
+        ],
+    }
+
+
+def _restore_inputs(inputs: Dict[Text, Any]) -> Dict[Text, Any]:
+    if PLACEHOLDER_MESSAGE not in inputs:
+        return inputs
+
+    return {
+        **inputs,
+        PLACEHOLDER_MESSAGE: [
+            UserMessage(**message) for message in inputs[PLACEHOLDER_MESSAGE]
+        ],
+    }
+
+
+def _load_worker_graph_runner(model_path: Text) -> None:
+    from rasa.core.processor import MessageProcessor
+
+    global _worker_graph_runner
+    _, _, _worker_graph_runner = MessageProcessor._load_model(model_path)
+
+
+def _run_worker_graph_runner(
+    inputs: Dict[Text, Any], targets: List[Text]
+) -> Tuple[float, Dict[Text, Any]]:
+    if _worker_graph_runner is None:
+        raise RasaException("The inference worker process didn't load a model.")
+
+    return _run_graph_runner(_worker_graph_runner, _restore_inputs(inputs), targets)
+
+
+class MessageBatcher:
+    """Coalesces items which arrive within a short window into one batch run.
+
+    The `MessageProcessor` uses it to parse messages of concurrent requests with a
+    single run of the NLU graph, so that the featurizers and classifiers process
+    them as one batch.
+    """
+
+    def __init__(
+        self,
+        run_batch: Callable[[List[ItemType]], Awaitable[List[ResultType]]],
+        window: float,
+        max_batch_size: int = DEFAULT_NLU_MAX_BATCH_SIZE,
+    ) -> None:
+        """Creates the batcher.
+
+        Args:
+            run_batch: Coroutine function which computes the results of a batch.
+                The results have to be in the order of the items.
+            window: Seconds to wait for further items after the first item of a
+                batch arrived.
+            max_batch_size: A batch is run right away once it has this many items.
+
+        Raises:
+            InvalidInferenceExecutorConfig: If the configuration is invalid.
+        """
+        if window < 0 or max_batch_size < 1:
+            raise InvalidInferenceExecutorConfig(
+                f"The batch window can't be negative and the maximum batch size has "
+                f"to be at least one, got a window of {window}s and a maximum batch "
+                f"size of {max_batch_size}."
+            )
+
+        self._run_batch = run_batch
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self._pending: List[Tuple[ItemType, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # keep references to the running batches so they aren't garbage collected
+        self._running_batches: Set[asyncio.Future] = set()
+
+    @classmethod
+    def from_env(
+        cls, run_batch: Callable[[List[ItemType]], Awaitable[List[ResultType]]]
+    ) -> Optional[MessageBatcher]:
+        """Creates the batcher configured by environment variables.
+
+        Args:
+            run_batch: Coroutine function which computes the results of a batch.
+
+        Returns:
+            The batcher or `None` if batching is disabled.
+        """
+        try:
+            window_ms = float(
+                os.environ.get(ENV_NLU_BATCH_WINDOW_MS, DEFAULT_NLU_BATCH_WINDOW_MS)
+            )
+            max_batch_size = int(
+                os.environ.get(ENV_NLU_MAX_BATCH_SIZE, DEFAULT_NLU_MAX_BATCH_SIZE)
+            )
+        except ValueError as e:
+            raise InvalidInferenceExecutorConfig(
+                f"Environment variables '{ENV_NLU_BATCH_WINDOW_MS}' and "
+                f"'{ENV_NLU_MAX_BATCH_SIZE}' have to be numbers."
+            ) from e
+
+        if window_ms <= 0:
+            return None
+
+        return cls(run_batch, window_ms / 1000, max_batch_size)
+
+    async def submit(self, item: ItemType) -> ResultType:
+        """Adds the item to the next batch and waits for its result.
+
+        Args:
+            item: The item to process.
+
+        Returns:
+            The result of the item.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._process(batch))
+            self._running_batches.add(task)
+            task.add_done_callback(self._running_batches.discard)
+
+    async def _process(self, batch: List[Tuple[ItemType, asyncio.Future]]) -> None:
+        structlogger.debug("inference.batcher.run", batch_size=len(batch))
+        try:
+            results = await self._run_batch([item for item, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+        # the futures of items without a result would never be done otherwise
+        for _, future in batch[len(results) :]:
+            if not future.done():
+                future.set_exception(
+                    RasaException(
+                        f"The batch run returned {len(results)} results for a batch "
+                        f"of {len(batch)} items."
+                    )
+                )
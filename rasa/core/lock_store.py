@@ -1,16 +1,17 @@
 from __future__ import annotations
 import asyncio
+from collections import deque
 from contextlib import asynccontextmanager
-import json
 import logging
 import os
+import time
 
-from typing import AsyncGenerator, Dict, Optional, Text, Union
+from typing import Any, AsyncGenerator, Dict, Optional, Text, Tuple, Union
 
 from rasa.shared.exceptions import RasaException, ConnectionException
 import rasa.shared.utils.common
 from rasa.core.constants import DEFAULT_LOCK_LIFETIME
-from rasa.core.lock import TicketLock
+from rasa.core.lock import Ticket, TicketLock
 from rasa.utils.endpoints import EndpointConfig
 
 logger = logging.getLogger(__name__)
@@ -24,6 +25,84 @@ LOCK_LIFETIME = _get_lock_lifetime()
 DEFAULT_SOCKET_TIMEOUT_IN_SECONDS = 10
 
 DEFAULT_REDIS_LOCK_STORE_KEY_PREFIX = "lock:"
+# seconds the Redis subscriber thread blocks while waiting for a notification
+DEFAULT_REDIS_NOTIFICATION_POLL_TIME = 1.0
+
+# A lock is stored in Redis as hash which maps the ticket numbers to the expiration
+# times of the tickets. The conversation ID is stored in the hash as well, so that
+# a lock without tickets still exists.
+REDIS_LOCK_CONVERSATION_ID_FIELD = "conversation_id"
+
+# Lua function which removes the expired tickets of a lock and returns the number
+# of remaining tickets and the number of the ticket that was last issued
+_REDIS_REMOVE_EXPIRED_TICKETS_FUNCTION = """
+local function remove_expired_tickets(key, now)
+    local number_of_tickets = 0
+    local last_issued = -1
+    local fields = redis.call('HGETALL', key)
+    for i = 1, #fields, 2 do
+        if fields[i] ~= 'conversation_id' then
+            if tonumber(fields[i + 1]) < now then
+                redis.call('HDEL', key, fields[i])
+            else
+                number_of_tickets = number_of_tickets + 1
+                last_issued = math.max(last_issued, tonumber(fields[i]))
+            end
+        end
+    end
+    return number_of_tickets, last_issued
+end
+"""
+
+# Older Rasa versions stored locks as serialized JSON strings. These locks are
+# deleted before a script modifies the lock, as the hash commands would fail for
+# them. Their tickets expired anyway, since they were issued before the upgrade.
+_REDIS_DELETE_LEGACY_LOCK = """
+if redis.call('TYPE', KEYS[1])['ok'] == 'string' then
+    redis.call('DEL', KEYS[1])
+end
+"""
+
+# KEYS: lock key, ARGV: conversation ID, current time, expiration time of the ticket
+# returns the number of the issued ticket
+_REDIS_ISSUE_TICKET_SCRIPT = (
+    _REDIS_REMOVE_EXPIRED_TICKETS_FUNCTION
+    + _REDIS_DELETE_LEGACY_LOCK
+    + """
+local _, last_issued = remove_expired_tickets(KEYS[1], tonumber(ARGV[2]))
+local number = last_issued + 1
+redis.call('HSET', KEYS[1], 'conversation_id', ARGV[1], number, ARGV[3])
+return number
+"""
+)
+
+# KEYS: lock key, ARGV: current time
+_REDIS_UPDATE_LOCK_SCRIPT = (
+    _REDIS_REMOVE_EXPIRED_TICKETS_FUNCTION
+    + _REDIS_DELETE_LEGACY_LOCK
+    + """
+remove_expired_tickets(KEYS[1], tonumber(ARGV[1]))
+"""
+)
+
+# KEYS: lock key, ARGV: current time, number of the ticket, `1` if the lock should
+# be deleted if no one is waiting for it anymore
+# publishes the release of the ticket on the channel of the lock key if someone
+# is waiting, returns the number of waiting tickets
+_REDIS_FINISH_SERVING_SCRIPT = (
+    _REDIS_REMOVE_EXPIRED_TICKETS_FUNCTION
+    + _REDIS_DELETE_LEGACY_LOCK
+    + """
+redis.call('HDEL', KEYS[1], ARGV[2])
+local number_of_tickets = remove_expired_tickets(KEYS[1], tonumber(ARGV[1]))
+if number_of_tickets > 0 then
+    redis.call('PUBLISH', KEYS[1], '')
+elseif ARGV[3] == '1' then
+    redis.call('DEL', KEYS[1])
+end
+return number_of_tickets
+"""
+)
 
 
 # noinspection PyUnresolvedReferences
@@ -37,6 +116,52 @@ class LockError(RasaException):
     pass
 
 
+class _LockReleaseNotifier:
+    """Wakes up the tickets which are waiting for the lock of a conversation."""
+
+    def __init__(self) -> None:
+        """Creates the notifier."""
+        self._waiters: Dict[Text, Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = {}
+
+    async def wait(self, conversation_id: Text, timeout: float) -> None:
+        """Waits until `notify` is called for `conversation_id` or `timeout` passed.
+
+        Args:
+            conversation_id: The conversation ID whose lock the caller is waiting for.
+            timeout: The maximum number of seconds to wait.
+        """
+        loop = asyncio.get_running_loop()
+        waiter = self._waiters.get(conversation_id)
+        if waiter is None or waiter[0] is not loop:
+            waiter = (loop, asyncio.Event())
+            self._waiters[conversation_id] = waiter
+
+        try:
+            await asyncio.wait_for(waiter[1].wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def notify(self, conversation_id: Text) -> None:
+        """Wakes up all tickets which wait for the lock of `conversation_id`.
+
+        Must be called from the thread running the event loop of the waiters.
+        """
+        waiter = self._waiters.pop(conversation_id, None)
+        if waiter:
+            waiter[1].set()
+
+    def notify_threadsafe(self, conversation_id: Text) -> None:
+        """Same as `notify`, but can be called from any thread."""
+        waiter = self._waiters.pop(conversation_id, None)
+        if waiter:
+            loop, event = waiter
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # the event loop of the waiters was closed in the meantime
+                pass
+
+
 class LockStore:
     """Base class for ticket locks."""
 
@@ -95,8 +220,10 @@ class LockStore:
     ) -> AsyncGenerator[TicketLock, None]:
         """Acquire lock with lifetime `lock_lifetime`for `conversation_id`.
 
-        Try acquiring lock with a wait time of `wait_time_in_seconds` seconds
-        between attempts. Raise a `LockError` if lock has expired.
+        Try acquiring lock with a wait time of at most `wait_time_in_seconds`
+        seconds between attempts. Lock stores which support notifications try again
+        as soon as a ticket for this conversation was served. Raise a `LockError` if
+        lock has expired.
         """
         ticket = self.issue_ticket(conversation_id, lock_lifetime)
         try:
@@ -133,14 +260,30 @@ class LockStore:
                 f"Retrying in {wait_time_in_seconds} seconds ..."
             )
 
-            # sleep and update lock
-            await asyncio.sleep(wait_time_in_seconds)
+            # wait until the lock was released (or the wait time passed)
+            # and update lock
+            await self._wait_for_lock_release(conversation_id, wait_time_in_seconds)
             self.update_lock(conversation_id)
 
         raise LockError(
             f"Could not acquire lock for conversation_id '{conversation_id}'."
         )
 
+    async def _wait_for_lock_release(
+        self, conversation_id: Text, wait_time_in_seconds: float
+    ) -> None:
+        """Waits until a ticket for `conversation_id` might be served.
+
+        Lock stores which can notify waiting tickets override this method together
+        with `_notify_lock_release`. The default implementation waits for
+        `wait_time_in_seconds` seconds.
+        """
+        await asyncio.sleep(wait_time_in_seconds)
+
+    def _notify_lock_release(self, conversation_id: Text) -> None:
+        """Notifies the tickets waiting for the lock of `conversation_id`."""
+        pass
+
     def update_lock(self, conversation_id: Text) -> None:
         """Fetch lock for `conversation_id`, remove expired tickets and save lock."""
         lock = self.get_lock(conversation_id)
@@ -171,13 +314,16 @@ class LockStore:
     def finish_serving(self, conversation_id: Text, ticket_number: int) -> None:
         """Finish serving ticket with `ticket_number` for `conversation_id`.
 
-        Removes ticket from lock and saves lock.
+        Removes ticket from lock, saves lock and notifies the waiting tickets.
         """
         lock = self.get_lock(conversation_id)
         if lock:
             lock.remove_ticket_for(ticket_number)
             self.save_lock(lock)
 
+            if lock.is_someone_waiting():
+                self._notify_lock_release(conversation_id)
+
     def cleanup(self, conversation_id: Text, ticket_number: int) -> None:
         """Remove lock for `conversation_id` if no one is waiting."""
         self.finish_serving(conversation_id, ticket_number)
@@ -249,8 +395,25 @@ class RedisLockStore(LockStore):
             logger.debug(f"Setting non-default redis key prefix: '{key_prefix}'.")
             self._set_key_prefix(key_prefix)
 
+        self._register_scripts()
+        self._init_lock_release_notifications()
+
         super().__init__()
 
+    def _register_scripts(self) -> None:
+        self._issue_ticket_script = self.red.register_script(_REDIS_ISSUE_TICKET_SCRIPT)
+        self._update_lock_script = self.red.register_script(_REDIS_UPDATE_LOCK_SCRIPT)
+        self._finish_serving_script = self.red.register_script(
+            _REDIS_FINISH_SERVING_SCRIPT
+        )
+
+    def _init_lock_release_notifications(self) -> None:
+        self._lock_release_notifier = _LockReleaseNotifier()
+        # the thread which receives the lock releases of all Rasa servers,
+        # it's started as soon as a ticket has to wait for a lock
+        self._subscriber_thread: Optional[Any] = None
+        self._subscription_failed = False
+
     def _set_key_prefix(self, key_prefix: Text) -> None:
         if isinstance(key_prefix, str) and key_prefix.isalnum():
             self.key_prefix = key_prefix + ":" + DEFAULT_REDIS_LOCK_STORE_KEY_PREFIX
@@ -262,11 +425,32 @@ class RedisLockStore(LockStore):
 
     def get_lock(self, conversation_id: Text) -> Optional[TicketLock]:
         """Retrieves lock (see parent docstring for more information)."""
-        serialised_lock = self.red.get(self.key_prefix + conversation_id)
-        if serialised_lock:
-            return TicketLock.from_dict(json.loads(serialised_lock))
+        import redis.exceptions
 
-        return None
+        try:
+            fields = self.red.hgetall(self.key_prefix + conversation_id)
+        except redis.exceptions.ResponseError as e:
+            if "WRONGTYPE" not in str(e):
+                raise
+            # locks of older Rasa versions are replaced once a ticket is issued
+            logger.debug(
+                f"Ignoring the lock for conversation '{conversation_id}' as it was "
+                f"stored by an older Rasa version."
+            )
+            return None
+
+        if not fields:
+            return None
+
+        tickets = sorted(
+            (
+                Ticket(int(number), float(expires))
+                for number, expires in fields.items()
+                if number.decode() != REDIS_LOCK_CONVERSATION_ID_FIELD
+            ),
+            key=lambda ticket: ticket.number,
+        )
+        return TicketLock(conversation_id, deque(tickets))
 
     def delete_lock(self, conversation_id: Text) -> None:
         """Deletes lock for conversation ID."""
@@ -274,7 +458,104 @@ class RedisLockStore(LockStore):
         self._log_deletion(conversation_id, deletion_successful)
 
     def save_lock(self, lock: TicketLock) -> None:
-        self.red.set(self.key_prefix + lock.conversation_id, lock.dumps())
+        """Replaces the stored lock with `lock` in a single transaction."""
+        key = self.key_prefix + lock.conversation_id
+        fields = {REDIS_LOCK_CONVERSATION_ID_FIELD: lock.conversation_id}
+        fields.update(
+            {str(ticket.number): repr(ticket.expires) for ticket in lock.tickets}
+        )
+
+        pipeline = self.red.pipeline(transaction=True)
+        pipeline.delete(key)
+        pipeline.hset(key, mapping=fields)
+        pipeline.execute()
+
+    def issue_ticket(
+        self, conversation_id: Text, lock_lifetime: float = LOCK_LIFETIME
+    ) -> int:
+        """Issues a ticket with a single atomic Redis script.
+
+        See parent docstring for more information.
+        """
+        logger.debug(f"Issuing ticket for conversation '{conversation_id}'.")
+        now = time.time()
+        try:
+            return self._issue_ticket_script(
+                keys=[self.key_prefix + conversation_id],
+                args=[conversation_id, repr(now), repr(now + lock_lifetime)],
+            )
+        except Exception as e:
+            raise LockError(f"Error while acquiring lock. Error:\n{e}")
+
+    def update_lock(self, conversation_id: Text) -> None:
+        """Removes the expired tickets with a single atomic Redis script."""
+        self._update_lock_script(
+            keys=[self.key_prefix + conversation_id], args=[repr(time.time())]
+        )
+
+    def finish_serving(self, conversation_id: Text, ticket_number: int) -> None:
+        """Finishes serving a ticket with a single atomic Redis script.
+
+        The waiting tickets of all Rasa servers are notified.
+        """
+        self._finish_serving(conversation_id, ticket_number, delete_if_unused=False)
+
+    def cleanup(self, conversation_id: Text, ticket_number: int) -> None:
+        """Finishes serving the ticket and deletes the lock if no one is waiting.
+
+        Both are done with a single atomic Redis script.
+        """
+        self._finish_serving(conversation_id, ticket_number, delete_if_unused=True)
+
+    def _finish_serving(
+        self, conversation_id: Text, ticket_number: int, delete_if_unused: bool
+    ) -> None:
+        waiting_tickets = self._finish_serving_script(
+            keys=[self.key_prefix + conversation_id],
+            args=[repr(time.time()), ticket_number, int(delete_if_unused)],
+        )
+        if waiting_tickets:
+            self._lock_release_notifier.notify(conversation_id)
+
+    async def _wait_for_lock_release(
+        self, conversation_id: Text, wait_time_in_seconds: float
+    ) -> None:
+        """Waits until any Rasa server released a ticket for `conversation_id`.
+
+        The lock releases are published with Redis pub/sub. If subscribing fails,
+        the lock is polled every `wait_time_in_seconds` seconds instead.
+        """
+        self._subscribe_to_lock_releases()
+        await self._lock_release_notifier.wait(conversation_id, wait_time_in_seconds)
+
+    def _subscribe_to_lock_releases(self) -> None:
+        import redis.exceptions
+
+        if self._subscriber_thread is not None or self._subscription_failed:
+            return
+
+        try:
+            pubsub = self.red.pubsub(ignore_subscribe_messages=True)
+            pubsub.psubscribe(
+                **{f"{self.key_prefix}*": self._handle_lock_release_message}
+            )
+            self._subscriber_thread = pubsub.run_in_thread(
+                sleep_time=DEFAULT_REDIS_NOTIFICATION_POLL_TIME, daemon=True
+            )
+        except redis.exceptions.RedisError as e:
+            self._subscription_failed = True
+            logger.warning(
+                f"Could not subscribe to lock releases. Tickets waiting for a lock "
+                f"will poll the lock store instead. Error: {e}"
+            )
+
+    def _handle_lock_release_message(self, message: Dict[Text, Any]) -> None:
+        channel = message["channel"]
+        if isinstance(channel, bytes):
+            channel = channel.decode()
+
+        conversation_id = channel[len(self.key_prefix) :]
+        self._lock_release_notifier.notify_threadsafe(conversation_id)
 
 
 class InMemoryLockStore(LockStore):
@@ -283,6 +564,7 @@ class InMemoryLockStore(LockStore):
     def __init__(self) -> None:
         """Initialise dictionary of locks."""
         self.conversation_locks: Dict[Text, TicketLock] = {}
+        self._lock_release_notifier = _LockReleaseNotifier()
         super().__init__()
 
     def get_lock(self, conversation_id: Text) -> Optional[TicketLock]:
@@ -300,6 +582,16 @@ class InMemoryLockStore(LockStore):
         """Save lock in store."""
         self.conversation_locks[lock.conversation_id] = lock
 
+    async def _wait_for_lock_release(
+        self, conversation_id: Text, wait_time_in_seconds: float
+    ) -> None:
+        """Waits until a ticket for `conversation_id` was served."""
+        await self._lock_release_notifier.wait(conversation_id, wait_time_in_seconds)
+
+    def _notify_lock_release(self, conversation_id: Text) -> None:
+        """Wakes up the tickets waiting for the lock of `conversation_id`."""
+        self._lock_release_notifier.notify(conversation_id)
+
 
 def _create_from_endpoint_config(
     endpoint_config: Optional[EndpointConfig] = None,
@@ -1,9 +1,21 @@
 from __future__ import annotations
 import copy
 import functools
+import itertools
 import logging
 import structlog
-from typing import Any, List, DefaultDict, Dict, Text, Optional, Set, Tuple, cast
+from typing import (
+    Any,
+    List,
+    DefaultDict,
+    Dict,
+    Iterable,
+    Text,
+    Optional,
+    Set,
+    Tuple,
+    cast,
+)
 
 from tqdm import tqdm
 import numpy as np
@@ -48,11 +60,12 @@ from rasa.shared.core.constants import (
     LOOP_NAME,
     SLOTS,
     ACTIVE_LOOP,
+    USER,
     RULE_ONLY_SLOTS,
     RULE_ONLY_LOOPS,
 )
 from rasa.shared.core.domain import InvalidDomain, State, Domain
-from rasa.shared.nlu.constants import ACTION_NAME, INTENT_NAME_KEY
+from rasa.shared.nlu.constants import ACTION_NAME, INTENT, INTENT_NAME_KEY
 import rasa.core.test
 from rasa.core.training.training import create_action_fingerprints, ActionFingerprint
 
@@ -78,6 +91,19 @@ DEFAULT_RULES = "predicting default action with intent "
 LOOP_RULES = "handling active loops and forms - "
 LOOP_RULES_SEPARATOR = " - "
 
+# Sub-state features of the latest rule state which are used to index the rules.
+# A rule can only be applicable if these features of the latest conversation state
+# are equal to the ones of the rule (in case they are set in the rule).
+RULE_INDEX_FEATURES = (
+    (PREVIOUS_ACTION, ACTION_NAME),
+    (USER, INTENT),
+    (ACTIVE_LOOP, LOOP_NAME),
+)
+# Index key for rules whose latest state is a conversation start state
+CONVERSATION_START_INDEX_KEY = None
+
+RuleIndexKey = Optional[Tuple[Optional[Text], ...]]
+
 
 class InvalidRule(RasaException):
     """Exception that can be raised when rules are not valid."""
@@ -165,6 +191,9 @@ class RulePolicy(MemoizationPolicy):
             list
         )
 
+        self._rule_indices: Dict[Text, Dict[RuleIndexKey, List[Text]]] = {}
+        self._build_rule_indices()
+
     @classmethod
     def raise_if_incompatible_with_domain(
         cls, config: Dict[Text, Any], domain: Domain
@@ -782,6 +811,8 @@ class RulePolicy(MemoizationPolicy):
             trackers_as_states, trackers_as_actions
         )
 
+        self._build_rule_indices()
+
     def train(
         self,
         training_trackers: List[TrackerWithCachedStates],
@@ -910,10 +941,82 @@ class RulePolicy(MemoizationPolicy):
             reversed_rule_states[turn_index], conversation_state
         )
 
-    def _get_possible_keys(
-        self, lookup: Dict[Text, Text], states: List[State]
-    ) -> Set[Text]:
-        possible_keys = set(lookup.keys())
+    @staticmethod
+    def _index_value(state: State, state_type: Text, feature: Text) -> Optional[Text]:
+        value = state.get(state_type, {}).get(feature)
+        if not value or not isinstance(value, str) or value == SHOULD_NOT_BE_SET:
+            # the rule doesn't constrain this feature to a single value
+            return None
+        return value
+
+    @classmethod
+    def _rule_index_key(cls, state: State) -> RuleIndexKey:
+        if not state.get(PREVIOUS_ACTION):
+            return CONVERSATION_START_INDEX_KEY
+
+        return tuple(
+            cls._index_value(state, state_type, feature)
+            for state_type, feature in RULE_INDEX_FEATURES
+        )
+
+    @classmethod
+    def _create_rule_index(
+        cls, lookup: Dict[Text, Text]
+    ) -> Dict[RuleIndexKey, List[Text]]:
+        """Groups the rule keys of a lookup by the features of their latest state.
+
+        Args:
+            lookup: a lookup which maps rule keys to predictions
+
+        Returns:
+            rule keys grouped by the index key of their latest state
+        """
+        index: DefaultDict[RuleIndexKey, List[Text]] = defaultdict(list)
+        for rule_key in lookup:
+            latest_rule_state = cls._rule_key_to_state(rule_key)[-1]
+            index[cls._rule_index_key(latest_rule_state)].append(rule_key)
+        return dict(index)
+
+    def _build_rule_indices(self) -> None:
+        self._rule_indices = {
+            lookup_name: self._create_rule_index(self.lookup[lookup_name])
+            for lookup_name in [RULES, RULES_FOR_LOOP_UNHAPPY_PATH]
+            if lookup_name in self.lookup
+        }
+
+    def _candidate_keys(self, lookup_name: Text, states: List[State]) -> Set[Text]:
+        """Finds the rule keys which can match the latest conversation state.
+
+        Args:
+            lookup_name: name of the lookup to find rule keys in
+            states: the current conversation represented as states
+
+        Returns:
+            rule keys which still need to be checked against the conversation
+        """
+        lookup = self.lookup.get(lookup_name, {})
+        if not states:
+            return set(lookup.keys())
+
+        index = self._rule_indices.get(lookup_name, {})
+        latest_state = states[-1]
+        index_key = self._rule_index_key(latest_state)
+        if index_key is CONVERSATION_START_INDEX_KEY:
+            candidates: Iterable[Text] = index.get(CONVERSATION_START_INDEX_KEY, [])
+        else:
+            # rules which don't constrain a feature are indexed with `None` for it
+            candidates = itertools.chain.from_iterable(
+                index.get(key, [])
+                for key in itertools.product(
+                    *[(value, None) if value else (None,) for value in index_key]
+                )
+            )
+
+        # rules might have been removed from the lookup after indexing
+        return {rule_key for rule_key in candidates if rule_key in lookup}
+
+    def _get_possible_keys(self, lookup_name: Text, states: List[State]) -> Set[Text]:
+        possible_keys = self._candidate_keys(lookup_name, states)
         for i, state in enumerate(reversed(states)):
             # find rule keys that correspond to current state
             possible_keys = set(
@@ -1033,7 +1136,7 @@ class RulePolicy(MemoizationPolicy):
         # to skip the validation of slots for its first execution after an unhappy path.
         returning_from_unhappy_path = False
 
-        rule_keys = self._get_possible_keys(self.lookup[RULES], states)
+        rule_keys = self._get_possible_keys(RULES, states)
         predicted_action_name = None
         best_rule_key = ""
         if rule_keys:
@@ -1047,7 +1150,7 @@ class RulePolicy(MemoizationPolicy):
         if active_loop_name:
             # find rules for unhappy path of the loop
             loop_unhappy_keys = self._get_possible_keys(
-                self.lookup[RULES_FOR_LOOP_UNHAPPY_PATH], states
+                RULES_FOR_LOOP_UNHAPPY_PATH, states
             )
             # there could be several unhappy path conditions
             unhappy_path_conditions = [
@@ -1,4 +1,5 @@
 import copy
+import functools
 import logging
 import structlog
 import os
@@ -6,13 +7,17 @@ from pathlib import Path
 import tarfile
 import time
 from types import LambdaType
-from typing import Any, Dict, List, Optional, Text, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Text, Tuple, Union
 
 from rasa.core.http_interpreter import RasaNLUHttpInterpreter
+from rasa.core.inference import InferenceExecutor, MessageBatcher
 from rasa.engine import loader
 from rasa.engine.constants import PLACEHOLDER_MESSAGE, PLACEHOLDER_TRACKER
 from rasa.engine.runner.dask import DaskGraphRunner
-from rasa.engine.storage.local_model_storage import LocalModelStorage
+from rasa.engine.storage.local_model_storage import (
+    LocalModelStorage,
+    is_model_directory,
+)
 from rasa.engine.storage.storage import ModelMetadata
 from rasa.model import get_latest_model
 from rasa.plugin import plugin_manager
@@ -73,6 +78,7 @@ from rasa.shared.nlu.constants import (
     RESPONSE,
     TEXT,
 )
+from rasa.shared.nlu.training_data.message import Message
 from rasa.utils.endpoints import EndpointConfig
 
 logger = logging.getLogger(__name__)
@@ -81,6 +87,22 @@ structlogger = structlog.get_logger()
 MAX_NUMBER_OF_PREDICTIONS = int(os.environ.get("MAX_NUMBER_OF_PREDICTIONS", "10"))
 
 
+def _uses_inference_executor(f: Callable[..., Any]) -> Callable[..., Any]:
+    """Keeps the inference executor running until the decorated coroutine is done.
+
+    The agent retires the executor of its previous processor when the model is
+    replaced. Coroutines which run the graph several times have to be able to
+    finish with the previous model.
+    """
+
+    @functools.wraps(f)
+    async def decorated(self: "MessageProcessor", *args: Any, **kwargs: Any) -> Any:
+        with self.inference_executor.in_use():
+            return await f(self, *args, **kwargs)
+
+    return decorated
+
+
 class MessageProcessor:
     """The message processor is interface for communicating with a bot model."""
 
@@ -94,6 +116,7 @@ class MessageProcessor:
         max_number_of_predictions: int = MAX_NUMBER_OF_PREDICTIONS,
         on_circuit_break: Optional[LambdaType] = None,
         http_interpreter: Optional[RasaNLUHttpInterpreter] = None,
+        inference_executor: Optional[InferenceExecutor] = None,
     ) -> None:
         """Initializes a `MessageProcessor`."""
         self.nlg = generator
@@ -119,6 +142,16 @@ class MessageProcessor:
         self.model_path = Path(model_path)
         self.domain = self.model_metadata.domain
         self.http_interpreter = http_interpreter
+        self.inference_executor = inference_executor or InferenceExecutor.from_env(
+            self.model_path
+            if self.model_path.is_file() or is_model_directory(self.model_path)
+            else self.model_path / self.model_filename
+        )
+        self.nlu_batcher: Optional[MessageBatcher] = (
+            None
+            if self._nlu_graph_uses_tracker()
+            else MessageBatcher.from_env(self._run_nlu_graph)
+        )
 
     @staticmethod
     def _load_model(
@@ -126,7 +159,7 @@ class MessageProcessor:
     ) -> Tuple[Text, ModelMetadata, GraphRunner]:
         """Unpacks a model from a given path using the graph model loader."""
         try:
-            if os.path.isfile(model_path):
+            if os.path.isfile(model_path) or is_model_directory(model_path):
                 model_tar = model_path
             else:
                 model_file_path = get_latest_model(model_path)
@@ -149,6 +182,27 @@ class MessageProcessor:
             except tarfile.ReadError:
                 raise ModelNotFound(f"Model {model_path} can not be loaded.")
 
+    def warm_up(self) -> None:
+        """Runs the NLU graph once so that the first message isn't slowed down.
+
+        Components like TensorFlow based classifiers build their inference
+        functions during the first prediction. This runs synchronously and is hence
+        meant to be called before the processor starts handling messages.
+        """
+        if self.http_interpreter:
+            return
+
+        self.graph_runner.run(
+            inputs={
+                PLACEHOLDER_MESSAGE: [UserMessage("hello")],
+                PLACEHOLDER_TRACKER: DialogueStateTracker.from_events(
+                    DEFAULT_SENDER_ID, []
+                ),
+            },
+            targets=[self.model_metadata.nlu_target],
+        )
+
+    @_uses_inference_executor
     async def handle_message(
         self, message: UserMessage
     ) -> Optional[List[Dict[Text, Any]]]:
@@ -229,6 +283,7 @@ class MessageProcessor:
             body.update(event.as_dict())
             anonymization_pipeline.run(body)
 
+    @_uses_inference_executor
     async def predict_next_for_sender_id(
         self, sender_id: Text
     ) -> Optional[Dict[Text, Any]]:
@@ -241,7 +296,11 @@ class MessageProcessor:
             The prediction for the next action. `None` if no domain or policies loaded.
         """
         tracker = await self.fetch_tracker_and_update_session(sender_id)
-        result = self.predict_next_with_tracker(tracker)
+        if self.model_metadata.training_type == TrainingType.NLU:
+            result = self.predict_next_with_tracker(tracker)
+        else:
+            prediction = await self._predict_next_with_tracker_in_executor(tracker)
+            result = self._prediction_as_dict(tracker, prediction)
 
         # save tracker state to continue conversation from this state
         await self.save_tracker(tracker)
@@ -271,6 +330,14 @@ class MessageProcessor:
 
         prediction = self._predict_next_with_tracker(tracker)
 
+        return self._prediction_as_dict(tracker, prediction, verbosity)
+
+    def _prediction_as_dict(
+        self,
+        tracker: DialogueStateTracker,
+        prediction: PolicyPrediction,
+        verbosity: EventVerbosity = EventVerbosity.AFTER_RESTART,
+    ) -> Dict[Text, Any]:
         scores = [
             {"action": a, "score": p}
             for a, p in zip(self.domain.action_names_or_texts, prediction.probabilities)
@@ -450,6 +517,7 @@ class MessageProcessor:
 
         return rasa.shared.core.trackers.get_trackers_for_conversation_sessions(tracker)
 
+    @_uses_inference_executor
     async def log_message(
         self, message: UserMessage, should_save_tracker: bool = True
     ) -> DialogueStateTracker:
@@ -520,6 +588,23 @@ class MessageProcessor:
         Raises:
             ActionLimitReached if the limit of actions to predict has been reached.
         """
+        self._check_action_limit(tracker)
+
+        prediction = self._predict_next_with_tracker(tracker)
+
+        return self._action_for_prediction(prediction)
+
+    async def _predict_next_with_tracker_if_should_in_executor(
+        self, tracker: DialogueStateTracker
+    ) -> Tuple[rasa.core.actions.action.Action, PolicyPrediction]:
+        """Same as `predict_next_with_tracker_if_should` without blocking the loop."""
+        self._check_action_limit(tracker)
+
+        prediction = await self._predict_next_with_tracker_in_executor(tracker)
+
+        return self._action_for_prediction(prediction)
+
+    def _check_action_limit(self, tracker: DialogueStateTracker) -> None:
         should_predict_another_action = self.should_predict_another_action(
             tracker.latest_action_name
         )
@@ -529,8 +614,9 @@ class MessageProcessor:
                 "The limit of actions to predict has been reached."
             )
 
-        prediction = self._predict_next_with_tracker(tracker)
-
+    def _action_for_prediction(
+        self, prediction: PolicyPrediction
+    ) -> Tuple[rasa.core.actions.action.Action, PolicyPrediction]:
         action = rasa.core.actions.action.action_for_index(
             prediction.max_confidence_index, self.domain, self.action_endpoint
         )
@@ -570,6 +656,7 @@ class MessageProcessor:
 
         return True  # tracker has probably been restarted
 
+    @_uses_inference_executor
     async def handle_reminder(
         self,
         reminder_event: ReminderScheduled,
@@ -597,6 +684,7 @@ class MessageProcessor:
                     intent, entities, tracker, output_channel
                 )
 
+    @_uses_inference_executor
     async def trigger_external_user_uttered(
         self,
         intent_name: Text,
@@ -699,6 +787,7 @@ class MessageProcessor:
             action_name, self.domain, self.action_endpoint
         )
 
+    @_uses_inference_executor
     async def parse_message(
         self,
         message: UserMessage,
@@ -721,10 +810,48 @@ class MessageProcessor:
         else:
             if tracker is None:
                 tracker = DialogueStateTracker.from_events(message.sender_id, [])
-            parse_data = self._parse_message_with_graph(
+            parse_data = await self._parse_message_with_graph(
                 message, tracker, only_output_properties
             )
 
+        self._postprocess_parse_data(parse_data)
+
+        return parse_data
+
+    @_uses_inference_executor
+    async def parse_messages(
+        self, messages: List[UserMessage], only_output_properties: bool = True
+    ) -> List[Dict[Text, Any]]:
+        """Interprets the passed messages with a single run of the NLU graph.
+
+        Args:
+            messages: Messages to handle.
+            only_output_properties: If `True`, restrict the output to
+                Message.only_output_properties.
+
+        Returns:
+            Parsed data extracted from the messages in the order of the messages.
+        """
+        if not messages:
+            return []
+
+        if self.http_interpreter:
+            parse_data_list = [
+                await self.http_interpreter.parse(message) for message in messages
+            ]
+        else:
+            parsed_messages = await self._run_nlu_graph(messages)
+            parse_data_list = [
+                self._parse_data_from_message(parsed_message, only_output_properties)
+                for parsed_message in parsed_messages
+            ]
+
+        for parse_data in parse_data_list:
+            self._postprocess_parse_data(parse_data)
+
+        return parse_data_list
+
+    def _postprocess_parse_data(self, parse_data: Dict[Text, Any]) -> None:
         self._update_full_retrieval_intent(parse_data)
         structlogger.debug(
             "processor.message.parse",
@@ -735,8 +862,6 @@ class MessageProcessor:
 
         self._check_for_unseen_features(parse_data)
 
-        return parse_data
-
     def _update_full_retrieval_intent(self, parse_data: Dict[Text, Any]) -> None:
         """Update the parse data with the full retrieval intent.
 
@@ -754,7 +879,7 @@ class MessageProcessor:
             )
             parse_data[INTENT][FULL_RETRIEVAL_INTENT_NAME_KEY] = retrieval_intent
 
-    def _parse_message_with_graph(
+    async def _parse_message_with_graph(
         self,
         message: UserMessage,
         tracker: DialogueStateTracker,
@@ -771,12 +896,37 @@ class MessageProcessor:
         Returns:
             Parsed data extracted from the message.
         """
-        results = self.graph_runner.run(
-            inputs={PLACEHOLDER_MESSAGE: [message], PLACEHOLDER_TRACKER: tracker},
+        parsed_message: Message
+        if self.nlu_batcher:
+            # the NLU graph doesn't use the tracker, so that the message can be
+            # parsed together with messages from other conversations
+            parsed_message = await self.nlu_batcher.submit(message)
+        else:
+            parsed_messages = await self._run_nlu_graph([message], tracker)
+            parsed_message = parsed_messages[0]
+
+        return self._parse_data_from_message(parsed_message, only_output_properties)
+
+    async def _run_nlu_graph(
+        self,
+        messages: List[UserMessage],
+        tracker: Optional[DialogueStateTracker] = None,
+    ) -> List[Message]:
+        """Runs the NLU graph for a batch of messages."""
+        if tracker is None:
+            tracker = DialogueStateTracker.from_events(DEFAULT_SENDER_ID, [])
+
+        results = await self.inference_executor.run(
+            self.graph_runner,
+            inputs={PLACEHOLDER_MESSAGE: messages, PLACEHOLDER_TRACKER: tracker},
             targets=[self.model_metadata.nlu_target],
         )
-        parsed_messages = results[self.model_metadata.nlu_target]
-        parsed_message = parsed_messages[0]
+        return results[self.model_metadata.nlu_target]
+
+    @staticmethod
+    def _parse_data_from_message(
+        parsed_message: Message, only_output_properties: bool = True
+    ) -> Dict[Text, Any]:
         parse_data = {
             TEXT: "",
             INTENT: {INTENT_NAME_KEY: None, PREDICTED_CONFIDENCE_KEY: 0.0},
@@ -787,6 +937,16 @@ class MessageProcessor:
         )
         return parse_data
 
+    def _nlu_graph_uses_tracker(self) -> bool:
+        """Checks whether a node of the NLU graph needs the conversation tracker."""
+        nlu_schema = self.model_metadata.predict_schema.minimal_graph_schema(
+            [self.model_metadata.nlu_target]
+        )
+        return any(
+            PLACEHOLDER_TRACKER in node.needs.values()
+            for node in nlu_schema.nodes.values()
+        )
+
     async def _handle_message_with_tracker(
         self, message: UserMessage, tracker: DialogueStateTracker
     ) -> None:
@@ -863,7 +1023,10 @@ class MessageProcessor:
         while should_predict_another_action and self._should_handle_message(tracker):
             # this actually just calls the policy's method by the same name
             try:
-                action, prediction = self.predict_next_with_tracker_if_should(tracker)
+                (
+                    action,
+                    prediction,
+                ) = await self._predict_next_with_tracker_if_should_in_executor(tracker)
             except ActionLimitReached:
                 logger.warning(
                     "Circuit breaker tripped. Stopped predicting "
@@ -1098,6 +1261,35 @@ class MessageProcessor:
         self, tracker: DialogueStateTracker
     ) -> PolicyPrediction:
         """Collect predictions from ensemble and return action and predictions."""
+        followup_prediction = self._predict_followup_action(tracker)
+        if followup_prediction:
+            return followup_prediction
+
+        target = self._core_target()
+        results = self.graph_runner.run(
+            inputs={PLACEHOLDER_TRACKER: tracker}, targets=[target]
+        )
+        policy_prediction = results[target]
+        return policy_prediction
+
+    async def _predict_next_with_tracker_in_executor(
+        self, tracker: DialogueStateTracker
+    ) -> PolicyPrediction:
+        """Same as `_predict_next_with_tracker` without blocking the event loop."""
+        followup_prediction = self._predict_followup_action(tracker)
+        if followup_prediction:
+            return followup_prediction
+
+        target = self._core_target()
+        results = await self.inference_executor.run(
+            self.graph_runner, inputs={PLACEHOLDER_TRACKER: tracker}, targets=[target]
+        )
+        policy_prediction = results[target]
+        return policy_prediction
+
+    def _predict_followup_action(
+        self, tracker: DialogueStateTracker
+    ) -> Optional[PolicyPrediction]:
         followup_action = tracker.followup_action
         if followup_action:
             tracker.clear_followup_action()
@@ -1113,12 +1305,10 @@ class MessageProcessor:
                 "and predict the next action."
             )
 
+        return None
+
+    def _core_target(self) -> Text:
         target = self.model_metadata.core_target
         if not target:
             raise ValueError("Cannot predict next action if there is no core target.")
-
-        results = self.graph_runner.run(
-            inputs={PLACEHOLDER_TRACKER: tracker}, targets=[target]
-        )
-        policy_prediction = results[target]
-        return policy_prediction
+        return target
@@ -312,3 +312,7 @@ async def close_resources(app: Sanic, _: AbstractEventLoop) -> None:
     event_broker = current_agent.tracker_store.event_broker
     if event_broker:
         await event_broker.close()
+
+    await current_agent.tracker_store.close()
+
+    await current_agent.close_endpoint_sessions()
@@ -1,9 +1,11 @@
 from __future__ import annotations
+import asyncio
 import contextlib
 import itertools
 import json
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from inspect import isawaitable, iscoroutinefunction
 
 from time import sleep
@@ -31,7 +33,7 @@ import rasa.shared.utils.cli
 import rasa.shared.utils.common
 import rasa.shared.utils.io
 from rasa.plugin import plugin_manager
-from rasa.shared.core.constants import ACTION_LISTEN_NAME
+from rasa.shared.core.constants import ACTION_LISTEN_NAME, ACTION_SESSION_START_NAME
 from rasa.core.brokers.broker import EventBroker
 from rasa.core.constants import (
     POSTGRESQL_SCHEMA,
@@ -66,9 +68,23 @@ logger = logging.getLogger(__name__)
 POSTGRESQL_DEFAULT_MAX_OVERFLOW = 100
 POSTGRESQL_DEFAULT_POOL_SIZE = 50
 
+# defaults of SQLAlchemy's `QueuePool` which is used for all other server databases
+SQL_DEFAULT_POOL_SIZE = 5
+SQL_DEFAULT_MAX_OVERFLOW = 10
+
 # default value for key prefix in RedisTrackerStore
 DEFAULT_REDIS_TRACKER_STORE_KEY_PREFIX = "tracker:"
 
+# suffixes of the keys which hold the list of serialised events and the state
+# (number of events, index of the latest session start, last event) of a conversation
+# in the RedisTrackerStore
+REDIS_TRACKER_STORE_EVENTS_KEY_SUFFIX = ":events"
+REDIS_TRACKER_STORE_STATE_KEY_SUFFIX = ":state"
+
+REDIS_NUMBER_OF_EVENTS_FIELD = "number_of_events"
+REDIS_SESSION_START_INDEX_FIELD = "session_start_index"
+REDIS_LAST_EVENT_FIELD = "last_event"
+
 
 def check_if_tracker_store_async(tracker_store: TrackerStore) -> bool:
     """Evaluates if a tracker store object is async based on implementation of methods.
@@ -95,6 +111,7 @@ class TrackerDeserialisationException(RasaException):
 
 
 SerializationType = TypeVar("SerializationType")
+T = TypeVar("T")
 
 
 class SerializedTrackerRepresentation(Generic[SerializationType]):
@@ -313,14 +330,26 @@ class TrackerStore:
 
         return tracker
 
+    async def close(self) -> None:
+        """Releases the resources of the tracker store."""
+        # default implementation does nothing
+        pass
+
     async def stream_events(self, tracker: DialogueStateTracker) -> None:
-        """Streams events to a message broker."""
+        """Streams events to a message broker.
+
+        The new events are determined using the events which the tracker store
+        marked as persisted on the tracker. The stored tracker is only retrieved
+        again if it is unknown which events of the tracker were persisted.
+        """
         if self.event_broker is None:
             logger.debug("No event broker configured. Skipping streaming events.")
             return None
 
-        old_tracker = await self.retrieve(tracker.sender_id)
-        new_events = TrackerEventDiffEngine.event_difference(old_tracker, tracker)
+        new_events = tracker.unpersisted_events()
+        if new_events is None:
+            old_tracker = await self.retrieve(tracker.sender_id)
+            new_events = TrackerEventDiffEngine.event_difference(old_tracker, tracker)
 
         await self._stream_new_events(self.event_broker, new_events, tracker.sender_id)
 
@@ -331,10 +360,14 @@ class TrackerStore:
         sender_id: Text,
     ) -> None:
         """Publishes new tracker events to a message broker."""
+        bodies = []
         for event in new_events:
             body = {"sender_id": sender_id}
             body.update(event.as_dict())
-            event_broker.publish(body)
+            bodies.append(body)
+
+        if bodies:
+            event_broker.publish_many(bodies)
 
     async def keys(self) -> Iterable[Text]:
         """Returns the set of values for the tracker store's primary key."""
@@ -387,6 +420,7 @@ class InMemoryTrackerStore(TrackerStore, SerializedTrackerAsText):
         await self.stream_events(tracker)
         serialised = InMemoryTrackerStore.serialise_tracker(tracker)
         self.store[tracker.sender_id] = serialised
+        tracker.mark_events_as_persisted()
 
     async def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
         """Returns tracker matching sender_id."""
@@ -427,18 +461,18 @@ class InMemoryTrackerStore(TrackerStore, SerializedTrackerAsText):
             logger.debug(f"Could not find tracker for conversation ID '{sender_id}'.")
             return None
 
-        if fetch_all_sessions:
-            return tracker
-
-        # only return the last session
-        multiple_tracker_sessions = (
-            rasa.shared.core.trackers.get_trackers_for_conversation_sessions(tracker)
-        )
-
-        if 0 <= len(multiple_tracker_sessions) <= 1:
-            return tracker
+        if not fetch_all_sessions:
+            # only return the last session
+            multiple_tracker_sessions = (
+                rasa.shared.core.trackers.get_trackers_for_conversation_sessions(
+                    tracker
+                )
+            )
+            if len(multiple_tracker_sessions) > 1:
+                tracker = multiple_tracker_sessions[-1]
 
-        return multiple_tracker_sessions[-1]
+        tracker.mark_events_as_persisted()
+        return tracker
 
 
 class RedisTrackerStore(TrackerStore, SerializedTrackerAsText):
@@ -497,26 +531,174 @@ class RedisTrackerStore(TrackerStore, SerializedTrackerAsText):
     def _get_key_prefix(self) -> Text:
         return self.key_prefix
 
+    def _events_key(self, sender_id: Text) -> Text:
+        return self.key_prefix + sender_id + REDIS_TRACKER_STORE_EVENTS_KEY_SUFFIX
+
+    def _state_key(self, sender_id: Text) -> Text:
+        return self.key_prefix + sender_id + REDIS_TRACKER_STORE_STATE_KEY_SUFFIX
+
     async def save(
         self, tracker: DialogueStateTracker, timeout: Optional[float] = None
     ) -> None:
-        """Saves the current conversation state."""
+        """Saves the current conversation state.
+
+        Only the events which were not persisted yet are appended to the list of
+        events of the conversation.
+        """
         await self.stream_events(tracker)
 
         if not timeout and self.record_exp:
             timeout = self.record_exp
 
-        stored = self.red.get(self.key_prefix + tracker.sender_id)
+        sender_id = tracker.sender_id
+        state = self._retrieve_state(sender_id)
+        new_events = self._new_events(tracker, state)
+
+        with self.red.pipeline() as pipeline:
+            if new_events:
+                pipeline.rpush(self._events_key(sender_id), *new_events)
+            pipeline.hset(
+                self._state_key(sender_id),
+                mapping=self._updated_state(state, new_events),
+            )
+            if timeout:
+                pipeline.expire(self._events_key(sender_id), int(timeout))
+                pipeline.expire(self._state_key(sender_id), int(timeout))
+            pipeline.execute()
 
-        if stored is not None:
-            prior_tracker = self.deserialise_tracker(tracker.sender_id, stored)
+        tracker.mark_events_as_persisted()
 
-            tracker = self._merge_trackers(prior_tracker, tracker)
+    def _new_events(
+        self, tracker: DialogueStateTracker, state: Dict[Text, Text]
+    ) -> List[Text]:
+        """Returns the serialised events of `tracker` which weren't persisted yet.
+
+        Args:
+            tracker: The tracker which is saved.
+            state: The persisted state of the conversation.
+
+        Returns:
+            The serialised events which have to be appended to the stored events.
+        """
+        unpersisted_events = tracker.unpersisted_events()
+        # the stored events might have expired since the tracker was retrieved
+        if state and unpersisted_events is not None:
+            return [json.dumps(event.as_dict()) for event in unpersisted_events]
+
+        last_event = state.get(REDIS_LAST_EVENT_FIELD)
+        events = list(tracker.events)
+
+        new_events: List[Text] = []
+        # the tracker usually contains the persisted events followed by a few new
+        # events, hence we look for the last persisted event starting from the end
+        for event in reversed(events):
+            serialised_event = json.dumps(event.as_dict())
+            if serialised_event == last_event:
+                new_events.reverse()
+                return new_events
+            new_events.append(serialised_event)
+
+        if last_event is None:
+            new_events.reverse()
+            return new_events
+
+        # the tracker doesn't contain the last persisted event, e.g. because it
+        # only contains a different conversation session, so we only append
+        # events which aren't stored yet
+        stored_events = set(self.red.lrange(self._events_key(tracker.sender_id), 0, -1))
+        new_events = []
+        for event in events:
+            serialised_event = json.dumps(event.as_dict())
+            if serialised_event not in stored_events:
+                stored_events.add(serialised_event)
+                new_events.append(serialised_event)
+
+        return new_events
+
+    @staticmethod
+    def _updated_state(
+        state: Dict[Text, Text], new_events: List[Text]
+    ) -> Dict[Text, Any]:
+        """Returns the conversation state after appending `new_events`.
+
+        Args:
+            state: The persisted state of the conversation.
+            new_events: The serialised events which are appended.
 
-        serialised_tracker = self.serialise_tracker(tracker)
-        self.red.set(
-            self.key_prefix + tracker.sender_id, serialised_tracker, ex=timeout
+        Returns:
+            The state which has to be persisted together with the new events.
+        """
+        number_of_events = int(state.get(REDIS_NUMBER_OF_EVENTS_FIELD, 0))
+        session_start_index = int(state.get(REDIS_SESSION_START_INDEX_FIELD, 0))
+
+        for index, serialised_event in enumerate(new_events):
+            event = json.loads(serialised_event)
+            if (
+                event.get("event") == ActionExecuted.type_name
+                and event.get("name") == ACTION_SESSION_START_NAME
+            ):
+                session_start_index = number_of_events + index
+
+        updated_state: Dict[Text, Any] = {
+            REDIS_NUMBER_OF_EVENTS_FIELD: number_of_events + len(new_events),
+            REDIS_SESSION_START_INDEX_FIELD: session_start_index,
+        }
+        if new_events:
+            updated_state[REDIS_LAST_EVENT_FIELD] = new_events[-1]
+
+        return updated_state
+
+    def _retrieve_state(self, sender_id: Text) -> Dict[Text, Text]:
+        """Returns the persisted state of a conversation.
+
+        Trackers which were stored as a single serialised tracker are migrated to
+        a list of events.
+
+        Args:
+            sender_id: Conversation ID to fetch the state for.
+
+        Returns:
+            The state of the conversation or an empty dictionary if there is none.
+        """
+        state = self.red.hgetall(self._state_key(sender_id))
+        if state:
+            return state
+
+        return self._migrate_serialised_tracker(sender_id)
+
+    def _migrate_serialised_tracker(self, sender_id: Text) -> Dict[Text, Text]:
+        """Converts a tracker stored as a single serialised tracker to a list of events.
+
+        Args:
+            sender_id: Conversation ID of the tracker to migrate.
+
+        Returns:
+            The state of the migrated conversation or an empty dictionary if there
+            is no serialised tracker for this conversation.
+        """
+        serialised_tracker_key = self.key_prefix + sender_id
+        stored = self.red.get(serialised_tracker_key)
+        if stored is None:
+            return {}
+
+        logger.debug(
+            f"Migrating tracker for conversation ID '{sender_id}' to a list of events."
         )
+        events = [json.dumps(event) for event in json.loads(stored).get("events") or []]
+        state = self._updated_state({}, events)
+        time_to_live = self.red.ttl(serialised_tracker_key)
+
+        with self.red.pipeline() as pipeline:
+            if events:
+                pipeline.rpush(self._events_key(sender_id), *events)
+            pipeline.hset(self._state_key(sender_id), mapping=state)
+            if time_to_live and time_to_live > 0:
+                pipeline.expire(self._events_key(sender_id), time_to_live)
+                pipeline.expire(self._state_key(sender_id), time_to_live)
+            pipeline.delete(serialised_tracker_key)
+            pipeline.execute()
+
+        return {key: str(value) for key, value in state.items()}
 
     async def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
         """Retrieves tracker for the latest conversation session.
@@ -555,66 +737,46 @@ class RedisTrackerStore(TrackerStore, SerializedTrackerAsText):
             sender_id: Conversation ID to fetch the tracker for.
             fetch_all_sessions: Whether to fetch all sessions or only the last one.
         """
-        stored = self.red.get(self.key_prefix + sender_id)
-        if stored is None:
+        state = self._retrieve_state(sender_id)
+        if not state:
             logger.debug(f"Could not find tracker for conversation ID '{sender_id}'.")
             return None
 
-        tracker = self.deserialise_tracker(sender_id, stored)
-        if fetch_all_sessions:
-            return tracker
+        # only fetch the events of the last session if requested
+        start = 0 if fetch_all_sessions else int(state[REDIS_SESSION_START_INDEX_FIELD])
+        events = self.red.lrange(self._events_key(sender_id), start, -1)
 
-        # only return the last session
-        multiple_tracker_sessions = (
-            rasa.shared.core.trackers.get_trackers_for_conversation_sessions(tracker)
+        tracker = self.init_tracker(sender_id)
+        tracker.recreate_from_dialogue(
+            Dialogue.from_parameters(
+                {"name": sender_id, "events": [json.loads(event) for event in events]}
+            )
         )
+        tracker.mark_events_as_persisted()
 
-        if 0 <= len(multiple_tracker_sessions) <= 1:
-            return tracker
-
-        return multiple_tracker_sessions[-1]
+        return tracker
 
     async def keys(self) -> Iterable[Text]:
-        """Returns keys of the Redis Tracker Store."""
-        return self.red.keys(self.key_prefix + "*")
+        """Returns the conversation IDs of the Redis Tracker Store.
 
-    @staticmethod
-    def _merge_trackers(
-        prior_tracker: DialogueStateTracker, tracker: DialogueStateTracker
-    ) -> DialogueStateTracker:
-        """Merges two trackers.
-
-        Args:
-            prior_tracker: Tracker containing events from the previous conversation
-                sessions.
-            tracker: Tracker containing events from the current conversation session.
+        Every conversation has a state hash. Trackers which were stored as a single
+        serialised tracker by older Rasa versions and weren't migrated yet are
+        strings stored under the prefixed conversation ID.
         """
-        if not prior_tracker.events:
-            return tracker
-
-        last_event_timestamp = prior_tracker.events[-1].timestamp
-        past_tracker = tracker.travel_back_in_time(target_time=last_event_timestamp)
-
-        if past_tracker.events == prior_tracker.events:
-            return tracker
-
-        merged = tracker.init_copy()
-        merged.update_with_events(
-            list(prior_tracker.events), override_timestamp=False, domain=None
+        state_suffix_length = len(REDIS_TRACKER_STORE_STATE_KEY_SUFFIX)
+        conversation_ids = {
+            key[len(self.key_prefix) : -state_suffix_length]
+            for key in self.red.scan_iter(
+                match=f"{self.key_prefix}*{REDIS_TRACKER_STORE_STATE_KEY_SUFFIX}",
+                _type="HASH",
+            )
+        }
+        conversation_ids.update(
+            key[len(self.key_prefix) :]
+            for key in self.red.scan_iter(match=f"{self.key_prefix}*", _type="STRING")
         )
 
-        for new_event in tracker.events:
-            # Event subclasses implement `__eq__` method that make it difficult
-            # to compare events. We use `as_dict` to compare events.
-            if all(
-                [
-                    new_event.as_dict() != existing_event.as_dict()
-                    for existing_event in merged.events
-                ]
-            ):
-                merged.update(new_event)
-
-        return merged
+        return conversation_ids
 
 
 class DynamoTrackerStore(TrackerStore, SerializedTrackerAsDict):
@@ -679,6 +841,7 @@ class DynamoTrackerStore(TrackerStore, SerializedTrackerAsDict):
         serialized = self.serialise_tracker(tracker)
 
         self.db.put_item(Item=serialized)
+        tracker.mark_events_as_persisted()
 
     @staticmethod
     def serialise_tracker(
@@ -742,7 +905,10 @@ class DynamoTrackerStore(TrackerStore, SerializedTrackerAsDict):
         else:
             slots = self.domain.slots
 
-        return DialogueStateTracker.from_dict(sender_id, events_with_floats, slots)
+        tracker = DialogueStateTracker.from_dict(sender_id, events_with_floats, slots)
+        tracker.mark_events_as_persisted()
+
+        return tracker
 
     async def keys(self) -> Iterable[Text]:
         """Returns sender_ids of the `DynamoTrackerStore`."""
@@ -830,6 +996,7 @@ class MongoTrackerStore(TrackerStore, SerializedTrackerAsText):
             },
             upsert=True,
         )
+        tracker.mark_events_as_persisted()
 
     def _additional_events(self, tracker: DialogueStateTracker) -> Iterator:
         """Return events from the tracker which aren't currently stored.
@@ -841,6 +1008,10 @@ class MongoTrackerStore(TrackerStore, SerializedTrackerAsText):
             List of serialised events that aren't currently stored.
 
         """
+        unpersisted_events = tracker.unpersisted_events()
+        if unpersisted_events is not None:
+            return iter(unpersisted_events)
+
         stored = self.conversations.find_one({"sender_id": tracker.sender_id}) or {}
         all_events = self._events_from_serialized_tracker(stored)
 
@@ -909,7 +1080,10 @@ class MongoTrackerStore(TrackerStore, SerializedTrackerAsText):
         if not events:
             return None
 
-        return DialogueStateTracker.from_dict(sender_id, events, self.domain.slots)
+        tracker = DialogueStateTracker.from_dict(sender_id, events, self.domain.slots)
+        tracker.mark_events_as_persisted()
+
+        return tracker
 
     async def retrieve_full_tracker(
         self, conversation_id: Text
@@ -922,9 +1096,12 @@ class MongoTrackerStore(TrackerStore, SerializedTrackerAsText):
         if not events:
             return None
 
-        return DialogueStateTracker.from_dict(
+        tracker = DialogueStateTracker.from_dict(
             conversation_id, events, self.domain.slots
         )
+        tracker.mark_events_as_persisted()
+
+        return tracker
 
     async def keys(self) -> Iterable[Text]:
         """Returns sender_ids of the Mongo Tracker Store."""
@@ -963,17 +1140,50 @@ def is_postgresql_url(url: Union[Text, "URL"]) -> bool:
     return url.drivername == "postgresql"
 
 
-def create_engine_kwargs(url: Union[Text, "URL"]) -> Dict[Text, Any]:
+def is_sqlite_url(url: Union[Text, "URL"]) -> bool:
+    """Determine whether `url` configures a SQLite connection.
+
+    Args:
+        url: SQL connection URL.
+
+    Returns:
+        `True` if `url` is a SQLite connection URL.
+    """
+    if isinstance(url, str):
+        return url.startswith("sqlite")
+
+    return url.drivername.startswith("sqlite")
+
+
+def create_engine_kwargs(
+    url: Union[Text, "URL"],
+    pool_size: Optional[int] = None,
+    max_overflow: Optional[int] = None,
+) -> Dict[Text, Any]:
     """Get `sqlalchemy.create_engine()` kwargs.
 
     Args:
         url: SQL connection URL.
+        pool_size: Number of connections to keep in the connection pool. Overrides
+            the value of the `SQL_POOL_SIZE` environment variable.
+        max_overflow: Number of connections which can be opened on top of
+            `pool_size`. Overrides the value of the `SQL_MAX_OVERFLOW` environment
+            variable.
 
     Returns:
         kwargs to be passed into `sqlalchemy.create_engine()`.
     """
     if not is_postgresql_url(url):
-        return {}
+        if is_sqlite_url(url):
+            # SQLite doesn't use a `QueuePool` which could be configured
+            return {}
+
+        pool_kwargs: Dict[Text, Any] = {}
+        if pool_size is not None:
+            pool_kwargs["pool_size"] = pool_size
+        if max_overflow is not None:
+            pool_kwargs["max_overflow"] = max_overflow
+        return pool_kwargs
 
     kwargs: Dict[Text, Any] = {}
 
@@ -987,16 +1197,55 @@ def create_engine_kwargs(url: Union[Text, "URL"]) -> Dict[Text, Any]:
     # connections that are kept in the connection pool. Not available
     # for SQLite, and only  tested for PostgreSQL. See
     # https://docs.sqlalchemy.org/en/13/core/pooling.html#sqlalchemy.pool.QueuePool
-    kwargs["pool_size"] = int(
-        os.environ.get(POSTGRESQL_POOL_SIZE, POSTGRESQL_DEFAULT_POOL_SIZE)
+    kwargs["pool_size"] = (
+        pool_size
+        if pool_size is not None
+        else int(os.environ.get(POSTGRESQL_POOL_SIZE, POSTGRESQL_DEFAULT_POOL_SIZE))
     )
-    kwargs["max_overflow"] = int(
-        os.environ.get(POSTGRESQL_MAX_OVERFLOW, POSTGRESQL_DEFAULT_MAX_OVERFLOW)
+    kwargs["max_overflow"] = (
+        max_overflow
+        if max_overflow is not None
+        else int(
+            os.environ.get(POSTGRESQL_MAX_OVERFLOW, POSTGRESQL_DEFAULT_MAX_OVERFLOW)
+        )
     )
 
     return kwargs
 
 
+def number_of_sql_workers(
+    url: Union[Text, "URL"], engine_kwargs: Dict[Text, Any]
+) -> int:
+    """Get the number of threads which should run the blocking SQL round trips.
+
+    The number matches the number of connections the engine's connection pool can
+    hand out, so that every connection can be in use at the same time without
+    blocking the event loop.
+
+    Args:
+        url: SQL connection URL.
+        engine_kwargs: kwargs which were passed into `sqlalchemy.create_engine()`.
+
+    Returns:
+        Number of worker threads. `0` if the database is an in-memory SQLite
+        database: every thread gets a separate in-memory database in this case, so
+        that the queries have to run on the thread which created the tables.
+    """
+    url = sa.engine.url.make_url(url)
+
+    if is_sqlite_url(url):
+        if url.database in (None, "", ":memory:"):
+            return 0
+        # SQLite only allows a single writer at a time
+        return 1
+
+    return max(
+        engine_kwargs.get("pool_size", SQL_DEFAULT_POOL_SIZE)
+        + engine_kwargs.get("max_overflow", SQL_DEFAULT_MAX_OVERFLOW),
+        1,
+    )
+
+
 def ensure_schema_exists(session: "Session") -> None:
     """Ensure that the requested PostgreSQL schema exists in the database.
 
@@ -1058,6 +1307,16 @@ class SQLTrackerStore(TrackerStore, SerializedTrackerAsText):
         action_name = sa.Column(sa.String(255))
         data = sa.Column(sa.Text)
 
+        __table_args__ = (
+            # used to find the latest `SessionStarted` event of a conversation
+            sa.Index(
+                "ix_events_sender_id_type_name_timestamp",
+                "sender_id",
+                "type_name",
+                "timestamp",
+            ),
+        )
+
     def __init__(
         self,
         domain: Optional[Domain] = None,
@@ -1070,6 +1329,8 @@ class SQLTrackerStore(TrackerStore, SerializedTrackerAsText):
         event_broker: Optional[EventBroker] = None,
         login_db: Optional[Text] = None,
         query: Optional[Dict] = None,
+        pool_size: Optional[int] = None,
+        max_overflow: Optional[int] = None,
         **kwargs: Dict[Text, Any],
     ) -> None:
         import sqlalchemy.exc
@@ -1080,7 +1341,14 @@ class SQLTrackerStore(TrackerStore, SerializedTrackerAsText):
             dialect, host, port, db, username, password, login_db, query
         )
 
-        self.engine = sa.create_engine(engine_url, **create_engine_kwargs(engine_url))
+        engine_kwargs = create_engine_kwargs(engine_url, pool_size, max_overflow)
+        self.engine = sa.create_engine(engine_url, **engine_kwargs)
+        max_workers = number_of_sql_workers(engine_url, engine_kwargs)
+        self._executor = (
+            ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="rasa-sql")
+            if max_workers
+            else None
+        )
 
         logger.debug(
             f"Attempting to connect to database via '{repr(self.engine.url)}'."
@@ -1096,6 +1364,9 @@ class SQLTrackerStore(TrackerStore, SerializedTrackerAsText):
 
                 try:
                     self.Base.metadata.create_all(self.engine)
+                    # `create_all` doesn't add new indices to existing tables
+                    for index in self.SQLEvent.__table__.indexes:
+                        index.create(bind=self.engine, checkfirst=True)
                 except (
                     sqlalchemy.exc.OperationalError,
                     sqlalchemy.exc.ProgrammingError,
@@ -1243,8 +1514,26 @@ class SQLTrackerStore(TrackerStore, SerializedTrackerAsText):
         finally:
             session.close()
 
+    async def _run_in_executor(self, func: Callable[..., T], *args: Any) -> T:
+        """Runs a blocking database operation without blocking the event loop."""
+        if self._executor is None:
+            return func(*args)
+
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, func, *args
+        )
+
+    async def close(self) -> None:
+        """Waits for the running database operations and closes the connections."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        self.engine.dispose()
+
     async def keys(self) -> Iterable[Text]:
         """Returns sender_ids of the SQLTrackerStore."""
+        return await self._run_in_executor(self._keys)
+
+    def _keys(self) -> List[Text]:
         with self.session_scope() as session:
             sender_ids = session.query(self.SQLEvent.sender_id).distinct().all()
             return [sender_id for (sender_id,) in sender_ids]
@@ -1264,28 +1553,36 @@ class SQLTrackerStore(TrackerStore, SerializedTrackerAsText):
     async def _retrieve(
         self, sender_id: Text, fetch_events_from_all_sessions: bool
     ) -> Optional[DialogueStateTracker]:
-        with self.session_scope() as session:
+        events = await self._run_in_executor(
+            self._retrieve_events, sender_id, fetch_events_from_all_sessions
+        )
+
+        if self.domain and len(events) > 0:
+            logger.debug(f"Recreating tracker from sender id '{sender_id}'")
+            tracker = DialogueStateTracker.from_dict(
+                sender_id, events, self.domain.slots
+            )
+            tracker.mark_events_as_persisted()
+            return tracker
+        else:
+            logger.debug(
+                f"Can't retrieve tracker matching "
+                f"sender id '{sender_id}' from SQL storage. "
+                f"Returning `None` instead."
+            )
+            return None
 
+    def _retrieve_events(
+        self, sender_id: Text, fetch_events_from_all_sessions: bool
+    ) -> List[Dict[Text, Any]]:
+        with self.session_scope() as session:
             serialised_events = self._event_query(
                 session,
                 sender_id,
                 fetch_events_from_all_sessions=fetch_events_from_all_sessions,
             ).all()
 
-            events = [json.loads(event.data) for event in serialised_events]
-
-            if self.domain and len(events) > 0:
-                logger.debug(f"Recreating tracker from sender id '{sender_id}'")
-                return DialogueStateTracker.from_dict(
-                    sender_id, events, self.domain.slots
-                )
-            else:
-                logger.debug(
-                    f"Can't retrieve tracker matching "
-                    f"sender id '{sender_id}' from SQL storage. "
-                    f"Returning `None` instead."
-                )
-                return None
+            return [json.loads(event.data) for event in serialised_events]
 
     def _event_query(
         self, session: "Session", sender_id: Text, fetch_events_from_all_sessions: bool
@@ -1334,10 +1631,17 @@ class SQLTrackerStore(TrackerStore, SerializedTrackerAsText):
         """Update database with events from the current conversation."""
         await self.stream_events(tracker)
 
+        await self._run_in_executor(self._save_events, tracker)
+
+        tracker.mark_events_as_persisted()
+        logger.debug(f"Tracker with sender_id '{tracker.sender_id}' stored to database")
+
+    def _save_events(self, tracker: DialogueStateTracker) -> None:
         with self.session_scope() as session:
             # only store recent events
             events = self._additional_events(session, tracker)
 
+            rows = []
             for event in events:
                 data = event.as_dict()
                 intent = (
@@ -1346,25 +1650,29 @@ class SQLTrackerStore(TrackerStore, SerializedTrackerAsText):
                 action = data.get("name")
                 timestamp = data.get("timestamp")
 
-                # noinspection PyArgumentList
-                session.add(
-                    self.SQLEvent(
-                        sender_id=tracker.sender_id,
-                        type_name=event.type_name,
-                        timestamp=timestamp,
-                        intent_name=intent,
-                        action_name=action,
-                        data=json.dumps(data),
-                    )
+                rows.append(
+                    {
+                        "sender_id": tracker.sender_id,
+                        "type_name": event.type_name,
+                        "timestamp": timestamp,
+                        "intent_name": intent,
+                        "action_name": action,
+                        "data": json.dumps(data),
+                    }
                 )
-            session.commit()
 
-        logger.debug(f"Tracker with sender_id '{tracker.sender_id}' stored to database")
+            if rows:
+                session.execute(self.SQLEvent.__table__.insert(), rows)
+            session.commit()
 
     def _additional_events(
         self, session: "Session", tracker: DialogueStateTracker
-    ) -> Iterator:
+    ) -> Iterable[Event]:
         """Return events from the tracker which aren't currently stored."""
+        unpersisted_events = tracker.unpersisted_events()
+        if unpersisted_events is not None:
+            return unpersisted_events
+
         number_of_events_since_last_session = self._event_query(
             session, tracker.sender_id, fetch_events_from_all_sessions=False
         ).count()
@@ -1450,6 +1758,10 @@ class FailSafeTrackerStore(TrackerStore):
             self.on_tracker_store_error(e)
             return []
 
+    async def close(self) -> None:
+        """Calls `close` method of primary tracker store."""
+        await self._tracker_store.close()
+
     async def save(self, tracker: DialogueStateTracker) -> None:
         """Calls `save` method of primary tracker store."""
         try:
@@ -1648,6 +1960,11 @@ class AwaitableTrackerStore(TrackerStore):
         result = self._tracker_store.keys()
         return await result if isawaitable(result) else result
 
+    async def close(self) -> None:
+        """Wrapper to call `close` method of primary tracker store."""
+        result = self._tracker_store.close()
+        return await result if isawaitable(result) else result
+
     async def save(self, tracker: DialogueStateTracker) -> None:
         """Wrapper to call `save` method of primary tracker store."""
         result = self._tracker_store.save(tracker)
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import abc
+from dataclasses import dataclass
 import logging
 import os
 import shutil
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Text, Any, Optional, Tuple, List
 
@@ -35,6 +37,19 @@ CACHE_LOCATION_ENV = "RASA_CACHE_DIRECTORY"
 CACHE_DB_NAME_ENV = "RASA_CACHE_NAME"
 CACHE_SIZE_ENV = "RASA_MAX_CACHE_SIZE"
 
+# results are moved to the cache directory before their cache entry is added,
+# content which isn't tracked yet is hence only deleted once it's this old
+UNTRACKED_CONTENT_GRACE_PERIOD = timedelta(hours=1)
+
+
+@dataclass
+class CacheStatistics:
+    """Describes the content of a `LocalTrainingCache`."""
+
+    number_of_entries: int
+    number_of_results: int
+    size_in_bytes: int
+
 
 class TrainingCache(abc.ABC):
     """Stores training results in a persistent cache.
@@ -162,13 +177,19 @@ class LocalTrainingCache(TrainingCache):
         rasa_version = sa.Column(sa.String(255), nullable=False)
         result_location = sa.Column(sa.String())
         result_type = sa.Column(sa.String())
+        result_size = sa.Column(sa.BigInteger())
 
-    def __init__(self) -> None:
+    def __init__(self, read_only: bool = False) -> None:
         """Creates cache.
 
         The `Cache` setting can be configured via environment variables.
+
+        Args:
+            read_only: If `True`, the cache is only inspected and neither the cache
+                directory nor the cache database are changed.
         """
         self._cache_location = LocalTrainingCache._get_cache_location()
+        self._read_only = read_only
 
         self._max_cache_size = float(
             os.environ.get(CACHE_SIZE_ENV, DEFAULT_CACHE_SIZE_MB)
@@ -178,6 +199,10 @@ class LocalTrainingCache(TrainingCache):
             CACHE_DB_NAME_ENV, DEFAULT_CACHE_NAME
         )
 
+        if read_only:
+            self._sessionmaker = self._open_database_read_only()
+            return
+
         if not self._cache_location.exists() and not self._is_disabled():
             logger.debug(
                 f"Creating caching directory '{self._cache_location}' because "
@@ -188,6 +213,17 @@ class LocalTrainingCache(TrainingCache):
         self._sessionmaker = self._create_database()
 
         self._drop_cache_entries_from_incompatible_versions()
+        self._add_missing_result_sizes()
+
+    @property
+    def location(self) -> Path:
+        """Returns the directory which contains the cached results."""
+        return self._cache_location
+
+    @property
+    def max_size_in_mb(self) -> float:
+        """Returns the maximum size of the cached results in MiB."""
+        return self._max_cache_size
 
     @staticmethod
     def _get_cache_location() -> Path:
@@ -206,9 +242,105 @@ class LocalTrainingCache(TrainingCache):
             URL.create(drivername="sqlite", database=database), future=True
         )
         self.Base.metadata.create_all(engine)
+        self._add_result_size_column(engine)
+
+        return sa.orm.sessionmaker(engine)
 
+    def _open_database_read_only(self) -> sqlalchemy.orm.sessionmaker:
+        database = self._cache_location / self._cache_database_name
+        if self._is_disabled() or not database.is_file():
+            engine = sa.create_engine(
+                URL.create(drivername="sqlite", database=""), future=True
+            )
+            self.Base.metadata.create_all(engine)
+        else:
+            engine = sa.create_engine(
+                URL.create(
+                    drivername="sqlite",
+                    database=f"file:{database}?mode=ro",
+                    query={"uri": "true"},
+                ),
+                future=True,
+            )
+
+        self._has_result_sizes = self._has_result_size_column(engine)
         return sa.orm.sessionmaker(engine)
 
+    def _has_result_size_column(self, engine: sa.engine.Engine) -> bool:
+        columns = sa.inspect(engine).get_columns(self.CacheEntry.__tablename__)
+        return any(column["name"] == "result_size" for column in columns)
+
+    def _add_result_size_column(self, engine: sa.engine.Engine) -> None:
+        # caches which were created by older Rasa versions don't have this column
+        self._has_result_sizes = True
+        if self._has_result_size_column(engine):
+            return
+
+        try:
+            with engine.begin() as connection:
+                connection.execute(
+                    sa.text(
+                        f"ALTER TABLE {self.CacheEntry.__tablename__} "
+                        f"ADD COLUMN result_size BIGINT"
+                    )
+                )
+        except OperationalError as e:
+            # another process might have added the column in the meantime
+            logger.debug(f"Failed to add the result size column to the cache: {e}")
+
+    def _add_missing_result_sizes(self) -> None:
+        with self._sessionmaker.begin() as session:
+            query = sa.select(self.CacheEntry).where(
+                self.CacheEntry.result_size == sa.null()
+            )
+            for entry in session.execute(query).scalars():
+                entry.result_size = self._result_size(entry.result_location)
+
+    @staticmethod
+    def _result_size(result_location: Optional[Text]) -> int:
+        if not result_location or not Path(result_location).is_dir():
+            return 0
+
+        return rasa.utils.common.directory_size_in_bytes(Path(result_location))
+
+    def _delete_untracked_content(self) -> int:
+        """Deletes content of the cache directory which the database doesn't track.
+
+        Content which was changed within the `UNTRACKED_CONTENT_GRACE_PERIOD` is
+        kept, as other processes which share the cache might not have added the
+        cache entry for it yet.
+
+        Returns:
+            The number of deleted files and directories.
+        """
+        with self._sessionmaker() as session:
+            query = sa.select(self.CacheEntry.result_location).where(
+                self.CacheEntry.result_location != sa.null()
+            )
+            tracked_names = {
+                Path(location).name for location in session.execute(query).scalars()
+            }
+
+        changed_since = time.time() - UNTRACKED_CONTENT_GRACE_PERIOD.total_seconds()
+        number_of_deleted_items = 0
+        for item in self._cache_location.glob("*"):
+            # the database might be accompanied by journal files
+            if (
+                item.name in tracked_names
+                or item.name.startswith(self._cache_database_name)
+                or item.stat().st_mtime > changed_since
+            ):
+                continue
+
+            logger.debug(f"Deleting '{item}' as it's not tracked by the cache.")
+            if item.is_dir():
+                shutil.rmtree(item)
+            else:
+                item.unlink()
+            number_of_deleted_items += 1
+
+        return number_of_deleted_items
+
     def _drop_cache_entries_from_incompatible_versions(self) -> None:
         incompatible_entries = self._find_incompatible_cache_entries()
 
@@ -262,16 +394,18 @@ class LocalTrainingCache(TrainingCache):
         model_storage: ModelStorage,
     ) -> None:
         """Adds the output to the cache (see parent class for full docstring)."""
-        if self._is_disabled():
+        if self._is_disabled() or self._read_only:
             return
 
-        cache_dir, output_type = None, None
+        cache_dir, output_type, output_size = None, None, 0
         if isinstance(output, Cacheable):
-            cache_dir, output_type = self._cache_output_to_disk(output, model_storage)
+            cache_dir, output_type, output_size = self._cache_output_to_disk(
+                output, model_storage
+            )
 
         try:
             self._add_cache_entry(
-                cache_dir, fingerprint_key, output_fingerprint, output_type
+                cache_dir, fingerprint_key, output_fingerprint, output_type, output_size
             )
         except OperationalError:
             if cache_dir:
@@ -285,6 +419,7 @@ class LocalTrainingCache(TrainingCache):
         fingerprint_key: Text,
         output_fingerprint: Text,
         output_type: Text,
+        output_size: int,
     ) -> None:
         with self._sessionmaker.begin() as session:
             cache_entry = self.CacheEntry(
@@ -294,15 +429,20 @@ class LocalTrainingCache(TrainingCache):
                 rasa_version=rasa.__version__,
                 result_location=cache_dir,
                 result_type=output_type,
+                result_size=output_size,
             )
             session.merge(cache_entry)
 
     def _is_disabled(self) -> bool:
         return self._max_cache_size == 0.0
 
+    @staticmethod
+    def _mb_to_bytes(size_in_mb: float) -> float:
+        return size_in_mb * 1_048_576
+
     def _cache_output_to_disk(
         self, output: Cacheable, model_storage: ModelStorage
-    ) -> Tuple[Optional[Text], Optional[Text]]:
+    ) -> Tuple[Optional[Text], Optional[Text], int]:
         tempdir_name = rasa.utils.common.get_temp_dir_name()
 
         # Use `TempDirectoryPath` instead of `tempfile.TemporaryDirectory` as this
@@ -322,65 +462,142 @@ class LocalTrainingCache(TrainingCache):
                     f"Caching output of type '{type(output).__name__}' failed with the "
                     f"following error:\n{e}"
                 )
-                return None, None
+                return None, None, 0
 
-            output_size = rasa.utils.common.directory_size_in_mb(tmp_path)
-            if output_size > self._max_cache_size:
+            output_size = rasa.utils.common.directory_size_in_bytes(tmp_path)
+            max_cache_size = self._mb_to_bytes(self._max_cache_size)
+            if output_size > max_cache_size:
                 logger.debug(
                     f"Caching result of type '{type(output).__name__}' was skipped "
                     f"because it exceeds the maximum cache size of "
                     f"{self._max_cache_size} MiB."
                 )
-                return None, None
+                return None, None, 0
 
-            while (
-                rasa.utils.common.directory_size_in_mb(
-                    self._cache_location,
-                    filenames_to_exclude=[self._cache_database_name],
-                )
-                + output_size
-                > self._max_cache_size
-            ):
-                self._drop_least_recently_used_item()
+            bytes_to_free = self._cache_size() + output_size - max_cache_size
+            if bytes_to_free > 0:
+                self._drop_least_recently_used_items(bytes_to_free)
+                # results of processes which crashed before adding their cache entry
+                # aren't tracked by the database and wouldn't be evicted otherwise
+                self._delete_untracked_content()
 
             output_type = rasa.shared.utils.common.module_path_from_instance(output)
             cache_path = shutil.move(temp_dir, self._cache_location)
 
-            return cache_path, output_type
+            return cache_path, output_type, output_size
 
-    def _drop_least_recently_used_item(self) -> None:
-        with self._sessionmaker.begin() as session:
-            query_for_least_recently_used_entry = sa.select(self.CacheEntry).order_by(
-                self.CacheEntry.last_used.asc()
-            )
-            oldest_cache_item = (
-                session.execute(query_for_least_recently_used_entry).scalars().first()
+    def _cache_size(self) -> int:
+        with self._sessionmaker() as session:
+            query = sa.select(
+                sa.func.coalesce(sa.func.sum(self.CacheEntry.result_size), 0)
             )
+            return session.execute(query).scalar_one()
 
-            if not oldest_cache_item:
-                self._purge_cache_dir_content()
-                return
+    def _drop_least_recently_used_items(self, bytes_to_free: float) -> int:
+        """Deletes the least recently used cached results to free space.
 
-            self._delete_cached_result(oldest_cache_item)
-            delete_query = sa.delete(self.CacheEntry).where(
-                self.CacheEntry.fingerprint_key == oldest_cache_item.fingerprint_key
+        Args:
+            bytes_to_free: Number of bytes which should be freed.
+
+        Returns:
+            The number of deleted cached results.
+        """
+        if bytes_to_free <= 0:
+            return 0
+
+        # sum of the sizes of all results which were used before the entry
+        freed_before_entry = (
+            sa.func.sum(self.CacheEntry.result_size).over(
+                order_by=[
+                    self.CacheEntry.last_used.asc(),
+                    self.CacheEntry.fingerprint_key,
+                ]
+            )
+            - self.CacheEntry.result_size
+        )
+        entries_by_last_use = (
+            sa.select(
+                self.CacheEntry.fingerprint_key,
+                self.CacheEntry.result_location,
+                freed_before_entry.label("freed_before_entry"),
+            )
+            .where(self.CacheEntry.result_location != sa.null())
+            .subquery()
+        )
+        entries_to_drop = sa.select(
+            entries_by_last_use.c.fingerprint_key,
+            entries_by_last_use.c.result_location,
+        ).where(entries_by_last_use.c.freed_before_entry < bytes_to_free)
+
+        with self._sessionmaker.begin() as session:
+            dropped_entries = session.execute(entries_to_drop).all()
+            delete_query = (
+                sa.delete(self.CacheEntry)
+                .where(
+                    self.CacheEntry.fingerprint_key.in_(
+                        sa.select(entries_to_drop.subquery().c.fingerprint_key)
+                    )
+                )
+                .execution_options(synchronize_session=False)
             )
             session.execute(delete_query)
 
-            logger.debug(
-                f"Deleted item with fingerprint "
-                f"'{oldest_cache_item.fingerprint_key}' to free space."
+        for entry in dropped_entries:
+            self._delete_cached_result(entry)
+
+        logger.debug(
+            f"Deleted {len(dropped_entries)} cached results to free "
+            f"{bytes_to_free / 1_048_576:.2f} MiB."
+        )
+        return len(dropped_entries)
+
+    def statistics(self) -> CacheStatistics:
+        """Returns the number of cache entries and the size of the cached results."""
+        with self._sessionmaker() as session:
+            query = sa.select(
+                sa.func.count(), sa.func.count(self.CacheEntry.result_location)
+            ).select_from(self.CacheEntry)
+            number_of_entries, number_of_results = session.execute(query).one()
+
+            # read-only caches of older Rasa versions don't store all result sizes
+            query_for_unknown_sizes = sa.select(self.CacheEntry.result_location).where(
+                self.CacheEntry.result_location != sa.null()
+            )
+            if self._has_result_sizes:
+                query_for_unknown_sizes = query_for_unknown_sizes.where(
+                    self.CacheEntry.result_size == sa.null()
+                )
+            size = sum(
+                self._result_size(location)
+                for location in session.execute(query_for_unknown_sizes).scalars()
             )
 
-    def _purge_cache_dir_content(self) -> None:
-        for item in self._cache_location.glob("*"):
-            if item.name == self._cache_database_name:
-                continue
+        if self._has_result_sizes:
+            size += self._cache_size()
 
-            if item.is_dir():
-                shutil.rmtree(item)
-            else:
-                item.unlink()
+        return CacheStatistics(number_of_entries, number_of_results, size)
+
+    def prune(self, max_size_in_mb: float) -> int:
+        """Deletes the least recently used cached results until the cache fits.
+
+        Files and directories in the cache directory which the cache doesn't track
+        are deleted as well once they are older than the
+        `UNTRACKED_CONTENT_GRACE_PERIOD`.
+
+        Args:
+            max_size_in_mb: Size in MiB which the cached results may take up after
+                pruning.
+
+        Returns:
+            The number of deleted cached results.
+        """
+        number_of_deleted_results = self._drop_least_recently_used_items(
+            self._cache_size() - self._mb_to_bytes(max_size_in_mb)
+        )
+        if not self._is_disabled():
+            self._delete_untracked_content()
+
+        return number_of_deleted_results
 
     def get_cached_output_fingerprint(self, fingerprint_key: Text) -> Optional[Text]:
         """Returns cached output fingerprint (see parent class for full docstring)."""
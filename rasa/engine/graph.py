@@ -4,7 +4,7 @@ import dataclasses
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 import logging
-from typing import Any, Callable, Dict, List, Optional, Text, Type, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Text, Type, Tuple, Union
 
 from rasa.engine.exceptions import (
     GraphComponentException,
@@ -147,16 +147,19 @@ class GraphSchema:
             }
         )
 
-    def _all_dependencies_schema(self, targets: List[Text]) -> List[Text]:
-        required = []
-        for target in targets:
-            required.append(target)
-            try:
-                target_dependencies = self.nodes[target].needs.values()
-            except KeyError:  # This can happen if the target is an input placeholder.
+    def _all_dependencies_schema(self, targets: List[Text]) -> Set[Text]:
+        required = set()
+        to_visit = list(targets)
+        while to_visit:
+            node_name = to_visit.pop()
+            if node_name in required:
                 continue
-            for dependency in target_dependencies:
-                required += self._all_dependencies_schema([dependency])
+
+            required.add(node_name)
+            node = self.nodes.get(node_name)
+            # `node` is `None` if the target is an input placeholder.
+            if node:
+                to_visit.extend(node.needs.values())
 
         return required
 
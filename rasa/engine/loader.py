@@ -23,7 +23,7 @@ def load_predict_graph_runner(
     Returns:
         A tuple containing the model metadata and the prediction graph runner.
     """
-    model_storage, model_metadata = model_storage_class.from_model_archive(
+    model_storage, model_metadata = model_storage_class.from_model_archive_read_only(
         storage_path=storage_path, model_archive_path=model_archive_path
     )
     runner = graph_runner_class.create(
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Optional, Text
+from typing import Any, Dict, FrozenSet, List, Optional, Text
 
 import dask
 
@@ -39,6 +39,13 @@ class DaskGraphRunner(GraphRunner):
         )
         self._execution_context: ExecutionContext = execution_context
 
+        # dask graphs of the pruned schemas which are needed to compute a set of
+        # targets (computing them on every run is expensive for large graphs)
+        self._run_graphs: Dict[FrozenSet[Text], Dict[Text, Any]] = {}
+        self._run_graph_for_targets(graph_schema.target_names)
+        for target in graph_schema.target_names:
+            self._run_graph_for_targets([target])
+
     @classmethod
     def create(
         cls,
@@ -79,6 +86,17 @@ class DaskGraphRunner(GraphRunner):
         }
         return run_graph
 
+    def _run_graph_for_targets(self, targets: List[Text]) -> Dict[Text, Any]:
+        """Returns the (cached) dask graph which is needed to compute `targets`."""
+        key = frozenset(targets)
+        run_graph = self._run_graphs.get(key)
+        if run_graph is None:
+            minimal_schema = self._graph_schema.minimal_graph_schema(targets)
+            run_graph = self._build_dask_graph(minimal_schema)
+            self._run_graphs[key] = run_graph
+
+        return run_graph
+
     def run(
         self,
         inputs: Optional[Dict[Text, Any]] = None,
@@ -86,8 +104,8 @@ class DaskGraphRunner(GraphRunner):
     ) -> Dict[Text, Any]:
         """Runs the graph (see parent class for full docstring)."""
         run_targets = targets if targets else self._graph_schema.target_names
-        minimal_schema = self._graph_schema.minimal_graph_schema(run_targets)
-        run_graph = self._build_dask_graph(minimal_schema)
+        # copy the cached graph as the inputs are added to it
+        run_graph = dict(self._run_graph_for_targets(run_targets))
 
         if inputs:
             self._add_inputs_to_graph(inputs, run_graph)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import json
 import logging
+import os
 import shutil
 import sys
 import tempfile
@@ -13,11 +15,13 @@ from typing import Generator, Optional, Text, Tuple, Union
 
 import rasa.utils.common
 import rasa.shared.utils.io
+from rasa.constants import DEFAULT_MODEL_ARCHIVE_FORMAT, ENV_MODEL_ARCHIVE_FORMAT
 from rasa.engine.storage.storage import ModelMetadata, ModelStorage
 from rasa.engine.graph import GraphModelConfiguration
 from rasa.engine.storage.resource import Resource
 from rasa.exceptions import UnsupportedModelVersionError
 from rasa.shared.core.domain import Domain
+from rasa.shared.exceptions import InvalidConfigException
 import rasa.model
 
 logger = logging.getLogger(__name__)
@@ -26,6 +30,54 @@ logger = logging.getLogger(__name__)
 MODEL_ARCHIVE_COMPONENTS_DIR = "components"
 MODEL_ARCHIVE_METADATA_FILE = "metadata.json"
 
+# Formats of model archives
+MODEL_ARCHIVE_FORMAT_GZIP = "tar.gz"
+MODEL_ARCHIVE_FORMAT_TAR = "tar"
+MODEL_ARCHIVE_FORMAT_DIRECTORY = "directory"
+
+
+MODEL_ARCHIVE_SUFFIXES = {
+    MODEL_ARCHIVE_FORMAT_GZIP: ".tar.gz",
+    MODEL_ARCHIVE_FORMAT_TAR: ".tar",
+    MODEL_ARCHIVE_FORMAT_DIRECTORY: "",
+}
+
+
+def configured_model_archive_format() -> Text:
+    """Returns the format in which trained models are packaged.
+
+    The format is configured with the `MODEL_ARCHIVE_FORMAT` environment variable.
+    Loading a model doesn't depend on it as the format of a model is detected from
+    the model itself.
+
+    Returns:
+        The configured format.
+
+    Raises:
+        InvalidConfigException: If the configured format is unknown.
+    """
+    archive_format = os.environ.get(
+        ENV_MODEL_ARCHIVE_FORMAT, DEFAULT_MODEL_ARCHIVE_FORMAT
+    )
+    if archive_format not in MODEL_ARCHIVE_SUFFIXES:
+        raise InvalidConfigException(
+            f"Environment variable '{ENV_MODEL_ARCHIVE_FORMAT}' has to be one of "
+            f"{', '.join(MODEL_ARCHIVE_SUFFIXES)}, but it is '{archive_format}'."
+        )
+    return archive_format
+
+
+def is_model_directory(path: Union[Text, Path]) -> bool:
+    """Checks whether a path is a model directory.
+
+    Args:
+        path: The path to check.
+
+    Returns:
+        `True` if the path is a directory which contains model metadata.
+    """
+    return (Path(path) / MODEL_ARCHIVE_METADATA_FILE).is_file()
+
 
 @contextmanager
 def windows_safe_temporary_directory(
@@ -80,6 +132,15 @@ class LocalModelStorage(ModelStorage):
                 f"empty model storage."
             )
 
+        if Path(model_archive_path).is_dir():
+            cls._assert_not_rasa2_archive(model_archive_path)
+            shutil.copytree(
+                Path(model_archive_path) / MODEL_ARCHIVE_COMPONENTS_DIR,
+                storage_path,
+                dirs_exist_ok=True,
+            )
+            return cls(storage_path), cls._load_metadata(Path(model_archive_path))
+
         with windows_safe_temporary_directory() as temporary_directory:
             temporary_directory_path = Path(temporary_directory)
 
@@ -96,26 +157,59 @@ class LocalModelStorage(ModelStorage):
 
             return (cls(storage_path), metadata)
 
+    @classmethod
+    def from_model_archive_read_only(
+        cls, storage_path: Path, model_archive_path: Union[Text, Path]
+    ) -> Tuple[LocalModelStorage, ModelMetadata]:
+        """Initializes read-only storage (see parent class for full docstring).
+
+        The persisted components of model directories are read in place.
+        """
+        if not Path(model_archive_path).is_dir():
+            return cls.from_model_archive(storage_path, model_archive_path)
+
+        cls._assert_not_rasa2_archive(model_archive_path)
+        metadata = cls._load_metadata(Path(model_archive_path))
+        logger.debug(f"Reading model directory '{model_archive_path}' in place.")
+
+        return (
+            cls(Path(model_archive_path) / MODEL_ARCHIVE_COMPONENTS_DIR),
+            metadata,
+        )
+
     @classmethod
     def metadata_from_archive(
         cls, model_archive_path: Union[Text, Path]
     ) -> ModelMetadata:
         """Retrieves metadata from archive (see parent class for full docstring)."""
-        with windows_safe_temporary_directory() as temporary_directory:
-            temporary_directory_path = Path(temporary_directory)
-
-            cls._extract_archive_to_directory(
-                model_archive_path, temporary_directory_path
-            )
-            metadata = cls._load_metadata(temporary_directory_path)
-
-            return metadata
+        if Path(model_archive_path).is_dir():
+            cls._assert_not_rasa2_archive(model_archive_path)
+            return cls._load_metadata(Path(model_archive_path))
+
+        # only the metadata is extracted which stops reading the archive as soon as
+        # the metadata was found (it's the first file in archives created by Rasa)
+        with TarSafe.open(model_archive_path, mode="r:*") as tar:
+            for member in tar:
+                member_path = Path(member.name)
+                if member_path == Path("fingerprint.json"):
+                    serialized_fingerprint = json.load(tar.extractfile(member))
+                    raise UnsupportedModelVersionError(
+                        model_version=serialized_fingerprint["version"]
+                    )
+                if member_path == Path(MODEL_ARCHIVE_METADATA_FILE):
+                    serialized_metadata = json.load(tar.extractfile(member))
+                    return ModelMetadata.from_dict(serialized_metadata)
+
+        raise ValueError(
+            f"The model archive '{model_archive_path}' does not contain a "
+            f"'{MODEL_ARCHIVE_METADATA_FILE}' file."
+        )
 
     @staticmethod
     def _extract_archive_to_directory(
         model_archive_path: Union[Text, Path], temporary_directory: Path
     ) -> None:
-        with TarSafe.open(model_archive_path, mode="r:gz") as tar:
+        with TarSafe.open(model_archive_path, mode="r:*") as tar:
             if sys.platform == "win32":
                 # on Windows by default there is a restriction on long
                 # path names; using the prefix below allows to bypass
@@ -196,30 +290,53 @@ class LocalModelStorage(ModelStorage):
         """Creates model package (see parent class for full docstring)."""
         logger.debug(f"Start to created model package for path '{model_archive_path}'.")
 
-        with windows_safe_temporary_directory() as temp_dir:
-
-            temporary_directory = Path(temp_dir)
+        archive_format = configured_model_archive_format()
 
-            shutil.copytree(
-                self._storage_path, temporary_directory / MODEL_ARCHIVE_COMPONENTS_DIR
-            )
+        if isinstance(model_archive_path, str):
+            model_archive_path = Path(model_archive_path)
 
-            model_metadata = self._create_model_metadata(domain, model_configuration)
-            self._persist_metadata(model_metadata, temporary_directory)
+        if not model_archive_path.parent.exists():
+            model_archive_path.parent.mkdir(parents=True)
 
-            if isinstance(model_archive_path, str):
-                model_archive_path = Path(model_archive_path)
+        model_metadata = self._create_model_metadata(domain, model_configuration)
 
-            if not model_archive_path.parent.exists():
-                model_archive_path.parent.mkdir(parents=True)
+        if archive_format == MODEL_ARCHIVE_FORMAT_DIRECTORY:
+            self._create_model_directory(model_archive_path, model_metadata)
+        else:
+            with windows_safe_temporary_directory() as temp_dir:
+                temporary_directory = Path(temp_dir)
+                self._persist_metadata(model_metadata, temporary_directory)
 
-            with TarSafe.open(model_archive_path, "w:gz") as tar:
-                tar.add(temporary_directory, arcname="")
+                mode = "w:gz" if archive_format == MODEL_ARCHIVE_FORMAT_GZIP else "w"
+                with TarSafe.open(model_archive_path, mode) as tar:
+                    # the metadata goes first so that it can be read without
+                    # reading the whole archive
+                    tar.add(
+                        temporary_directory / MODEL_ARCHIVE_METADATA_FILE,
+                        arcname=MODEL_ARCHIVE_METADATA_FILE,
+                    )
+                    tar.add(self._storage_path, arcname=MODEL_ARCHIVE_COMPONENTS_DIR)
 
         logger.debug(f"Model package created in path '{model_archive_path}'.")
 
         return model_metadata
 
+    def _create_model_directory(
+        self, model_directory: Path, model_metadata: ModelMetadata
+    ) -> None:
+        if model_directory.exists():
+            if not is_model_directory(model_directory):
+                raise ValueError(
+                    f"Can't create a model directory at '{model_directory}' as "
+                    f"the path already exists and is not a model directory."
+                )
+            shutil.rmtree(model_directory)
+
+        shutil.copytree(
+            self._storage_path, model_directory / MODEL_ARCHIVE_COMPONENTS_DIR
+        )
+        self._persist_metadata(model_metadata, model_directory)
+
     @staticmethod
     def _persist_metadata(metadata: ModelMetadata, temporary_directory: Path) -> None:
 
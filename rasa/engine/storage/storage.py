@@ -54,6 +54,28 @@ class ModelStorage(abc.ABC):
         """
         ...
 
+    @classmethod
+    def from_model_archive_read_only(
+        cls, storage_path: Path, model_archive_path: Union[Text, Path]
+    ) -> Tuple[ModelStorage, ModelMetadata]:
+        """Initializes a `ModelStorage` which is only read from.
+
+        Model storages can use this to read the persisted graph components
+        directly from the model archive instead of unpacking them first.
+
+        Args:
+            storage_path: Directory which can contain the persisted graph components.
+            model_archive_path: The path to the model archive.
+
+        Returns:
+            Initialized model storage, and metadata about the model.
+
+        Raises:
+            `UnsupportedModelError` if the loaded meta data indicates that the model
+            has been created with an outdated Rasa version.
+        """
+        return cls.from_model_archive(storage_path, model_archive_path)
+
     @classmethod
     @abc.abstractmethod
     def metadata_from_archive(
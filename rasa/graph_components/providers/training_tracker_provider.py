@@ -1,10 +1,16 @@
 from __future__ import annotations
+import os
 from typing import Dict, Text, Any, List
 
+from rasa.constants import (
+    DEFAULT_TRACKER_GENERATION_PROCESSES,
+    ENV_TRACKER_GENERATION_PROCESSES,
+)
 from rasa.engine.graph import GraphComponent, ExecutionContext
 from rasa.engine.storage.resource import Resource
 from rasa.engine.storage.storage import ModelStorage
 from rasa.shared.core.domain import Domain
+from rasa.shared.exceptions import InvalidConfigException
 from rasa.shared.core.generator import TrackerWithCachedStates, TrainingDataGenerator
 from rasa.shared.core.training_data.structures import StoryGraph
 
@@ -50,6 +56,29 @@ class TrainingTrackerProvider(GraphComponent):
 
         Returns:
             The trackers which can be used to train dialogue policies.
+
+        Raises:
+            InvalidConfigException: If the number of processes for the tracker
+                generation isn't a positive integer.
         """
-        generator = TrainingDataGenerator(story_graph, domain, **self._config)
+        generator = TrainingDataGenerator(
+            story_graph, domain, num_processes=self._num_processes(), **self._config
+        )
         return generator.generate()
+
+    @staticmethod
+    def _num_processes() -> int:
+        value = os.environ.get(
+            ENV_TRACKER_GENERATION_PROCESSES, DEFAULT_TRACKER_GENERATION_PROCESSES
+        )
+        try:
+            num_processes = int(value)
+        except ValueError:
+            num_processes = 0
+
+        if num_processes < 1:
+            raise InvalidConfigException(
+                f"Environment variable '{ENV_TRACKER_GENERATION_PROCESSES}' has to be "
+                f"a positive integer, but it is '{value}'."
+            )
+        return num_processes
@@ -20,8 +20,8 @@ def get_local_model(model_path: Text = DEFAULT_MODELS_PATH) -> Text:
     """Returns verified path to local model archive.
 
     Args:
-        model_path: Path to the zipped model. If it's a directory, the latest
-                    trained model is returned.
+        model_path: Path to the zipped model or to a model directory. If it's
+                    another directory, the latest trained model is returned.
 
     Returns:
         Path to the zipped model. If it's a directory, the latest
@@ -43,7 +43,7 @@ def get_local_model(model_path: Text = DEFAULT_MODELS_PATH) -> Text:
                 f"Could not find any Rasa model files in '{model_path}'."
             )
         model_path = file_model_path
-    elif not model_path.endswith(".tar.gz"):
+    elif not model_path.endswith((".tar.gz", ".tgz", ".tar")):
         raise ModelNotFound(f"Path '{model_path}' does not point to a Rasa model file.")
 
     return model_path
@@ -53,19 +53,35 @@ def get_latest_model(model_path: Text = DEFAULT_MODELS_PATH) -> Optional[Text]:
     """Get the latest model from a path.
 
     Args:
-        model_path: Path to a directory containing zipped models.
+        model_path: Path to a directory containing zipped models or model
+            directories.
 
     Returns:
-        Path to latest model in the given directory.
+        Path to latest model in the given directory. If `model_path` is a model
+        directory itself, `model_path` is returned.
 
     """
+    from rasa.engine.storage.local_model_storage import is_model_directory
+
     if not model_path:
         return None
 
+    if is_model_directory(model_path):
+        return model_path
+
     if not os.path.exists(model_path) or os.path.isfile(model_path):
         model_path = os.path.dirname(model_path)
 
-    list_of_files = glob.glob(os.path.join(model_path, "*.tar.gz"))
+    list_of_files = [
+        path
+        for pattern in ["*.tar.gz", "*.tgz", "*.tar"]
+        for path in glob.glob(os.path.join(model_path, pattern))
+    ]
+    list_of_files += [
+        path
+        for path in glob.glob(os.path.join(model_path, "*"))
+        if is_model_directory(path)
+    ]
 
     if len(list_of_files) == 0:
         return None
@@ -79,12 +95,15 @@ def get_model_for_finetuning(
     """Gets validated path for model to finetune.
 
     Args:
-        previous_model_file: Path to model file which should be used for finetuning or
-            a directory in case the latest trained model should be used.
+        previous_model_file: Path to model file or model directory which should be
+            used for finetuning or a directory in case the latest trained model
+            should be used.
 
     Returns:
         Path to model archive. `None` if there is no model.
     """
+    from rasa.engine.storage.local_model_storage import is_model_directory
+
     model_file: Optional[Union[Path, Text]] = previous_model_file_or_dir
     if Path(previous_model_file_or_dir).is_dir():
         logger.debug(
@@ -93,7 +112,7 @@ def get_model_for_finetuning(
         )
         model_file = get_latest_model(previous_model_file_or_dir)
 
-    if model_file and Path(model_file).is_file():
+    if model_file and (Path(model_file).is_file() or is_model_directory(model_file)):
         return Path(model_file)
 
     logger.debug(
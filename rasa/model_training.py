@@ -8,7 +8,12 @@ import rasa.engine.validation
 from rasa.engine.caching import LocalTrainingCache
 from rasa.engine.recipes.recipe import Recipe
 from rasa.engine.runner.dask import DaskGraphRunner
-from rasa.engine.storage.local_model_storage import LocalModelStorage
+from rasa.constants import ENV_MODEL_ARCHIVE_FORMAT
+from rasa.engine.storage.local_model_storage import (
+    MODEL_ARCHIVE_SUFFIXES,
+    LocalModelStorage,
+    configured_model_archive_format,
+)
 from rasa.engine.storage.storage import ModelStorage
 from rasa.engine.training.components import FingerprintStatus
 from rasa.engine.training.graph_trainer import GraphTrainer
@@ -313,19 +318,35 @@ def _create_model_storage(
 def _determine_model_name(
     fixed_model_name: Optional[Text], training_type: TrainingType
 ) -> Text:
+    archive_format = configured_model_archive_format()
+    suffix = MODEL_ARCHIVE_SUFFIXES[archive_format]
     if fixed_model_name:
-        model_file = Path(fixed_model_name)
-        if not model_file.name.endswith(".tar.gz"):
-            return model_file.with_suffix(".tar.gz").name
-
-        return fixed_model_name
+        model_name = _remove_model_archive_suffix(fixed_model_name)
+        if model_name == fixed_model_name:
+            return f"{Path(fixed_model_name).name}{suffix}"
+
+        if f"{model_name}{suffix}" != fixed_model_name:
+            rasa.shared.utils.io.raise_warning(
+                f"The model name '{fixed_model_name}' doesn't match the model "
+                f"format '{archive_format}' which is configured with the "
+                f"environment variable '{ENV_MODEL_ARCHIVE_FORMAT}'. The model "
+                f"is saved as '{model_name}{suffix}' instead."
+            )
+        return f"{model_name}{suffix}"
 
     prefix = ""
     if training_type in [TrainingType.CORE, TrainingType.NLU]:
         prefix = f"{training_type.model_type}-"
 
     time_format = "%Y%m%d-%H%M%S"
-    return f"{prefix}{time.strftime(time_format)}-{randomname.get_name()}.tar.gz"
+    return f"{prefix}{time.strftime(time_format)}-{randomname.get_name()}{suffix}"
+
+
+def _remove_model_archive_suffix(model_name: Text) -> Text:
+    for suffix in [".tar.gz", ".tgz", ".tar"]:
+        if model_name.endswith(suffix):
+            return model_name[: -len(suffix)]
+    return model_name
 
 
 def train_core(
@@ -1,6 +1,5 @@
 from __future__ import annotations
 import logging
-import re
 from typing import Any, Dict, List, Optional, Text
 
 from rasa.engine.graph import GraphComponent, ExecutionContext
@@ -92,6 +91,9 @@ class RegexEntityExtractor(GraphComponent, EntityExtractorMixin):
         # extractor
         self.case_sensitive = self._config["case_sensitive"]
         self.patterns = patterns or []
+        self._matchers = pattern_utils.create_matchers(
+            self.patterns, self.case_sensitive
+        )
 
     def train(self, training_data: TrainingData) -> Resource:
         """Extract patterns from the training data.
@@ -106,6 +108,9 @@ class RegexEntityExtractor(GraphComponent, EntityExtractorMixin):
             use_only_entities=True,
             use_word_boundaries=self._config["use_word_boundaries"],
         )
+        self._matchers = pattern_utils.create_matchers(
+            self.patterns, self.case_sensitive
+        )
 
         if not self.patterns:
             rasa.shared.utils.io.raise_warning(
@@ -159,24 +164,15 @@ class RegexEntityExtractor(GraphComponent, EntityExtractorMixin):
         """
         entities = []
 
-        flags = 0  # default flag
-        if not self.case_sensitive:
-            flags = re.IGNORECASE
-
-        for pattern in self.patterns:
-            matches = re.finditer(pattern["pattern"], message.get(TEXT), flags=flags)
-
-            for match in matches:
-                start_index = match.start()
-                end_index = match.end()
+        text = message.get(TEXT)
+        for pattern, matcher in zip(self.patterns, self._matchers):
+            for start_index, end_index in matcher.finditer(text):
                 entities.append(
                     {
                         ENTITY_ATTRIBUTE_TYPE: pattern["name"],
                         ENTITY_ATTRIBUTE_START: start_index,
                         ENTITY_ATTRIBUTE_END: end_index,
-                        ENTITY_ATTRIBUTE_VALUE: message.get(TEXT)[
-                            start_index:end_index
-                        ],
+                        ENTITY_ATTRIBUTE_VALUE: text[start_index:end_index],
                     }
                 )
 
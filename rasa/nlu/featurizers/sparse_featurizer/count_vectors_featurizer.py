@@ -549,41 +549,45 @@ class CountVectorsFeaturizer(SparseFeaturizer, GraphComponent):
         List[Optional[scipy.sparse.spmatrix]], List[Optional[scipy.sparse.spmatrix]]
     ]:
         if not self.vectorizers.get(attribute):
-            return [None], [None]
-
-        sequence_features: List[Optional[scipy.sparse.spmatrix]] = []
-        sentence_features: List[Optional[scipy.sparse.spmatrix]] = []
-
-        for i, tokens in enumerate(all_tokens):
-            if not tokens:
-                # nothing to featurize
-                sequence_features.append(None)
-                sentence_features.append(None)
-                continue
-
-            # vectorizer.transform returns a sparse matrix of size
-            # [n_samples, n_features]
-            # set input to list of tokens if sequence should be returned
-            # otherwise join all tokens to a single string and pass that as a list
-            if not tokens:
-                # attribute is not set (e.g. response not present)
-                sequence_features.append(None)
-                sentence_features.append(None)
-                continue
-
-            seq_vec = self.vectorizers[attribute].transform(tokens)
-            seq_vec.sort_indices()
+            return [None] * len(all_tokens), [None] * len(all_tokens)
 
-            sequence_features.append(seq_vec.tocoo())
+        sequence_features: List[Optional[scipy.sparse.spmatrix]] = [None] * len(
+            all_tokens
+        )
+        sentence_features: List[Optional[scipy.sparse.spmatrix]] = [None] * len(
+            all_tokens
+        )
 
-            if attribute in DENSE_FEATURIZABLE_ATTRIBUTES:
-                tokens_text = [" ".join(tokens)]
-                sentence_vec = self.vectorizers[attribute].transform(tokens_text)
-                sentence_vec.sort_indices()
+        # messages without tokens (e.g. attribute is not set) are not featurized
+        indices = [i for i, tokens in enumerate(all_tokens) if tokens]
+        if not indices:
+            return sequence_features, sentence_features
+
+        # vectorizer.transform returns a sparse matrix of size
+        # [n_samples, n_features]
+        # to get the sequence features of all messages with a single call, every
+        # token is passed as a sample and the rows of each message are sliced
+        # afterwards
+        seq_vecs = self.vectorizers[attribute].transform(
+            [token for i in indices for token in all_tokens[i]]
+        )
+        offset = 0
+        for i in indices:
+            seq_vec = seq_vecs[offset : offset + len(all_tokens[i])]
+            seq_vec.sort_indices()
+            sequence_features[i] = seq_vec.tocoo()
+            offset += len(all_tokens[i])
 
-                sentence_features.append(sentence_vec.tocoo())
-            else:
-                sentence_features.append(None)
+        if attribute in DENSE_FEATURIZABLE_ATTRIBUTES:
+            # to get the sentence features all tokens of a message are joined to a
+            # single string which is passed as one sample
+            sentence_vecs = self.vectorizers[attribute].transform(
+                [" ".join(all_tokens[i]) for i in indices]
+            )
+            for row, i in enumerate(indices):
+                sentence_vec = sentence_vecs[row : row + 1]
+                sentence_vec.sort_indices()
+                sentence_features[i] = sentence_vec.tocoo()
 
         return sequence_features, sentence_features
 
@@ -655,20 +659,22 @@ class CountVectorsFeaturizer(SparseFeaturizer, GraphComponent):
             )
             return messages
 
-        for message in messages:
-            for attribute in self._attributes:
-
-                message_tokens = self._get_processed_message_tokens_by_attribute(
-                    message, attribute
-                )
+        # the features of all messages are created with one call of the vectorizer
+        # per attribute
+        for attribute in self._attributes:
+            all_tokens = [
+                self._get_processed_message_tokens_by_attribute(message, attribute)
+                for message in messages
+            ]
 
-                # features shape (1, seq, dim)
-                sequence_features, sentence_features = self._create_features(
-                    attribute, [message_tokens]
-                )
-                self.add_features_to_message(
-                    sequence_features[0], sentence_features[0], attribute, message
-                )
+            # features shape (1, seq, dim) per message
+            sequence_features, sentence_features = self._create_features(
+                attribute, all_tokens
+            )
+            for message, sequence, sentence in zip(
+                messages, sequence_features, sentence_features
+            ):
+                self.add_features_to_message(sequence, sentence, attribute, message)
 
         return messages
 
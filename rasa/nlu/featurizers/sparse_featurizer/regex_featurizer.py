@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import logging
-import re
 from typing import Any, Dict, List, Optional, Text, Tuple, Type
 
 import numpy as np
@@ -77,6 +76,9 @@ class RegexFeaturizer(SparseFeaturizer, GraphComponent):
         self.known_patterns = known_patterns if known_patterns else []
         self.case_sensitive = config["case_sensitive"]
         self.finetune_mode = execution_context.is_finetuning
+        self._matchers = pattern_utils.create_matchers(
+            self.known_patterns, self.case_sensitive
+        )
 
     @classmethod
     def create(
@@ -108,9 +110,18 @@ class RegexFeaturizer(SparseFeaturizer, GraphComponent):
             # Some patterns may have just new examples added
             # to them. These do not count as additional pattern.
             if new_pattern_name in pattern_name_index_map:
-                self.known_patterns[pattern_name_index_map[new_pattern_name]][
-                    "pattern"
-                ] = extra_pattern["pattern"]
+                known_pattern = self.known_patterns[
+                    pattern_name_index_map[new_pattern_name]
+                ]
+                known_pattern["pattern"] = extra_pattern["pattern"]
+                for key in [
+                    pattern_utils.LOOKUP_ELEMENTS,
+                    pattern_utils.USE_WORD_BOUNDARIES,
+                ]:
+                    if key in extra_pattern:
+                        known_pattern[key] = extra_pattern[key]
+                    else:
+                        known_pattern.pop(key, None)
             else:
                 self.known_patterns.append(extra_pattern)
 
@@ -127,6 +138,9 @@ class RegexFeaturizer(SparseFeaturizer, GraphComponent):
             self._merge_new_patterns(patterns_from_data)
         else:
             self.known_patterns = patterns_from_data
+        self._matchers = pattern_utils.create_matchers(
+            self.known_patterns, self.case_sensitive
+        )
 
         self._persist()
         return self._resource
@@ -193,10 +207,6 @@ class RegexFeaturizer(SparseFeaturizer, GraphComponent):
             # nothing to featurize
             return None, None
 
-        flags = 0  # default flag
-        if not self.case_sensitive:
-            flags = re.IGNORECASE
-
         sequence_length = len(tokens)
 
         num_patterns = len(self.known_patterns)
@@ -204,17 +214,17 @@ class RegexFeaturizer(SparseFeaturizer, GraphComponent):
         sequence_features = np.zeros([sequence_length, num_patterns])
         sentence_features = np.zeros([1, num_patterns])
 
-        for pattern_index, pattern in enumerate(self.known_patterns):
-            matches = list(
-                re.finditer(pattern["pattern"], message.get(attribute), flags=flags)
-            )
+        for pattern_index, (pattern, matcher) in enumerate(
+            zip(self.known_patterns, self._matchers)
+        ):
+            matches = list(matcher.finditer(message.get(attribute)))
 
             for token_index, t in enumerate(tokens):
                 patterns = t.get("pattern", default={})
                 patterns[pattern["name"]] = False
 
-                for match in matches:
-                    if t.start < match.end() and t.end > match.start():
+                for match_start, match_end in matches:
+                    if t.start < match_end and t.end > match_start:
                         patterns[pattern["name"]] = True
                         sequence_features[token_index][pattern_index] = 1.0
                         if attribute in [RESPONSE, TEXT, ACTION_TEXT]:
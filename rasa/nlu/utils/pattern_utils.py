@@ -1,16 +1,33 @@
+import functools
 import re
-from typing import Dict, List, Text, Union
+from typing import Any, Dict, Iterator, List, Optional, Text, Tuple, Union
 
 import rasa.shared.utils.io
 from rasa.shared.nlu.training_data.training_data import TrainingData
 from rasa.shared.exceptions import InvalidConfigException
 
+# keys of the patterns which were created from lookup tables
+LOOKUP_ELEMENTS = "elements"
+USE_WORD_BOUNDARIES = "use_word_boundaries"
+
+# marks the nodes of the lookup trie at which an element ends
+_ELEMENT_END = ""
+
+# characters which `re.IGNORECASE` treats as equal, but for which
+# `str.upper().lower()` doesn't return the same single character
+_CASE_FOLDING_EXCEPTIONS = {
+    "\u0130": "i",
+    "\u1fd3": "\u0390",
+    "\u1fe3": "\u03b0",
+    "\ufb05": "\ufb06",
+}
+
 
 def _convert_lookup_tables_to_regex(
     training_data: TrainingData,
     use_only_entities: bool = False,
     use_word_boundaries: bool = True,
-) -> List[Dict[Text, Text]]:
+) -> List[Dict[Text, Any]]:
     r"""Convert the lookup tables from the training data to regex patterns.
 
     Args:
@@ -27,8 +44,13 @@ def _convert_lookup_tables_to_regex(
     for table in training_data.lookup_tables:
         if use_only_entities and table["name"] not in training_data.entities:
             continue
-        regex_pattern = _generate_lookup_regex(table, use_word_boundaries)
-        lookup_regex = {"name": table["name"], "pattern": regex_pattern}
+        elements = _lookup_table_elements(table)
+        lookup_regex = {
+            "name": table["name"],
+            "pattern": _lookup_regex_from_elements(elements, use_word_boundaries),
+            LOOKUP_ELEMENTS: elements,
+            USE_WORD_BOUNDARIES: use_word_boundaries,
+        }
         patterns.append(lookup_regex)
     return patterns
 
@@ -48,17 +70,29 @@ def _generate_lookup_regex(
     Returns:
         The regex pattern.
     """
+    return _lookup_regex_from_elements(
+        _lookup_table_elements(lookup_table), use_word_boundaries
+    )
+
+
+def _lookup_table_elements(
+    lookup_table: Dict[Text, Union[Text, List[Text]]]
+) -> List[Text]:
+    """Returns the elements of a lookup table which is a file or a list of entries."""
     lookup_elements = lookup_table["elements"]
 
     # if it's a list, it should be the elements directly
     if isinstance(lookup_elements, list):
-        elements_to_regex = lookup_elements
+        return lookup_elements
     # otherwise it's a file path.
-    else:
-        elements_to_regex = read_lookup_table_file(lookup_elements)
+    return read_lookup_table_file(lookup_elements)
+
 
+def _lookup_regex_from_elements(
+    elements: List[Text], use_word_boundaries: bool
+) -> Text:
     # sanitize the regex, escape special characters
-    elements_sanitized = [re.escape(e) for e in elements_to_regex]
+    elements_sanitized = [re.escape(e) for e in elements]
 
     if use_word_boundaries:
         # regex matching elements with word boundaries on either side
@@ -122,7 +156,7 @@ def extract_patterns(
     use_regexes: bool = True,
     use_only_entities: bool = False,
     use_word_boundaries: bool = True,
-) -> List[Dict[Text, Text]]:
+) -> List[Dict[Text, Any]]:
     r"""Extract a list of patterns from the training data.
 
     The patterns are constructed using the regex features and lookup tables defined
@@ -156,6 +190,9 @@ def extract_patterns(
 
     # validate regexes, raise Error when invalid
     for pattern in patterns:
+        if LOOKUP_ELEMENTS in pattern:
+            # the elements of lookup tables are escaped
+            continue
         try:
             re.compile(pattern["pattern"])
         except re.error:
@@ -166,3 +203,182 @@ def extract_patterns(
             )
 
     return patterns
+
+
+@functools.lru_cache(maxsize=None)
+def _fold_case(character: Text) -> Text:
+    """Maps all characters which `re.IGNORECASE` treats as equal to one character."""
+    if character in _CASE_FOLDING_EXCEPTIONS:
+        return _CASE_FOLDING_EXCEPTIONS[character]
+
+    folded = character.upper().lower()
+    if len(folded) == 1:
+        return folded
+
+    folded = character.lower()
+    return folded if len(folded) == 1 else character
+
+
+def _is_word_character(text: Text, index: int) -> bool:
+    if index < 0 or index >= len(text):
+        return False
+    return text[index].isalnum() or text[index] == "_"
+
+
+def _is_word_boundary(text: Text, index: int) -> bool:
+    return _is_word_character(text, index - 1) != _is_word_character(text, index)
+
+
+class LookupTableMatcher:
+    """Finds the elements of a lookup table in texts using a trie.
+
+    The found spans are the same as the ones of `re.finditer` with the regex which
+    `_generate_lookup_regex` creates for the lookup table. However, the matcher
+    doesn't need to compile a regex with an alternative for every element and checks
+    at every position of the text only the elements which share a prefix with it.
+    """
+
+    def __init__(
+        self,
+        elements: List[Text],
+        use_word_boundaries: bool = True,
+        case_sensitive: bool = True,
+    ) -> None:
+        r"""Creates the matcher.
+
+        Args:
+            elements: The (non-empty) elements of the lookup table.
+            use_word_boundaries: If `True` elements only match between word
+              boundaries (like `\b` in regexes).
+            case_sensitive: If `False` elements are matched like with
+              `re.IGNORECASE`.
+        """
+        self._use_word_boundaries = use_word_boundaries
+        self._case_sensitive = case_sensitive
+        self._trie: Dict[Text, Any] = {}
+
+        for element_index, element in enumerate(elements):
+            node = self._trie
+            for character in self._fold(element):
+                node = node.setdefault(character, {})
+            # like the regex alternation the first of equal elements matches
+            node.setdefault(_ELEMENT_END, element_index)
+
+    def _fold(self, text: Text) -> Text:
+        if self._case_sensitive:
+            return text
+        return "".join(map(_fold_case, text))
+
+    def finditer(self, text: Text) -> Iterator[Tuple[int, int]]:
+        """Finds the non-overlapping matches of the lookup table elements.
+
+        Args:
+            text: The text to search.
+
+        Returns:
+            The start and end indices of the matches from left to right.
+        """
+        folded_text = self._fold(text)
+        start = 0
+        while start < len(folded_text):
+            end = self._match_at(text, folded_text, start)
+            if end is None:
+                start += 1
+            else:
+                yield start, end
+                start = end
+
+    def _match_at(self, text: Text, folded_text: Text, start: int) -> Optional[int]:
+        if self._use_word_boundaries and not _is_word_boundary(text, start):
+            return None
+
+        # the regex alternation matches the first element and not the longest one
+        match_element_index = None
+        match_end = None
+
+        node = self._trie
+        for index in range(start, len(folded_text)):
+            child: Optional[Dict[Text, Any]] = node.get(folded_text[index])
+            if child is None:
+                break
+            node = child
+
+            element_index = node.get(_ELEMENT_END)
+            if element_index is None or (
+                match_element_index is not None and element_index > match_element_index
+            ):
+                continue
+            if self._use_word_boundaries and not _is_word_boundary(text, index + 1):
+                continue
+
+            match_element_index = element_index
+            match_end = index + 1
+
+        return match_end
+
+
+def create_lookup_matcher(
+    pattern: Dict[Text, Any], case_sensitive: bool = True
+) -> Optional[LookupTableMatcher]:
+    """Creates a matcher if the pattern was created from a lookup table.
+
+    Args:
+        pattern: A pattern returned by `extract_patterns`.
+        case_sensitive: If `False` the matcher ignores the case.
+
+    Returns:
+        The matcher or `None` if the pattern has to be matched as regex.
+    """
+    elements = pattern.get(LOOKUP_ELEMENTS)
+    # empty elements would match the empty string which only the regex supports
+    if not elements or not all(elements):
+        return None
+
+    return LookupTableMatcher(
+        elements, pattern.get(USE_WORD_BOUNDARIES, True), case_sensitive
+    )
+
+
+class RegexMatcher:
+    """Finds the matches of a regex which is compiled once."""
+
+    def __init__(self, pattern: Text, case_sensitive: bool = True) -> None:
+        """Compiles the regex.
+
+        Args:
+            pattern: The regex.
+            case_sensitive: If `False` the regex is compiled with `re.IGNORECASE`.
+        """
+        flags = 0 if case_sensitive else re.IGNORECASE
+        self._regex = re.compile(pattern, flags=flags)
+
+    def finditer(self, text: Text) -> Iterator[Tuple[int, int]]:
+        """Finds the non-overlapping matches of the regex.
+
+        Args:
+            text: The text to search.
+
+        Returns:
+            The start and end indices of the matches from left to right.
+        """
+        for match in self._regex.finditer(text):
+            yield match.span()
+
+
+def create_matchers(
+    patterns: List[Dict[Text, Any]], case_sensitive: bool = True
+) -> List[Union[LookupTableMatcher, RegexMatcher]]:
+    """Creates the matchers for patterns so that matching them doesn't compile them.
+
+    Args:
+        patterns: Patterns returned by `extract_patterns`.
+        case_sensitive: If `False` the matchers ignore the case.
+
+    Returns:
+        A matcher for each pattern.
+    """
+    return [
+        create_lookup_matcher(pattern, case_sensitive)
+        or RegexMatcher(pattern["pattern"], case_sensitive)
+        for pattern in patterns
+    ]
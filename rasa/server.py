@@ -1,5 +1,6 @@
 import asyncio
 import concurrent.futures
+import json
 import logging
 import multiprocessing
 import os
@@ -47,7 +48,11 @@ from rasa.shared.core.training_data.story_writer.yaml_story_writer import (
 from rasa.shared.importers.importer import TrainingDataImporter
 from rasa.shared.nlu.training_data.formats import RasaYAMLReader
 from rasa.core.constants import DEFAULT_RESPONSE_TIMEOUT
-from rasa.constants import MINIMUM_COMPATIBLE_VERSION
+from rasa.constants import (
+    DEFAULT_MAX_PARSE_BATCH_SIZE,
+    ENV_MAX_PARSE_BATCH_SIZE,
+    MINIMUM_COMPATIBLE_VERSION,
+)
 from rasa.shared.constants import (
     DOCS_URL_TRAINING_DATA,
     DOCS_BASE_URL,
@@ -56,6 +61,7 @@ from rasa.shared.constants import (
     TEST_STORIES_FILE_PREFIX,
 )
 from rasa.shared.core.domain import InvalidDomain, Domain
+from rasa.shared.exceptions import InvalidConfigException
 from rasa.core.agent import Agent
 from rasa.core.channels.channel import (
     CollectingOutputChannel,
@@ -381,6 +387,68 @@ def validate_request_body(request: Request, error_message: Text) -> None:
         raise ErrorResponse(HTTPStatus.BAD_REQUEST, "BadRequest", error_message)
 
 
+def _texts_from_batch_parse_request(request: Request, emulator: Emulator) -> List[Text]:
+    """Returns the texts of a batch parse request.
+
+    The request body is either a list of texts or of objects with a `text` key.
+    Every message is normalised by the emulator like in `/model/parse` requests.
+    """
+    messages = request.json
+    if isinstance(messages, dict):
+        messages = messages.get("messages")
+
+    if not isinstance(messages, list):
+        raise ErrorResponse(
+            HTTPStatus.BAD_REQUEST,
+            "BadRequest",
+            "The request body has to be a list of messages.",
+        )
+
+    texts = []
+    for message in messages:
+        if isinstance(message, str):
+            message = {"text": message}
+
+        try:
+            text = emulator.normalise_request_json(message).get("text")
+        except (AttributeError, KeyError, IndexError, TypeError):
+            text = None
+
+        if not isinstance(text, str):
+            raise ErrorResponse(
+                HTTPStatus.BAD_REQUEST,
+                "BadRequest",
+                f"Invalid message '{message}'. Messages have to be texts or objects "
+                f"with a 'text' key.",
+            )
+        texts.append(text)
+
+    return texts
+
+
+def _max_parse_batch_size() -> int:
+    """Returns the maximum number of messages which are parsed in one batch.
+
+    Raises:
+        InvalidConfigException: If the configured size isn't a positive integer.
+    """
+    configured_size = os.environ.get(
+        ENV_MAX_PARSE_BATCH_SIZE, DEFAULT_MAX_PARSE_BATCH_SIZE
+    )
+    try:
+        max_batch_size = int(configured_size)
+    except ValueError:
+        max_batch_size = 0
+
+    if max_batch_size <= 0:
+        raise InvalidConfigException(
+            f"Environment variable '{ENV_MAX_PARSE_BATCH_SIZE}' has to be a positive "
+            f"integer, but it is '{configured_size}'."
+        )
+
+    return max_batch_size
+
+
 def validate_events_in_request_body(request: Request) -> None:
     """Validates events format in request body."""
     if not isinstance(request.json, list):
@@ -677,6 +745,7 @@ def create_app(
         )
 
     app.ctx.agent = agent
+    max_batch_size = _max_parse_batch_size()
     # Initialize shared object of type unsigned int for tracking
     # the number of active training processes
     app.ctx.active_training_processes = multiprocessing.Value("I", 0)
@@ -704,11 +773,13 @@ def create_app(
     @ensure_loaded_agent(app)
     async def status(request: Request) -> HTTPResponse:
         """Respond with the model name and the fingerprint of that model."""
+        inference_metrics = app.ctx.agent.processor.inference_executor.metrics
         return response.json(
             {
                 "model_file": app.ctx.agent.processor.model_filename,
                 "model_id": app.ctx.agent.model_id,
                 "num_active_training_jobs": app.ctx.active_training_processes.value,
+                "inference": inference_metrics.as_dict(),
             }
         )
 
@@ -1327,6 +1398,65 @@ def create_app(
                 f"An unexpected error occurred. Error: {e}",
             )
 
+    @app.post("/model/parse/batch")
+    @requires_auth(app, auth_token)
+    @ensure_loaded_agent(app)
+    async def parse_batch(request: Request) -> Optional[HTTPResponse]:
+        """Parses a list of messages with batched runs of the NLU pipeline."""
+        validate_request_body(
+            request,
+            "No messages defined in request_body. Add a list of text messages to "
+            "the request body in order to obtain their intents and entities.",
+        )
+        emulator = _create_emulator(request.args.get("emulation_mode"))
+        texts = _texts_from_batch_parse_request(request, emulator)
+
+        if not rasa.utils.endpoints.bool_arg(request, "stream", default=False):
+            if len(texts) > max_batch_size:
+                raise ErrorResponse(
+                    HTTPStatus.BAD_REQUEST,
+                    "BadRequest",
+                    f"The request contains {len(texts)} messages, but at most "
+                    f"{max_batch_size} messages can be parsed at once. Use "
+                    f"`stream=true` to parse them in batches of {max_batch_size} "
+                    f"messages.",
+                )
+            try:
+                parsed_data = await app.ctx.agent.parse_messages(texts)
+            except Exception as e:
+                logger.debug(traceback.format_exc())
+                raise ErrorResponse(
+                    HTTPStatus.BAD_REQUEST,
+                    "ParsingError",
+                    f"An unexpected error occurred. Error: {e}",
+                )
+
+            return response.json(
+                [emulator.normalise_response_json(data) for data in parsed_data]
+            )
+
+        # results are sent as newline delimited JSON as soon as a batch is parsed
+        stream = await request.respond(content_type="application/x-ndjson")
+        for start in range(0, len(texts), max_batch_size):
+            try:
+                parsed_data = await app.ctx.agent.parse_messages(
+                    texts[start : start + max_batch_size]
+                )
+            except Exception as e:
+                logger.debug(traceback.format_exc())
+                error = {"error": "ParsingError", "message": str(e)}
+                await stream.send(json.dumps(error) + "\n")
+                break
+
+            await stream.send(
+                "".join(
+                    json.dumps(emulator.normalise_response_json(data)) + "\n"
+                    for data in parsed_data
+                )
+            )
+        await stream.eof()
+        return None
+
     @app.put("/model")
     @requires_auth(app, auth_token)
     async def load_model(request: Request) -> HTTPResponse:
@@ -13,6 +13,7 @@ from typing import (
     Set,
     Text,
     Tuple,
+    Type,
     Union,
     TYPE_CHECKING,
     Iterable,
@@ -54,7 +55,7 @@ import rasa.shared.utils.validation
 import rasa.shared.utils.io
 import rasa.shared.utils.common
 import rasa.shared.core.slot_mappings
-from rasa.shared.core.events import SlotSet, UserUttered
+from rasa.shared.core.events import ActionExecuted, Event, SlotSet, UserUttered
 from rasa.shared.core.slots import Slot, CategoricalSlot, TextSlot, AnySlot, ListSlot
 from rasa.shared.utils.validation import KEY_TRAINING_DATA_FORMAT_VERSION
 from rasa.shared.nlu.constants import (
@@ -1339,6 +1340,10 @@ class Domain:
     ) -> List[State]:
         """List of states for each state of the trackers history.
 
+        The states are cached by the tracker (if it has a `past_states_cache`), so
+        that the states of events which were already seen in a previous call don't
+        have to be computed again.
+
         Args:
             tracker: Dialogue state tracker containing the dialogue so far.
             omit_unset_slots: If `True` do not include the initial values of slots.
@@ -1350,48 +1355,90 @@ class Domain:
         Return:
             A list of states.
         """
-        states: List[State] = []
-        last_ml_action_sub_state = None
-        turn_was_hidden = False
-        for tr, hide_rule_turn in tracker.generate_all_prior_trackers():
-            if ignore_rule_only_turns:
-                # remember previous ml action based on the last non hidden turn
-                # we need this to override previous action in the ml state
-                if not turn_was_hidden:
-                    last_ml_action_sub_state = self._get_prev_action_sub_state(tr)
-
-                # followup action or happy path loop prediction
-                # don't change the fact whether dialogue turn should be hidden
-                if (
-                    not tr.followup_action
-                    and not tr.latest_action_name == tr.active_loop_name
-                ):
-                    turn_was_hidden = hide_rule_turn
-
-                if turn_was_hidden:
-                    continue
+        applied_events = tracker.applied_events()
+        cache_key = (omit_unset_slots, ignore_rule_only_turns)
 
-            state = self.get_active_state(tr, omit_unset_slots=omit_unset_slots)
-
-            if ignore_rule_only_turns:
-                # clean state from only rule features
-                self._remove_rule_only_features(state, rule_only_data)
-                # make sure user input is the same as for previous state
-                # for non action_listen turns
-                if states:
-                    self._substitute_rule_only_user_input(state, states[-1])
-                # substitute previous rule action with last_ml_action_sub_state
-                if last_ml_action_sub_state:
-                    # FIXME: better type annotation for `State` would require
-                    # a larger refactoring (e.g. switch to dataclass)
-                    state[rasa.shared.core.constants.PREVIOUS_ACTION] = cast(
-                        SubState,
-                        last_ml_action_sub_state,
-                    )
+        cache = tracker.past_states_cache
+        history = cache.get(cache_key) if cache is not None else None
+        if history is None or not history.is_continued_by(
+            self, rule_only_data, applied_events
+        ):
+            history = TrackerHistoryStates(
+                self, tracker, omit_unset_slots, ignore_rule_only_turns, rule_only_data
+            )
+            if cache is not None:
+                cache[cache_key] = history
+
+        history.add_events(applied_events[len(history.applied_events) :])
 
-            states.append(self._clean_state(state))
+        return history.states()
 
-        return states
+    def _history_state(
+        self,
+        tracker: "DialogueStateTracker",
+        hide_rule_turn: bool,
+        previous_states: List[State],
+        last_ml_action_sub_state: Optional[Dict[Text, Text]],
+        turn_was_hidden: bool,
+        omit_unset_slots: bool = False,
+        ignore_rule_only_turns: bool = False,
+        rule_only_data: Optional[Dict[Text, Any]] = None,
+    ) -> Tuple[Optional[State], Optional[Dict[Text, Text]], bool]:
+        """Computes the state of one prior tracker of a tracker's history.
+
+        Args:
+            tracker: The prior tracker.
+            hide_rule_turn: Whether the turn should be hidden from ML policies.
+            previous_states: The states of the earlier prior trackers.
+            last_ml_action_sub_state: The previous action of the last turn which
+                wasn't hidden.
+            turn_was_hidden: Whether the previous turn was hidden.
+            omit_unset_slots: If `True` do not include the initial values of slots.
+            ignore_rule_only_turns: If True ignore dialogue turns that are present
+                only in rules.
+            rule_only_data: Slots and loops,
+                which only occur in rules but not in stories.
+
+        Returns:
+            The state (`None` if the turn is hidden) and the updated values of
+            `last_ml_action_sub_state` and `turn_was_hidden`.
+        """
+        if ignore_rule_only_turns:
+            # remember previous ml action based on the last non hidden turn
+            # we need this to override previous action in the ml state
+            if not turn_was_hidden:
+                last_ml_action_sub_state = self._get_prev_action_sub_state(tracker)
+
+            # followup action or happy path loop prediction
+            # don't change the fact whether dialogue turn should be hidden
+            if (
+                not tracker.followup_action
+                and not tracker.latest_action_name == tracker.active_loop_name
+            ):
+                turn_was_hidden = hide_rule_turn
+
+            if turn_was_hidden:
+                return None, last_ml_action_sub_state, turn_was_hidden
+
+        state = self.get_active_state(tracker, omit_unset_slots=omit_unset_slots)
+
+        if ignore_rule_only_turns:
+            # clean state from only rule features
+            self._remove_rule_only_features(state, rule_only_data)
+            # make sure user input is the same as for previous state
+            # for non action_listen turns
+            if previous_states:
+                self._substitute_rule_only_user_input(state, previous_states[-1])
+            # substitute previous rule action with last_ml_action_sub_state
+            if last_ml_action_sub_state:
+                # FIXME: better type annotation for `State` would require
+                # a larger refactoring (e.g. switch to dataclass)
+                state[rasa.shared.core.constants.PREVIOUS_ACTION] = cast(
+                    SubState,
+                    last_ml_action_sub_state,
+                )
+
+        return self._clean_state(state), last_ml_action_sub_state, turn_was_hidden
 
     def slots_for_entities(self, entities: List[Dict[Text, Any]]) -> List[SlotSet]:
         """Creates slot events for entities if from_entity mapping matches.
@@ -1479,6 +1526,14 @@ class Domain:
         """Return serialized `Domain`."""
         return self._data
 
+    @rasa.shared.utils.common.lazy_property
+    def json_data(self) -> Text:
+        """Returns the serialized `Domain` as JSON.
+
+        The JSON is only computed once as the domain doesn't change after loading.
+        """
+        return json.dumps(self.as_dict())
+
     @staticmethod
     def get_responses_with_multilines(
         responses: Dict[Text, List[Dict[Text, Any]]]
@@ -1971,3 +2026,138 @@ def _validate_forms(forms: Union[Dict, List]) -> None:
                 f"the keyword `{REQUIRED_SLOTS_KEY}` is required. "
                 f"Please see {DOCS_URL_FORMS} for more information."
             )
+
+
+class TrackerHistoryStates:
+    """Computes the states of a tracker's history incrementally.
+
+    The states of the prior trackers are kept, so that only the states of new
+    events have to be computed when the tracker is updated.
+    """
+
+    def __init__(
+        self,
+        domain: Domain,
+        tracker: "DialogueStateTracker",
+        omit_unset_slots: bool = False,
+        ignore_rule_only_turns: bool = False,
+        rule_only_data: Optional[Dict[Text, Any]] = None,
+    ) -> None:
+        """Creates the states for a tracker without any events.
+
+        Args:
+            domain: The domain which is used to compute the states.
+            tracker: The tracker whose history is computed.
+            omit_unset_slots: If `True` do not include the initial values of slots.
+            ignore_rule_only_turns: If True ignore dialogue turns that are present
+                only in rules.
+            rule_only_data: Slots and loops,
+                which only occur in rules but not in stories.
+        """
+        self.domain = domain
+        self.omit_unset_slots = omit_unset_slots
+        self.ignore_rule_only_turns = ignore_rule_only_turns
+        self.rule_only_data = copy.deepcopy(rule_only_data)
+
+        # the applied events which were replayed so far
+        self.applied_events: List[Event] = []
+        self._replayed_tracker = tracker.init_copy()
+        # states of the trackers before each of the replayed `ActionExecuted` events
+        self._prior_states: List[State] = []
+        self._last_ml_action_sub_state: Optional[Dict[Text, Text]] = None
+        self._turn_was_hidden = False
+
+    def is_continued_by(
+        self,
+        domain: Domain,
+        rule_only_data: Optional[Dict[Text, Any]],
+        applied_events: List[Event],
+    ) -> bool:
+        """Checks whether the cached states can be used for a tracker.
+
+        Args:
+            domain: The domain which is used to compute the states.
+            rule_only_data: Slots and loops,
+                which only occur in rules but not in stories.
+            applied_events: The applied events of the tracker.
+
+        Returns:
+            `True` if the states were computed with the same domain and data, and
+            the replayed events are the start of `applied_events`.
+        """
+        if domain is not self.domain or rule_only_data != self.rule_only_data:
+            return False
+
+        if len(applied_events) < len(self.applied_events):
+            return False
+
+        return all(
+            replayed is event
+            for replayed, event in zip(self.applied_events, applied_events)
+        )
+
+    def add_events(self, events: List[Event]) -> None:
+        """Replays new applied events of the tracker.
+
+        Args:
+            events: The applied events which were added to the tracker.
+        """
+        for event in events:
+            if isinstance(event, ActionExecuted):
+                (
+                    state,
+                    self._last_ml_action_sub_state,
+                    self._turn_was_hidden,
+                ) = self._state_of_replayed_tracker(event.hide_rule_turn)
+                if state is not None:
+                    self._prior_states.append(state)
+
+            self._replayed_tracker.update(event)
+            self.applied_events.append(event)
+
+    def states(self) -> List[State]:
+        """Returns the states of the tracker's history.
+
+        Returns:
+            Copies of the states of the prior trackers and the state of the tracker
+            after all of its applied events.
+        """
+        states = list(self._prior_states)
+        state, _, _ = self._state_of_replayed_tracker(hide_rule_turn=False)
+        if state is not None:
+            states.append(state)
+
+        # callers are allowed to modify the states
+        return [
+            {state_type: copy.copy(sub_state) for state_type, sub_state in s.items()}
+            for s in states
+        ]
+
+    def _state_of_replayed_tracker(
+        self, hide_rule_turn: bool
+    ) -> Tuple[Optional[State], Optional[Dict[Text, Text]], bool]:
+        return self.domain._history_state(
+            self._replayed_tracker,
+            hide_rule_turn,
+            self._prior_states,
+            self._last_ml_action_sub_state,
+            self._turn_was_hidden,
+            omit_unset_slots=self.omit_unset_slots,
+            ignore_rule_only_turns=self.ignore_rule_only_turns,
+            rule_only_data=self.rule_only_data,
+        )
+
+
+class PastStatesCache(Dict[Tuple[bool, bool], TrackerHistoryStates]):
+    """Cache of the history states of a tracker by the featurization flags.
+
+    The cache isn't copied or pickled together with its tracker.
+    """
+
+    def __reduce__(self) -> Tuple[Type["PastStatesCache"], Tuple]:
+        """Creates an empty cache when the tracker is copied or pickled."""
+        return self.__class__, ()
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "PastStatesCache":
+        """Creates an empty cache when the tracker is copied."""
+        return self.__class__()
@@ -2,7 +2,9 @@ from collections import defaultdict, namedtuple, deque
 
 import copy
 import logging
+import multiprocessing
 import random
+from concurrent.futures import Executor, ProcessPoolExecutor
 from contextlib import contextmanager
 
 from tqdm import tqdm
@@ -76,6 +78,8 @@ class TrackerWithCachedStates(DialogueStateTracker):
             sender_id, slots, max_event_history, is_rule_tracker=is_rule_tracker
         )
         self._states_for_hashing: Deque[FrozenState] = deque()
+        # the states are cached in `_states_for_hashing` instead
+        self.past_states_cache = None
         self.domain = domain if domain is not None else Domain.empty()
         # T/F property to filter augmented stories
         self.is_augmented = is_augmented
@@ -275,6 +279,7 @@ class TrainingDataGenerator:
         tracker_limit: Optional[int] = None,
         use_story_concatenation: bool = True,
         debug_plots: bool = False,
+        num_processes: int = 1,
     ):
         """Given a set of story parts, generates all stories that are possible.
 
@@ -282,6 +287,11 @@ class TrainingDataGenerator:
         and this generator will match start and end checkpoints to
         connect complete stories. Afterwards, duplicate stories will be
         removed and the data is augmented (if augmentation is enabled).
+
+        If `num_processes` is larger than 1, story parts which are not connected by
+        checkpoints are processed in separate processes. The generated trackers are
+        the same for every run, but differ from the ones generated by one process as
+        trackers are subsampled per process.
         """
         self.story_graph = story_graph.with_cycles_removed()
         if debug_plots:
@@ -303,6 +313,7 @@ class TrainingDataGenerator:
         )
         # hashed featurization of all finished trackers
         self.hashed_featurizations: Set[int] = set()
+        self.num_processes = num_processes
 
     @staticmethod
     def _phase_name(everything_reachable_is_reached: bool, phase: int) -> Text:
@@ -357,6 +368,256 @@ class TrainingDataGenerator:
             )
         self._mark_first_action_in_story_steps_as_unpredictable()
 
+        # do not augment rule data
+        if not is_rule_data:
+            min_num_aug_phases = 3 if self.config.augmentation_factor > 0 else 0
+            logger.debug(f"Number of augmentation rounds is {min_num_aug_phases}")
+        else:
+            min_num_aug_phases = 0
+
+        partitions = self._partition_story_steps(story_steps)
+        if len(partitions) > 1:
+            finished_trackers, unused_checkpoints = self._generate_in_processes(
+                partitions, is_rule_data, min_num_aug_phases
+            )
+        else:
+            (
+                finished_trackers,
+                story_end_trackers,
+                unused_checkpoints,
+            ) = self._generate_trackers(story_steps, is_rule_data, min_num_aug_phases)
+            finished_trackers.extend(story_end_trackers)
+
+        self._issue_unused_checkpoint_notification(unused_checkpoints)
+        logger.debug("Found {} training trackers.".format(len(finished_trackers)))
+
+        if self.config.augmentation_factor > 0:
+            augmented_trackers, original_trackers = [], []
+            for t in finished_trackers:
+                if t.is_augmented:
+                    augmented_trackers.append(t)
+                else:
+                    original_trackers.append(t)
+            augmented_trackers = self._subsample_trackers(
+                augmented_trackers, self.config.max_number_of_augmented_trackers
+            )
+            logger.debug(
+                "Subsampled to {} augmented training trackers."
+                "".format(len(augmented_trackers))
+            )
+            logger.debug(
+                "There are {} original trackers.".format(len(original_trackers))
+            )
+            finished_trackers = original_trackers + augmented_trackers
+
+        return finished_trackers
+
+    def _partition_story_steps(
+        self, story_steps: List[StoryStep]
+    ) -> List[List[StoryStep]]:
+        """Splits the story steps into partitions which can be processed separately.
+
+        Story steps which are connected by checkpoints (apart from the story start)
+        have to be processed together as trackers are passed between them. These
+        components are distributed across `num_processes` partitions so that every
+        partition has about the same number of story steps.
+
+        Args:
+            story_steps: The story steps in the order in which they are processed.
+
+        Returns:
+            The partitions. Every partition keeps the order of `story_steps`.
+        """
+        if self.num_processes <= 1 or len(story_steps) <= 1:
+            return [story_steps]
+
+        parents = list(range(len(story_steps)))
+
+        def find(index: int) -> int:
+            while parents[index] != index:
+                parents[index] = parents[parents[index]]
+                index = parents[index]
+            return index
+
+        step_by_checkpoint: Dict[Text, int] = {}
+        for index, step in enumerate(story_steps):
+            checkpoint_names = [start.name for start in step.start_checkpoints] + [
+                self._find_start_checkpoint_name(end.name)
+                for end in step.end_checkpoints
+            ]
+            for name in checkpoint_names:
+                if name == STORY_START:
+                    continue
+                if name not in step_by_checkpoint:
+                    step_by_checkpoint[name] = index
+                else:
+                    parents[find(index)] = find(step_by_checkpoint[name])
+
+        components: Dict[int, List[int]] = defaultdict(list)
+        for index in range(len(story_steps)):
+            components[find(index)].append(index)
+
+        num_partitions = min(self.num_processes, len(components))
+        if num_partitions <= 1:
+            return [story_steps]
+
+        # assign the largest components first to the partition with the fewest
+        # story steps, ties are resolved by order to keep the result stable
+        partitions: List[List[int]] = [[] for _ in range(num_partitions)]
+        for component in sorted(
+            components.values(), key=lambda indices: (-len(indices), indices[0])
+        ):
+            smallest = min(partitions, key=len)
+            smallest.extend(component)
+
+        return [
+            [story_steps[index] for index in sorted(partition)]
+            for partition in partitions
+        ]
+
+    def _generate_in_processes(
+        self,
+        partitions: List[List[StoryStep]],
+        is_rule_data: bool,
+        min_num_aug_phases: int,
+    ) -> Tuple[List[TrackerWithCachedStates], Set[Text]]:
+        """Generates the trackers for every partition in a separate process.
+
+        Every process generates the trackers of its partition until all reachable
+        checkpoints are reached. The workers only deduplicate the trackers of their
+        own partition, hence the finished trackers and the trackers which reached a
+        story end are deduplicated across all partitions in this process. The
+        latter are then used as start trackers for the augmentation rounds, which
+        are again run in parallel.
+
+        Args:
+            partitions: The story steps of every partition.
+            is_rule_data: Whether the story steps are rules.
+            min_num_aug_phases: The number of augmentation rounds.
+
+        Returns:
+            The finished trackers and the unused checkpoints.
+        """
+        logger.debug(
+            f"Generating trackers for {len(partitions)} partitions of story blocks "
+            f"in {self.num_processes} processes."
+        )
+        finished_trackers: List[TrackerWithCachedStates] = []
+        story_end_trackers: List[TrackerWithCachedStates] = []
+        unused_checkpoints_per_partition: List[Set[Text]] = []
+
+        # the workers don't need the featurizations which were already hashed in
+        # this process (and hashes aren't stable across processes anyway)
+        worker_generator = copy.copy(self)
+        worker_generator.hashed_featurizations = set()
+
+        with ProcessPoolExecutor(
+            max_workers=len(partitions),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(worker_generator,),
+        ) as executor:
+            results = self._run_partitions(executor, partitions, is_rule_data)
+            for finished, story_ends, unused_checkpoints in results:
+                finished_trackers.extend(
+                    self._remove_duplicate_finished_trackers(finished)
+                )
+                story_end_trackers.extend(
+                    self._remove_duplicate_story_end_trackers(story_ends)
+                )
+                unused_checkpoints_per_partition.append(unused_checkpoints)
+            logger.debug("Data generation rounds finished.")
+
+            for phase in range(min_num_aug_phases):
+                start_trackers = self._create_start_trackers_for_augmentation(
+                    story_end_trackers
+                )[STORY_START]
+                if not start_trackers:
+                    logger.debug(
+                        f"There are no trackers for augmentation round {phase}"
+                    )
+                    break
+
+                logger.debug(
+                    f"Starting augmentation round {phase} ... "
+                    f"(with {len(start_trackers)} trackers)"
+                )
+                results = self._run_partitions(
+                    executor, partitions, is_rule_data, start_trackers
+                )
+                for finished, story_ends, _ in results:
+                    finished_trackers.extend(
+                        self._remove_duplicate_finished_trackers(finished)
+                    )
+                    story_end_trackers.extend(
+                        self._remove_duplicate_story_end_trackers(story_ends)
+                    )
+
+        finished_trackers.extend(story_end_trackers)
+
+        # a checkpoint is only processed by the partition that contains it, the
+        # story start is the only checkpoint which is shared by the partitions
+        unused_checkpoints = set.union(*unused_checkpoints_per_partition)
+        if any(
+            STORY_START not in unused for unused in unused_checkpoints_per_partition
+        ):
+            unused_checkpoints.discard(STORY_START)
+
+        return finished_trackers, unused_checkpoints
+
+    def _run_partitions(
+        self,
+        executor: Executor,
+        partitions: List[List[StoryStep]],
+        is_rule_data: bool,
+        start_trackers: Optional[List[TrackerWithCachedStates]] = None,
+    ) -> List[
+        Tuple[List[TrackerWithCachedStates], List[TrackerWithCachedStates], Set[Text]]
+    ]:
+        """Processes every partition in the executor and collects the results.
+
+        The random seeds of the workers are drawn from the random generator of this
+        process so that the results only depend on the seed of this generator.
+        """
+        futures = [
+            executor.submit(
+                _generate_partition_trackers,
+                partition,
+                is_rule_data,
+                self.config.rand.randrange(2**32),
+                start_trackers,
+            )
+            for partition in partitions
+        ]
+
+        results = []
+        for future in futures:
+            finished, story_ends, unused_checkpoints = future.result()
+            # the unpickled trackers have a copy of the domain, restore the domain
+            # of this generator so that their states can be compared
+            for tracker in finished + story_ends:
+                tracker.domain = self.domain
+            results.append((finished, story_ends, unused_checkpoints))
+
+        return results
+
+    def _generate_trackers(
+        self,
+        story_steps: List[StoryStep],
+        is_rule_data: bool,
+        min_num_aug_phases: int,
+    ) -> Tuple[List[TrackerWithCachedStates], List[TrackerWithCachedStates], Set[Text]]:
+        """Generates the trackers for story steps.
+
+        Args:
+            story_steps: The story steps in the order in which they are processed.
+            is_rule_data: Whether the story steps are rules.
+            min_num_aug_phases: The number of augmentation rounds.
+
+        Returns:
+            The finished trackers, the trackers which reached a story end, and the
+            unused checkpoints.
+        """
         active_trackers: DefaultDict[Text, List[TrackerWithCachedStates]] = defaultdict(
             list
         )
@@ -371,19 +632,12 @@ class TrainingDataGenerator:
         active_trackers[STORY_START].append(init_tracker)
 
         # trackers that are sent to a featurizer
-        finished_trackers = []
+        finished_trackers: List[TrackerWithCachedStates] = []
         # keep story end trackers separately for augmentation
-        story_end_trackers = []
+        story_end_trackers: List[TrackerWithCachedStates] = []
 
         phase = 0  # one phase is one traversal of all story steps.
 
-        # do not augment rule data
-        if not is_rule_data:
-            min_num_aug_phases = 3 if self.config.augmentation_factor > 0 else 0
-            logger.debug(f"Number of augmentation rounds is {min_num_aug_phases}")
-        else:
-            min_num_aug_phases = 0
-
         # placeholder to track gluing process of checkpoints
         used_checkpoints: Set[Text] = set()
         previous_unused: Set[Text] = set()
@@ -411,69 +665,16 @@ class TrainingDataGenerator:
             # track unused checkpoints for this phase
             unused_checkpoints: Set[Text] = set()
 
-            desc = f"Processed {'rules' if is_rule_data else 'story blocks'}"
-            pbar = tqdm(story_steps, desc=desc, disable=is_logging_disabled())
-            for step in pbar:
-                incoming_trackers: List[TrackerWithCachedStates] = []
-                for start in step.start_checkpoints:
-                    if active_trackers[start.name]:
-                        ts = start.filter_trackers(active_trackers[start.name])
-                        incoming_trackers.extend(ts)
-                        used_checkpoints.add(start.name)
-                    elif start.name not in used_checkpoints:
-                        # need to skip - there was no previous step that
-                        # had this start checkpoint as an end checkpoint
-                        # it will be processed in next phases
-                        unused_checkpoints.add(start.name)
-                if not incoming_trackers:
-                    # if there are no trackers,
-                    # we can skip the rest of the loop
-                    continue
-
-                # these are the trackers that reached this story
-                # step and that need to handle all events of the step
-
-                if self.config.remove_duplicates:
-                    incoming_trackers, end_trackers = self._remove_duplicate_trackers(
-                        incoming_trackers
-                    )
-
-                    # append end trackers to finished trackers
-                    finished_trackers.extend(end_trackers)
-
-                if everything_reachable_is_reached:
-                    # augmentation round
-                    incoming_trackers = self._subsample_trackers(
-                        incoming_trackers, self.config.max_number_of_augmented_trackers
-                    )
-
-                # update progress bar
-                pbar.set_postfix({"# trackers": "{:d}".format(len(incoming_trackers))})
-
-                trackers, end_trackers = self._process_step(step, incoming_trackers)
-
-                # add end trackers to finished trackers
-                finished_trackers.extend(end_trackers)
-
-                # update our tracker dictionary with the trackers
-                # that handled the events of the step and
-                # that can now be used for further story steps
-                # that start with the checkpoint this step ended with
-
-                for end in step.end_checkpoints:
-                    start_name = self._find_start_checkpoint_name(end.name)
-
-                    active_trackers[start_name].extend(trackers)
-
-                    if start_name in used_checkpoints:
-                        # add end checkpoint as unused
-                        # if this checkpoint was processed as
-                        # start one before
-                        unused_checkpoints.add(start_name)
-
-                if not step.end_checkpoints:
-                    unique_ends = self._remove_duplicate_story_end_trackers(trackers)
-                    story_end_trackers.extend(unique_ends)
+            self._process_story_steps(
+                story_steps,
+                active_trackers,
+                used_checkpoints,
+                unused_checkpoints,
+                everything_reachable_is_reached,
+                is_rule_data,
+                finished_trackers,
+                story_end_trackers,
+            )
 
             num_finished = len(finished_trackers) + len(story_end_trackers)
             logger.debug(f"Finished phase ({num_finished} training samples found).")
@@ -537,30 +738,83 @@ class TrainingDataGenerator:
                     story_end_trackers
                 )
 
-        finished_trackers.extend(story_end_trackers)
-        self._issue_unused_checkpoint_notification(previous_unused)
-        logger.debug("Found {} training trackers.".format(len(finished_trackers)))
+        return finished_trackers, story_end_trackers, previous_unused
 
-        if self.config.augmentation_factor > 0:
-            augmented_trackers, original_trackers = [], []
-            for t in finished_trackers:
-                if t.is_augmented:
-                    augmented_trackers.append(t)
-                else:
-                    original_trackers.append(t)
-            augmented_trackers = self._subsample_trackers(
-                augmented_trackers, self.config.max_number_of_augmented_trackers
-            )
-            logger.debug(
-                "Subsampled to {} augmented training trackers."
-                "".format(len(augmented_trackers))
-            )
-            logger.debug(
-                "There are {} original trackers.".format(len(original_trackers))
-            )
-            finished_trackers = original_trackers + augmented_trackers
+    def _process_story_steps(
+        self,
+        story_steps: List[StoryStep],
+        active_trackers: TrackerLookupDict,
+        used_checkpoints: Set[Text],
+        unused_checkpoints: Set[Text],
+        everything_reachable_is_reached: bool,
+        is_rule_data: bool,
+        finished_trackers: List[TrackerWithCachedStates],
+        story_end_trackers: List[TrackerWithCachedStates],
+    ) -> None:
+        """Processes all story steps once with the trackers which reach them."""
+        desc = f"Processed {'rules' if is_rule_data else 'story blocks'}"
+        pbar = tqdm(story_steps, desc=desc, disable=is_logging_disabled())
+        for step in pbar:
+            incoming_trackers: List[TrackerWithCachedStates] = []
+            for start in step.start_checkpoints:
+                if active_trackers[start.name]:
+                    ts = start.filter_trackers(active_trackers[start.name])
+                    incoming_trackers.extend(ts)
+                    used_checkpoints.add(start.name)
+                elif start.name not in used_checkpoints:
+                    # need to skip - there was no previous step that
+                    # had this start checkpoint as an end checkpoint
+                    # it will be processed in next phases
+                    unused_checkpoints.add(start.name)
+            if not incoming_trackers:
+                # if there are no trackers,
+                # we can skip the rest of the loop
+                continue
+
+            # these are the trackers that reached this story
+            # step and that need to handle all events of the step
+
+            if self.config.remove_duplicates:
+                incoming_trackers, end_trackers = self._remove_duplicate_trackers(
+                    incoming_trackers
+                )
 
-        return finished_trackers
+                # append end trackers to finished trackers
+                finished_trackers.extend(end_trackers)
+
+            if everything_reachable_is_reached:
+                # augmentation round
+                incoming_trackers = self._subsample_trackers(
+                    incoming_trackers, self.config.max_number_of_augmented_trackers
+                )
+
+            # update progress bar
+            pbar.set_postfix({"# trackers": "{:d}".format(len(incoming_trackers))})
+
+            trackers, end_trackers = self._process_step(step, incoming_trackers)
+
+            # add end trackers to finished trackers
+            finished_trackers.extend(end_trackers)
+
+            # update our tracker dictionary with the trackers
+            # that handled the events of the step and
+            # that can now be used for further story steps
+            # that start with the checkpoint this step ended with
+
+            for end in step.end_checkpoints:
+                start_name = self._find_start_checkpoint_name(end.name)
+
+                active_trackers[start_name].extend(trackers)
+
+                if start_name in used_checkpoints:
+                    # add end checkpoint as unused
+                    # if this checkpoint was processed as
+                    # start one before
+                    unused_checkpoints.add(start_name)
+
+            if not step.end_checkpoints:
+                unique_ends = self._remove_duplicate_story_end_trackers(trackers)
+                story_end_trackers.extend(unique_ends)
 
     @staticmethod
     def _count_trackers(active_trackers: TrackerLookupDict) -> int:
@@ -573,7 +827,6 @@ class TrainingDataGenerator:
         max_number_of_trackers: int,
     ) -> List[TrackerWithCachedStates]:
         """Subsample the list of trackers to retrieve a random subset."""
-
         # if flows get very long and have a lot of forks we
         # get into trouble by collecting too many trackers
         # hence the sub sampling
@@ -585,7 +838,7 @@ class TrainingDataGenerator:
             return incoming_trackers
 
     def _find_start_checkpoint_name(self, end_name: Text) -> Text:
-        """Find start checkpoint name given end checkpoint name of a cycle"""
+        """Find start checkpoint name given end checkpoint name of a cycle."""
         return self.story_graph.story_end_checkpoints.get(end_name, end_name)
 
     @staticmethod
@@ -595,9 +848,8 @@ class TrainingDataGenerator:
         used_checkpoints: Set[Text],
     ) -> Set[Text]:
         """Add unused end checkpoints
-        if they were never encountered as start checkpoints
+        if they were never encountered as start checkpoints.
         """
-
         return unused_checkpoints.union(
             {
                 start_name
@@ -611,7 +863,8 @@ class TrainingDataGenerator:
         active_trackers: TrackerLookupDict, unused_checkpoints: Set[Text]
     ) -> TrackerLookupDict:
         """Filter active trackers that ended with unused checkpoint
-        or are parts of loops."""
+        or are parts of loops.
+        """
         next_active_trackers = defaultdict(list)
 
         for start_name in unused_checkpoints:
@@ -667,8 +920,8 @@ class TrainingDataGenerator:
 
         The trackers that reached the steps starting checkpoint will
         be used to process the events. Collects and returns training
-        data while processing the story step."""
-
+        data while processing the story step.
+        """
         events = step.explicit_events(self.domain)
 
         trackers = []
@@ -739,8 +992,8 @@ class TrainingDataGenerator:
         we only need to keep one. Because as we continue processing
         events and story steps, all trackers that created the
         same featurization once will do so in the future (as we
-        feed the same events to all trackers)."""
-
+        feed the same events to all trackers).
+        """
         step_hashed_featurizations = set()
 
         # collected trackers that created different featurizations
@@ -776,12 +1029,29 @@ class TrainingDataGenerator:
 
         return unique_trackers, end_trackers
 
+    def _remove_duplicate_finished_trackers(
+        self, trackers: List[TrackerWithCachedStates]
+    ) -> List[TrackerWithCachedStates]:
+        """Removes finished trackers which created already known featurizations.
+
+        The trackers are hashed the same way as the end trackers of
+        `_remove_duplicate_trackers`.
+        """
+        unique_trackers = []
+        for tracker in trackers:
+            hashed = hash(tuple(tracker.past_states_for_hashing(self.domain)))
+            if hashed not in self.hashed_featurizations:
+                self.hashed_featurizations.add(hashed)
+                unique_trackers.append(tracker)
+
+        return unique_trackers
+
     def _remove_duplicate_story_end_trackers(
         self, trackers: List[TrackerWithCachedStates]
     ) -> List[TrackerWithCachedStates]:
         """Removes trackers that reached story end and
-        created equal featurizations."""
-
+        created equal featurizations.
+        """
         # collected trackers that created different featurizations
         unique_trackers = []  # for all steps
 
@@ -811,8 +1081,8 @@ class TrainingDataGenerator:
         contain action listen events (they are added when a
         story gets converted to a dialogue) we need to apply a
         small trick to avoid marking actions occurring after
-        an action listen as unpredictable."""
-
+        an action listen as unpredictable.
+        """
         for step in self.story_graph.story_steps:
             # TODO: this does not work if a step is the conversational start
             #       as well as an intermediary part of a conversation.
@@ -840,8 +1110,8 @@ class TrainingDataGenerator:
         """Warns about unused story blocks.
 
         Unused steps are ones having a start or end checkpoint
-        that no one provided."""
-
+        that no one provided.
+        """
         if STORY_START in unused_checkpoints:
             rasa.shared.utils.io.raise_warning(
                 "There is no starting story block "
@@ -906,3 +1176,62 @@ def _subsample_array(
     else:
         random.shuffle(arr)
     return arr[:max_values]
+
+
+_worker_generator: Optional[TrainingDataGenerator] = None
+
+
+def _init_worker(generator: TrainingDataGenerator) -> None:
+    """Stores the generator in a worker process of the tracker generation."""
+    global _worker_generator
+    _worker_generator = generator
+
+
+def _generate_partition_trackers(
+    story_steps: List[StoryStep],
+    is_rule_data: bool,
+    seed: int,
+    start_trackers: Optional[List[TrackerWithCachedStates]] = None,
+) -> Tuple[List[TrackerWithCachedStates], List[TrackerWithCachedStates], Set[Text]]:
+    """Generates the trackers of a partition in a worker process.
+
+    Args:
+        story_steps: The story steps of the partition.
+        is_rule_data: Whether the story steps are rules.
+        seed: The seed for the random subsampling of trackers.
+        start_trackers: The trackers for an augmentation round. If `None`, the
+            trackers are generated from scratch until all checkpoints are reached.
+
+    Returns:
+        The finished trackers, the trackers which reached a story end, and the
+        unused checkpoints.
+    """
+    assert _worker_generator is not None, "The worker was not initialized."
+
+    generator = copy.copy(_worker_generator)
+    generator.hashed_featurizations = set()
+    generator.config = generator.config._replace(rand=random.Random(seed))
+
+    if start_trackers is None:
+        return generator._generate_trackers(
+            story_steps, is_rule_data, min_num_aug_phases=0
+        )
+
+    for tracker in start_trackers:
+        tracker.domain = generator.domain
+
+    active_trackers: TrackerLookupDict = defaultdict(list)
+    active_trackers[STORY_START] = start_trackers
+    finished_trackers: List[TrackerWithCachedStates] = []
+    story_end_trackers: List[TrackerWithCachedStates] = []
+    generator._process_story_steps(
+        story_steps,
+        active_trackers,
+        used_checkpoints=set(),
+        unused_checkpoints=set(),
+        everything_reachable_is_reached=True,
+        is_rule_data=is_rule_data,
+        finished_trackers=finished_trackers,
+        story_end_trackers=story_end_trackers,
+    )
+    return finished_trackers, story_end_trackers, set()
@@ -61,7 +61,7 @@ from rasa.shared.core.events import (
     ActionExecutionRejected,
     DefinePrevUserUtteredFeaturization,
 )
-from rasa.shared.core.domain import Domain, State
+from rasa.shared.core.domain import Domain, PastStatesCache, State
 from rasa.shared.core.slots import AnySlot, Slot
 
 if TYPE_CHECKING:
@@ -227,6 +227,14 @@ class DialogueStateTracker:
         self.model_id: Optional[Text] = None
         self.assistant_id: Optional[Text] = None
 
+        # whether the events of the tracker were persisted by a tracker store and
+        # the latest of the persisted events
+        self._is_persisted = False
+        self._latest_persisted_event: Optional[Event] = None
+
+        # states of the tracker's history which were computed for the policies
+        self.past_states_cache: Optional[PastStatesCache] = PastStatesCache()
+
     ###
     # Public tracker interface
     ###
@@ -445,6 +453,34 @@ class DialogueStateTracker:
         """Return a list of events after the most recent restart."""
         return list(self.events)[self.idx_after_latest_restart() :]
 
+    def mark_events_as_persisted(self) -> None:
+        """Marks all current events as persisted by a tracker store."""
+        self._is_persisted = True
+        self._latest_persisted_event = self.events[-1] if self.events else None
+
+    def unpersisted_events(self) -> Optional[List[Event]]:
+        """Returns the events which were added since the events were last persisted.
+
+        Returns:
+            The events after the latest persisted event or `None` if it is unknown
+            which events were persisted, e.g. because the tracker wasn't retrieved
+            from or saved to a tracker store.
+        """
+        if not self._is_persisted:
+            return None
+
+        if self._latest_persisted_event is None:
+            return list(self.events)
+
+        new_events: List[Event] = []
+        for event in reversed(self.events):
+            if event is self._latest_persisted_event:
+                new_events.reverse()
+                return new_events
+            new_events.append(event)
+
+        return None
+
     def init_copy(self) -> "DialogueStateTracker":
         """Creates a new state tracker with the same initial values."""
         return DialogueStateTracker(
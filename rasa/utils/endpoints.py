@@ -1,16 +1,22 @@
+import asyncio
 import ssl
 
 import aiohttp
 import os
 from aiohttp.client_exceptions import ContentTypeError
 from sanic.request import Request
-from typing import Any, Optional, Text, Dict
+from typing import Any, Optional, Set, Text, Dict
 
 from rasa.shared.exceptions import FileNotFoundException
 import rasa.shared.utils.io
 import rasa.utils.io
 import structlog
-from rasa.core.constants import DEFAULT_REQUEST_TIMEOUT
+from rasa.core.constants import (
+    DEFAULT_CONNECTION_KEEP_ALIVE_TIMEOUT,
+    DEFAULT_CONNECTION_LIMIT,
+    DEFAULT_CONNECTION_LIMIT_PER_HOST,
+    DEFAULT_REQUEST_TIMEOUT,
+)
 
 
 structlogger = structlog.get_logger()
@@ -89,6 +95,9 @@ class EndpointConfig:
         token: Optional[Text] = None,
         token_name: Text = "token",
         cafile: Optional[Text] = None,
+        connection_limit: int = DEFAULT_CONNECTION_LIMIT,
+        connection_limit_per_host: int = DEFAULT_CONNECTION_LIMIT_PER_HOST,
+        keepalive_timeout: float = DEFAULT_CONNECTION_KEEP_ALIVE_TIMEOUT,
         **kwargs: Any,
     ) -> None:
         """Creates an `EndpointConfig` instance."""
@@ -100,9 +109,21 @@ class EndpointConfig:
         self.token_name = token_name
         self.type = kwargs.pop("store_type", kwargs.pop("type", None))
         self.cafile = cafile
+        self.connection_limit = connection_limit
+        self.connection_limit_per_host = connection_limit_per_host
+        self.keepalive_timeout = keepalive_timeout
         self.kwargs = kwargs
 
-    def session(self) -> aiohttp.ClientSession:
+        self._ssl_context: Optional[ssl.SSLContext] = None
+        self._pooled_session: Optional[aiohttp.ClientSession] = None
+        self._pooled_session_loop: Optional[asyncio.AbstractEventLoop] = None
+        # keep references to the tasks which close replaced sessions so they aren't
+        # garbage collected
+        self._closing_sessions: Set[asyncio.Task] = set()
+
+    def session(
+        self, connector: Optional[aiohttp.BaseConnector] = None
+    ) -> aiohttp.ClientSession:
         """Creates and returns a configured aiohttp client session."""
         # create authentication parameters
         if self.basic_auth:
@@ -116,8 +137,85 @@ class EndpointConfig:
             headers=self.headers,
             auth=auth,
             timeout=aiohttp.ClientTimeout(total=DEFAULT_REQUEST_TIMEOUT),
+            connector=connector,
         )
 
+    def pooled_session(self) -> aiohttp.ClientSession:
+        """Returns the long-lived client session of this endpoint.
+
+        The session is created lazily for the running event loop. Its connection
+        pool keeps connections to the endpoint alive in between requests. The
+        session is owned by the endpoint and must not be closed by the caller, use
+        `close` instead.
+
+        Returns:
+            A configured aiohttp client session with a connection pool.
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            self._pooled_session is None
+            or self._pooled_session.closed
+            or self._pooled_session_loop is not loop
+        ):
+            self._close_pooled_session_of_other_loop(loop)
+            connector = aiohttp.TCPConnector(
+                limit=self.connection_limit,
+                limit_per_host=self.connection_limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            self._pooled_session = self.session(connector=connector)
+            self._pooled_session_loop = loop
+
+        return self._pooled_session
+
+    def _close_pooled_session_of_other_loop(
+        self, loop: asyncio.AbstractEventLoop
+    ) -> None:
+        """Closes the pooled session before it's replaced by one for `loop`.
+
+        Args:
+            loop: The running event loop.
+        """
+        session, session_loop = self._pooled_session, self._pooled_session_loop
+        if session is None or session.closed or session_loop is None:
+            return
+
+        if session_loop.is_running():
+            # the session is used by a loop in another thread, so it has to be
+            # closed on that loop
+            asyncio.run_coroutine_threadsafe(session.close(), session_loop)
+            return
+
+        # nothing runs on the loop of the session anymore, so its connections can
+        # be closed from the running loop
+        task = loop.create_task(session.close())
+        self._closing_sessions.add(task)
+        task.add_done_callback(self._closing_sessions.discard)
+
+    async def close(self) -> None:
+        """Closes the pooled client session of this endpoint if there is one."""
+        if self._pooled_session is not None and not self._pooled_session.closed:
+            await self._pooled_session.close()
+        self._pooled_session = None
+        self._pooled_session_loop = None
+
+    def ssl_context(self) -> Optional[ssl.SSLContext]:
+        """Returns the SSL context for the configured `cafile` (if any).
+
+        Raises:
+            FileNotFoundException: If the `cafile` doesn't exist.
+        """
+        if self.cafile and self._ssl_context is None:
+            try:
+                self._ssl_context = ssl.create_default_context(cafile=self.cafile)
+            except FileNotFoundError as e:
+                raise FileNotFoundException(
+                    f"Failed to find certificate file, "
+                    f"'{os.path.abspath(self.cafile)}' does not exist."
+                ) from e
+
+        return self._ssl_context
+
     def combine_parameters(
         self, kwargs: Optional[Dict[Text, Any]] = None
     ) -> Dict[Text, Any]:
@@ -159,37 +257,28 @@ class EndpointConfig:
             headers.update(self.headers)
 
         url = concat_url(self.url, subpath)
-
-        sslcontext = None
-        if self.cafile:
+        sslcontext = self.ssl_context()
+
+        session = self.pooled_session()
+        async with session.request(
+            method,
+            url,
+            headers=headers,
+            params=self.combine_parameters(kwargs),
+            compress=compress,
+            ssl=sslcontext,
+            **kwargs,
+        ) as response:
+            if response.status >= 400:
+                raise ClientResponseError(
+                    response.status,
+                    response.reason,
+                    await response.content.read(),
+                )
             try:
-                sslcontext = ssl.create_default_context(cafile=self.cafile)
-            except FileNotFoundError as e:
-                raise FileNotFoundException(
-                    f"Failed to find certificate file, "
-                    f"'{os.path.abspath(self.cafile)}' does not exist."
-                ) from e
-
-        async with self.session() as session:
-            async with session.request(
-                method,
-                url,
-                headers=headers,
-                params=self.combine_parameters(kwargs),
-                compress=compress,
-                ssl=sslcontext,
-                **kwargs,
-            ) as response:
-                if response.status >= 400:
-                    raise ClientResponseError(
-                        response.status,
-                        response.reason,
-                        await response.content.read(),
-                    )
-                try:
-                    return await response.json()
-                except ContentTypeError:
-                    return None
+                return await response.json()
+            except ContentTypeError:
+                return None
 
     @classmethod
     def from_dict(cls, data: Dict[Text, Any]) -> "EndpointConfig":
@@ -203,6 +292,9 @@ class EndpointConfig:
             self.basic_auth,
             self.token,
             self.token_name,
+            connection_limit=self.connection_limit,
+            connection_limit_per_host=self.connection_limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
             **self.kwargs,
         )
 
@@ -7,6 +7,10 @@ from safetensors.numpy import save_file
 
 import rasa.shared.utils.io
 
+PACKED_DENSE = "packed_dense"
+PACKED_SPARSE = "packed_sparse"
+PACKED_ARRAY = "packed_array"
+
 
 def _recursive_serialize(
     array: Any, prefix: str, data_dict: Dict[str, Any], metadata: List[Dict[str, Any]]
@@ -56,8 +60,14 @@ def _serialize_nested_data(
     prefix: str,
     data_dict: Dict[str, np.ndarray],
     metadata: List[Dict[str, Union[str, List]]],
+    pack_feature_arrays: bool = False,
 ) -> None:
-    """Handle serialization across dictionary and list levels."""
+    """Handle serialization across dictionary and list levels.
+
+    If `pack_feature_arrays` is `True`, all sparse or dense matrices of a feature
+    array are stored as one block (see `_serialize_packed`). Feature arrays which
+    can't be packed are stored with a tensor per matrix.
+    """
     for outer_key, inner_dict in nested_data.items():
         inner_metadata = {"key": outer_key, "components": []}
 
@@ -70,6 +80,10 @@ def _serialize_nested_data(
 
             for idx, feature_array in enumerate(feature_arrays):
                 feature_prefix = f"{prefix}_{outer_key}_{inner_key}_{idx}"
+                if pack_feature_arrays and _serialize_packed(
+                    feature_array, feature_prefix, data_dict, array_metadata["features"]
+                ):
+                    continue
                 _recursive_serialize(
                     feature_array.tolist(),
                     feature_prefix,
@@ -92,7 +106,13 @@ def serialize_nested_feature_arrays(
     data_dict: Dict[str, np.ndarray] = {}
     metadata: List[Dict[str, Union[str, List]]] = []
 
-    _serialize_nested_data(nested_feature_array, "component", data_dict, metadata)
+    _serialize_nested_data(
+        nested_feature_array,
+        "component",
+        data_dict,
+        metadata,
+        pack_feature_arrays=True,
+    )
 
     # Save serialized data and metadata
     save_file(data_dict, data_filename)
@@ -130,6 +150,148 @@ def _recursive_deserialize(
     return result
 
 
+def _flatten_object_array(
+    array: np.ndarray,
+) -> Optional[Tuple[List[List[int]], List[Any]]]:
+    """Flattens the nested lists of an object array into their leaves.
+
+    Returns:
+        The lengths of the lists on each nesting level and the leaves or `None` if
+        the leaves are not all on the same nesting level.
+    """
+    nodes = [array[index] for index in np.ndindex(array.shape)]
+    lengths = []
+
+    while nodes and all(isinstance(node, (list, tuple)) for node in nodes):
+        lengths.append([len(node) for node in nodes])
+        nodes = [child for node in nodes for child in node]
+
+    if not nodes or any(isinstance(node, (list, tuple)) for node in nodes):
+        return None
+
+    return lengths, nodes
+
+
+def _serialize_packed(
+    feature_array: "FeatureArray",
+    prefix: str,
+    data_dict: Dict[str, Any],
+    metadata: List[Dict[str, Any]],
+) -> bool:
+    """Serializes all matrices of a feature array as one block.
+
+    Sparse matrices are concatenated to one CSR matrix (`_data`, `_indices` and
+    `_indptr`) and dense matrices along their first axis (`_values`). The number of
+    rows of each matrix (`_rows`) and the lengths of nested lists (`_lengths_<level>`)
+    are needed to slice the matrices from the block again.
+
+    Returns:
+        `True` if the feature array was serialized, `False` if its matrices are not
+        of the same kind, e.g. they have different numbers of columns.
+    """
+    array = np.asarray(feature_array)
+
+    if array.dtype != object:
+        data_dict[f"{prefix}_array"] = np.ascontiguousarray(array)
+        metadata.append({"type": PACKED_ARRAY, "key": prefix})
+        return True
+
+    flattened = _flatten_object_array(array)
+    if flattened is None:
+        return False
+    lengths, leaves = flattened
+
+    if all(isinstance(leaf, scipy.sparse.spmatrix) for leaf in leaves):
+        if len({(leaf.shape[1], leaf.dtype) for leaf in leaves}) != 1:
+            return False
+
+        packed_matrix = scipy.sparse.vstack(leaves, format="csr")
+        data_dict.update(
+            {
+                f"{prefix}_data": packed_matrix.data,
+                f"{prefix}_indices": packed_matrix.indices,
+                f"{prefix}_indptr": packed_matrix.indptr,
+            }
+        )
+        item_metadata = {"type": PACKED_SPARSE, "columns": leaves[0].shape[1]}
+    elif all(
+        isinstance(leaf, np.ndarray) and leaf.dtype != object and leaf.ndim > 0
+        for leaf in leaves
+    ):
+        if len({(leaf.shape[1:], leaf.dtype) for leaf in leaves}) != 1:
+            return False
+
+        data_dict[f"{prefix}_values"] = np.concatenate(leaves)
+        item_metadata = {"type": PACKED_DENSE}
+    else:
+        return False
+
+    data_dict[f"{prefix}_rows"] = np.array(
+        [leaf.shape[0] for leaf in leaves], dtype=np.int64
+    )
+    for level, level_lengths in enumerate(lengths):
+        data_dict[f"{prefix}_lengths_{level}"] = np.array(level_lengths, dtype=np.int64)
+
+    metadata.append(
+        {
+            **item_metadata,
+            "key": prefix,
+            "shape": list(array.shape),
+            "levels": len(lengths),
+        }
+    )
+    return True
+
+
+def _deserialize_packed(item: Dict[str, Any], data: Dict[str, Any]) -> np.ndarray:
+    """Deserializes a feature array which was serialized by `_serialize_packed`.
+
+    The matrices are views of the loaded block, so they don't copy their values.
+    """
+    key = item["key"]
+
+    if item["type"] == PACKED_ARRAY:
+        return data[f"{key}_array"]
+
+    rows = data[f"{key}_rows"]
+    row_offsets = np.concatenate([[0], np.cumsum(rows)])
+
+    nodes: List[Any] = []
+    if item["type"] == PACKED_SPARSE:
+        values = data[f"{key}_data"]
+        indices = data[f"{key}_indices"]
+        indptr = data[f"{key}_indptr"]
+        for start, end in zip(row_offsets[:-1], row_offsets[1:]):
+            matrix_indptr = indptr[start : end + 1]
+            first, last = matrix_indptr[0], matrix_indptr[-1]
+            nodes.append(
+                scipy.sparse.csr_matrix(
+                    (
+                        values[first:last],
+                        indices[first:last],
+                        matrix_indptr - first,
+                    ),
+                    shape=(end - start, item["columns"]),
+                )
+            )
+    else:
+        values = data[f"{key}_values"]
+        for start, end in zip(row_offsets[:-1], row_offsets[1:]):
+            nodes.append(values[start:end])
+
+    for level in reversed(range(item["levels"])):
+        node_offsets = np.concatenate([[0], np.cumsum(data[f"{key}_lengths_{level}"])])
+        nodes = [
+            nodes[start:end] for start, end in zip(node_offsets[:-1], node_offsets[1:])
+        ]
+
+    array = np.empty(item["shape"], dtype=object)
+    for node, index in zip(nodes, np.ndindex(array.shape)):
+        array[index] = node
+
+    return array
+
+
 def _deserialize_nested_data(
     metadata: List[Dict[str, Any]], data_dict: Dict[str, Any]
 ) -> Dict[str, Dict[str, List["FeatureArray"]]]:
@@ -146,6 +308,15 @@ def _deserialize_nested_data(
 
             # Reconstruct the list of FeatureArrays
             for feature_item in inner_item["features"]:
+                if feature_item["type"] in [PACKED_ARRAY, PACKED_DENSE, PACKED_SPARSE]:
+                    feature_arrays.append(
+                        FeatureArray(
+                            _deserialize_packed(feature_item, data_dict),
+                            inner_item["number_of_dimensions"],
+                        )
+                    )
+                    continue
+
                 # Reconstruct the list of FeatureArrays
                 feature_array_data = _recursive_deserialize([feature_item], data_dict)
                 # Prepare the input for the FeatureArray;
@@ -0,0 +1,46 @@
+from pathlib import Path
+from typing import Callable
+
+from _pytest.monkeypatch import MonkeyPatch
+from _pytest.pytester import RunResult
+
+from rasa.engine.caching import CACHE_LOCATION_ENV
+from tests.cli.conftest import RASA_EXE
+
+
+def test_cache_prune_help(run: Callable[..., RunResult]):
+    output = run("cache", "prune", "--help")
+
+    help_text = f"""usage: {RASA_EXE} cache prune [-h] [-v] [-vv] [--quiet]
+                        [--logging-config-file LOGGING_CONFIG_FILE]
+                        [--max-size MAX_SIZE]"""
+
+    lines = help_text.split("\n")
+    # expected help text lines should appear somewhere in the output
+    printed_help = {line.strip() for line in output.outlines}
+    for line in lines:
+        assert line.strip() in printed_help
+
+
+def test_cache_info(
+    run: Callable[..., RunResult], monkeypatch: MonkeyPatch, tmp_path: Path
+):
+    cache_location = tmp_path / "cache"
+    monkeypatch.setenv(CACHE_LOCATION_ENV, str(cache_location))
+
+    output = run("cache", "info")
+
+    assert f"Cache location: {cache_location}" in output.outlines
+    assert "Cache entries: 0" in output.outlines
+    # showing the cache info doesn't create the cache
+    assert not cache_location.exists()
+
+
+def test_cache_prune_with_negative_size(
+    run: Callable[..., RunResult], monkeypatch: MonkeyPatch, tmp_path: Path
+):
+    monkeypatch.setenv(CACHE_LOCATION_ENV, str(tmp_path))
+
+    output = run("cache", "prune", "--max-size", "-1")
+
+    assert output.ret == 1
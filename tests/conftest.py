@@ -93,7 +93,10 @@ PATH_PYTEST_MARKER_MAPPINGS = {
         Path("tests", "core", "test_training.py").absolute(),
         Path("tests", "core", "test_examples.py").absolute(),
     ],
-    "category_performance": [Path("tests", "test_memory_leak.py").absolute()],
+    "category_performance": [
+        Path("tests", "test_memory_leak.py").absolute(),
+        Path("tests", "test_regex_benchmark.py").absolute(),
+    ],
 }
 
 
@@ -3169,3 +3169,41 @@ def test_initial_values_are_not_incorporated_into_rule_policy(
     policy.train(trackers, domain)
 
     assert not any(["has_said_hi" in rule for rule in policy.lookup[RULES]])
+
+
+def test_rule_index_only_returns_candidates_for_latest_state(policy: RulePolicy):
+    greet_rule_key = (
+        '[{"prev_action": {"action_name": "action_listen"}, '
+        '"user": {"intent": "greet"}}]'
+    )
+    goodbye_rule_key = (
+        '[{"prev_action": {"action_name": "action_listen"}, '
+        '"user": {"intent": "goodbye"}}]'
+    )
+    any_intent_rule_key = '[{"prev_action": {"action_name": "utter_greet"}}]'
+    conversation_start_rule_key = '[{"user": {"intent": "greet"}}]'
+    policy.lookup[RULES] = {
+        greet_rule_key: "utter_greet",
+        goodbye_rule_key: "utter_goodbye",
+        any_intent_rule_key: ACTION_LISTEN_NAME,
+        conversation_start_rule_key: "utter_welcome",
+    }
+    policy._build_rule_indices()
+
+    listen_state = {
+        PREVIOUS_ACTION: {ACTION_NAME: ACTION_LISTEN_NAME},
+        USER: {INTENT: "greet"},
+    }
+    assert policy._candidate_keys(RULES, [listen_state]) == {greet_rule_key}
+
+    after_greet_state = {PREVIOUS_ACTION: {ACTION_NAME: "utter_greet"}}
+    assert policy._candidate_keys(RULES, [after_greet_state]) == {any_intent_rule_key}
+
+    conversation_start_state = {USER: {INTENT: "greet"}}
+    assert policy._candidate_keys(RULES, [conversation_start_state]) == {
+        conversation_start_rule_key
+    }
+
+    # rules which were removed after indexing are not returned
+    del policy.lookup[RULES][greet_rule_key]
+    assert policy._candidate_keys(RULES, [listen_state]) == set()
@@ -1,3 +1,4 @@
+import gc
 import logging
 import textwrap
 from datetime import datetime
@@ -25,6 +26,8 @@ from rasa.core.actions.action import (
     ActionSessionStart,
     ActionEndToEndResponse,
     ActionExtractSlots,
+    SentTrackerRevision,
+    SentTrackerRevisions,
 )
 from rasa.core.actions.forms import FormAction
 from rasa.core.channels import CollectingOutputChannel, OutputChannel
@@ -625,6 +628,185 @@ async def test_remote_action_endpoint_responds_400(
     assert "Custom action 'my_action' rejected to run" in str(execinfo.value)
 
 
+async def test_remote_action_sends_cached_domain_json(
+    default_channel, default_nlg, default_tracker, domain: Domain
+):
+    endpoint = EndpointConfig("https://example.com/webhooks/actions")
+    remote_action = action.RemoteAction("my_action", endpoint)
+
+    with aioresponses() as mocked:
+        mocked.post(
+            "https://example.com/webhooks/actions",
+            payload={"events": [], "responses": []},
+        )
+
+        await remote_action.run(default_channel, default_nlg, default_tracker, domain)
+
+        r = latest_request(mocked, "post", "https://example.com/webhooks/actions")
+
+    assert json_of_latest_request(r)["domain"] == domain.as_dict()
+    # the domain is only serialised once
+    assert domain.json_data is domain.json_data
+
+
+async def test_remote_action_sends_tracker_events_delta(
+    default_channel, default_nlg, domain: Domain
+):
+    endpoint = EndpointConfig(
+        "https://example.com/webhooks/actions", enable_tracker_events_delta=True
+    )
+    remote_action = action.RemoteAction("my_action", endpoint)
+    tracker = DialogueStateTracker.from_events(
+        "test_remote_action_sends_tracker_events_delta",
+        [ActionExecuted(ACTION_LISTEN_NAME), UserUttered("hi")],
+    )
+
+    with aioresponses() as mocked:
+        for _ in range(2):
+            mocked.post(
+                "https://example.com/webhooks/actions",
+                payload={"events": [], "responses": []},
+            )
+
+        await remote_action.run(default_channel, default_nlg, tracker, domain)
+        r = latest_request(mocked, "post", "https://example.com/webhooks/actions")
+        first_request = json_of_latest_request(r)
+
+        tracker.update(ActionExecuted("my_action"))
+        tracker.update(SlotSet("name", "Rasa"))
+
+        await remote_action.run(default_channel, default_nlg, tracker, domain)
+        r = latest_request(mocked, "post", "https://example.com/webhooks/actions")
+        second_request = json_of_latest_request(r)
+
+    assert len(first_request["tracker"]["events"]) == 2
+    assert first_request["tracker_revision"]["base"] is None
+    assert first_request["tracker_revision"]["number_of_previous_events"] == 0
+
+    assert second_request["tracker"]["events"] == [
+        event.as_dict() for event in list(tracker.events)[2:]
+    ]
+    assert second_request["tracker_revision"] == {
+        "base": first_request["tracker_revision"]["revision"],
+        "revision": second_request["tracker_revision"]["revision"],
+        "number_of_previous_events": 2,
+    }
+
+
+async def test_remote_action_sends_all_events_if_revision_is_unknown(
+    default_channel, default_nlg, domain: Domain
+):
+    endpoint = EndpointConfig(
+        "https://example.com/webhooks/actions", enable_tracker_events_delta=True
+    )
+    remote_action = action.RemoteAction("my_action", endpoint)
+    tracker = DialogueStateTracker.from_events(
+        "test_remote_action_sends_all_events_if_revision_is_unknown",
+        [ActionExecuted(ACTION_LISTEN_NAME), UserUttered("hi")],
+    )
+
+    with aioresponses() as mocked:
+        mocked.post(
+            "https://example.com/webhooks/actions",
+            payload={"events": [], "responses": []},
+        )
+        # noinspection PyTypeChecker
+        mocked.post(
+            "https://example.com/webhooks/actions",
+            exception=ClientResponseError(409, None, ""),
+        )
+        mocked.post(
+            "https://example.com/webhooks/actions",
+            payload={"events": [], "responses": []},
+        )
+
+        await remote_action.run(default_channel, default_nlg, tracker, domain)
+        tracker.update(ActionExecuted("my_action"))
+        await remote_action.run(default_channel, default_nlg, tracker, domain)
+
+        r = latest_request(mocked, "post", "https://example.com/webhooks/actions")
+        last_request = json_of_latest_request(r)
+
+    assert len(r) == 3
+    assert last_request["tracker"]["events"] == [
+        event.as_dict() for event in tracker.events
+    ]
+    assert last_request["tracker_revision"]["base"] is None
+
+
+async def test_remote_action_keeps_tracker_revisions_per_action_endpoint(
+    default_channel, default_nlg, domain: Domain
+):
+    endpoint = EndpointConfig(
+        "https://example.com/webhooks/actions", enable_tracker_events_delta=True
+    )
+    other_endpoint = endpoint.copy()
+    tracker = DialogueStateTracker.from_events(
+        "test_remote_action_keeps_tracker_revisions_per_action_endpoint",
+        [ActionExecuted(ACTION_LISTEN_NAME), UserUttered("hi")],
+    )
+
+    with aioresponses() as mocked:
+        for _ in range(2):
+            mocked.post(
+                "https://example.com/webhooks/actions",
+                payload={"events": [], "responses": []},
+            )
+
+        remote_action = action.RemoteAction("my_action", endpoint)
+        await remote_action.run(default_channel, default_nlg, tracker, domain)
+
+        tracker.update(ActionExecuted("my_action"))
+        other_remote_action = action.RemoteAction("my_action", other_endpoint)
+        await other_remote_action.run(default_channel, default_nlg, tracker, domain)
+
+        r = latest_request(mocked, "post", "https://example.com/webhooks/actions")
+        last_request = json_of_latest_request(r)
+
+    sent_revision = SentTrackerRevisions.of_endpoint(endpoint).get(tracker.sender_id)
+    other_sent_revision = SentTrackerRevisions.of_endpoint(other_endpoint).get(
+        tracker.sender_id
+    )
+    assert sent_revision.number_of_events == len(tracker.events) - 1
+    assert other_sent_revision.number_of_events == len(tracker.events)
+    assert last_request["tracker"]["events"] == [
+        event.as_dict() for event in tracker.events
+    ]
+    assert last_request["tracker_revision"]["base"] is None
+
+
+def test_sent_tracker_revisions_keeps_most_recent_conversations(
+    monkeypatch: MonkeyPatch,
+):
+    monkeypatch.setattr(action, "MAX_TRACKED_TRACKER_REVISIONS", 2)
+    sent_revisions = SentTrackerRevisions()
+    revision = SentTrackerRevision("some-revision", 0, None, None)
+
+    sent_revisions.remember("first", revision)
+    sent_revisions.remember("second", revision)
+    sent_revisions.remember("first", revision)
+    sent_revisions.remember("third", revision)
+
+    assert len(sent_revisions) == 2
+    assert sent_revisions.get("first") is revision
+    assert sent_revisions.get("second") is None
+
+
+def test_sent_tracker_revisions_are_dropped_with_action_endpoint():
+    endpoint = EndpointConfig("https://example.com/webhooks/actions")
+    endpoint_id = id(endpoint)
+    SentTrackerRevisions.of_endpoint(endpoint).remember(
+        "some-conversation", SentTrackerRevision("some-revision", 0, None, None)
+    )
+
+    assert endpoint_id in SentTrackerRevisions._revisions_by_endpoint
+
+    del endpoint
+    gc.collect()
+
+    assert endpoint_id not in SentTrackerRevisions._revisions_by_endpoint
+
+
 async def test_action_utter_retrieved_response(
     default_channel, default_nlg, default_tracker, domain: Domain
 ):
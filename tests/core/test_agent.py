@@ -2,6 +2,7 @@ import asyncio
 from http import HTTPStatus
 import json
 from pathlib import Path
+import threading
 from typing import Any, Dict, Text, Callable, Optional
 from unittest.mock import patch
 import uuid
@@ -32,6 +33,9 @@ import rasa.utils.io
 from rasa.core import jobs
 from rasa.core.agent import Agent, load_agent
 from rasa.core.channels.channel import UserMessage
+from rasa.core.constants import ENV_INFERENCE_EXECUTOR_MODE
+from rasa.core.inference import INFERENCE_MODE_THREAD
+from rasa.core.processor import MessageProcessor
 from rasa.shared.core.domain import Domain
 from rasa.shared.constants import INTENT_MESSAGE_PREFIX
 from rasa.utils.endpoints import EndpointConfig
@@ -160,6 +164,64 @@ async def test_agent_with_model_server_in_thread(
     jobs.kill_scheduler()
 
 
+async def test_agent_keeps_previous_model_while_loading_model_from_server(
+    model_server: TestClient, trained_rasa_model: Text, monkeypatch: MonkeyPatch
+):
+    model_endpoint_config = EndpointConfig.from_dict(
+        {"url": model_server.make_url("/model"), "wait_time_between_pulls": None}
+    )
+
+    monkeypatch.setenv(ENV_INFERENCE_EXECUTOR_MODE, INFERENCE_MODE_THREAD)
+    agent = Agent.load(trained_rasa_model, fingerprint="previous-hash")
+    previous_processor = agent.processor
+    create_processor = agent.create_processor
+
+    # the message which is in flight keeps running the graph of the previous model
+    # after the model was swapped
+    model_swapped = threading.Event()
+    run_graph = previous_processor.graph_runner.run
+
+    def run_graph_once_model_swapped(*args: Any, **kwargs: Any) -> Dict[Text, Any]:
+        model_swapped.wait(timeout=10)
+        return run_graph(*args, **kwargs)
+
+    monkeypatch.setattr(
+        previous_processor.graph_runner, "run", run_graph_once_model_swapped
+    )
+    processors_during_loading = []
+    loading_threads = []
+
+    def create_processor_in_background(
+        model_path: Text, warm_up: bool = False
+    ) -> MessageProcessor:
+        processors_during_loading.append(agent.processor)
+        loading_threads.append(threading.current_thread())
+        return create_processor(model_path, warm_up)
+
+    monkeypatch.setattr(agent, "create_processor", create_processor_in_background)
+
+    message_in_flight = asyncio.ensure_future(
+        previous_processor.handle_message(UserMessage("hello", sender_id="in-flight"))
+    )
+    # let the message start running the graph
+    await asyncio.sleep(0.1)
+
+    await rasa.core.agent.load_from_server(agent, model_server=model_endpoint_config)
+    model_swapped.set()
+
+    assert processors_during_loading == [previous_processor]
+    assert loading_threads[0] is not threading.main_thread()
+    assert agent.processor is not previous_processor
+    assert agent.fingerprint == "somehash"
+
+    # the message was handled to the end with the previous model
+    assert isinstance(await message_in_flight, list)
+
+    # the previous executor was shut down after its last message was handled
+    with pytest.raises(RuntimeError):
+        previous_processor.inference_executor._executor.submit(print)
+
+
 async def test_wait_time_between_pulls_without_interval(
     model_server: TestClient, monkeypatch: MonkeyPatch
 ):
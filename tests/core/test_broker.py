@@ -1,8 +1,10 @@
+import asyncio
 import json
 import logging
 import textwrap
 from pathlib import Path
-from typing import Union, Text, List, Optional, Type
+from typing import Any, Dict, Union, Text, List, Optional, Type
+from unittest.mock import Mock
 
 import aio_pika.exceptions
 import aiormq.exceptions
@@ -20,7 +22,11 @@ import rasa.shared.utils.io
 import rasa.utils.io
 from rasa.core.brokers.broker import EventBroker
 from rasa.core.brokers.file import FileEventBroker
-from rasa.core.brokers.kafka import KafkaEventBroker, KafkaProducerInitializationError
+from rasa.core.brokers.kafka import (
+    KafkaEventBroker,
+    KafkaProducerInitializationError,
+    QUEUE_FULL_POLICY_SPILL,
+)
 from rasa.core.brokers.pika import PikaEventBroker, DEFAULT_QUEUE_NAME
 from rasa.core.brokers.sql import SQLEventBroker
 from rasa.shared.core.events import Event, Restarted, SlotSet, UserUttered
@@ -172,6 +178,82 @@ async def test_sql_broker_logs_to_sql_db():
     assert events_types == ["user", "slot", "restart"]
 
 
+async def test_sql_broker_writes_events_on_close(tmp_path: Path):
+    broker = SQLEventBroker(db=str(tmp_path / "events.db"))
+
+    for e in TEST_EVENTS:
+        broker.publish({"sender_id": "some-sender", **e.as_dict()})
+
+    await broker.close()
+
+    with broker.session_scope() as session:
+        events_types = [
+            json.loads(event.data)["event"]
+            for event in session.query(broker.SQLBrokerEvent).all()
+        ]
+
+    assert events_types == ["user", "slot", "restart"]
+
+
+async def test_sql_broker_shuts_down_executors_on_close(tmp_path: Path):
+    broker = SQLEventBroker(db=str(tmp_path / "events.db"))
+    broker.publish({"sender_id": "some-sender", **TEST_EVENTS[0].as_dict()})
+
+    await broker.close()
+
+    assert broker._executors
+    for executor in broker._executors:
+        with pytest.raises(RuntimeError):
+            executor.submit(print)
+
+
+def _sql_broker_event_types(broker: SQLEventBroker) -> List[Text]:
+    with broker.session_scope() as session:
+        return [
+            json.loads(event.data)["event"]
+            for event in session.query(broker.SQLBrokerEvent).all()
+        ]
+
+
+async def _wait_for_sql_broker_writes(broker: SQLEventBroker) -> None:
+    await asyncio.gather(
+        *[asyncio.wrap_future(future) for future in list(broker._pending)]
+    )
+
+
+async def test_sql_broker_buffers_events(tmp_path: Path):
+    broker = SQLEventBroker(
+        db=str(tmp_path / "events.db"), buffer_size=2, flush_interval_in_seconds=60
+    )
+
+    for e in TEST_EVENTS:
+        broker.publish({"sender_id": "some-sender", **e.as_dict()})
+
+    # the first two events are written once the buffer is full
+    await _wait_for_sql_broker_writes(broker)
+    assert _sql_broker_event_types(broker) == ["user", "slot"]
+
+    # the remaining event is written when closing the broker
+    await broker.close()
+    assert _sql_broker_event_types(broker) == ["user", "slot", "restart"]
+
+
+async def test_sql_broker_flushes_buffered_events_after_interval(tmp_path: Path):
+    broker = SQLEventBroker(
+        db=str(tmp_path / "events.db"), buffer_size=100, flush_interval_in_seconds=0
+    )
+
+    for e in TEST_EVENTS:
+        broker.publish({"sender_id": "some-sender", **e.as_dict()})
+    assert _sql_broker_event_types(broker) == []
+
+    await asyncio.sleep(0.01)
+    await _wait_for_sql_broker_writes(broker)
+
+    assert _sql_broker_event_types(broker) == ["user", "slot", "restart"]
+    await broker.close()
+
+
 async def test_file_broker_from_config(tmp_path: Path):
     # backslashes need to be encoded (windows...) otherwise we run into unicode issues
     path = str(tmp_path / "rasa_test_event.log").replace("\\", "\\\\")
@@ -230,6 +312,65 @@ async def test_file_broker_properly_logs_newlines(tmp_path: Path):
     assert recovered == [event_with_newline]
 
 
+async def test_file_broker_publish_many(tmp_path: Path):
+    log_file_path = str(tmp_path / "events.log")
+    broker = FileEventBroker(log_file_path)
+
+    broker.publish_many([e.as_dict() for e in TEST_EVENTS])
+
+    with open(log_file_path, "r") as log_file:
+        recovered = [Event.from_parameters(json.loads(line)) for line in log_file]
+
+    assert recovered == TEST_EVENTS
+
+
+def test_publish_many_falls_back_to_publish():
+    class ListEventBroker(EventBroker):
+        def __init__(self) -> None:
+            self.events = []
+
+        def publish(self, event: Dict[Text, Any]) -> None:
+            self.events.append(event)
+
+    broker = ListEventBroker()
+    events = [e.as_dict() for e in TEST_EVENTS]
+
+    broker.publish_many(events)
+
+    assert broker.events == events
+
+
+async def test_sql_broker_publish_many_inserts_events_at_once(tmp_path: Path):
+    broker = SQLEventBroker(db=str(tmp_path / "events.db"))
+    insert = Mock(wraps=broker._insert)
+    broker._insert = insert
+
+    broker.publish_many(
+        [{"sender_id": "some-sender", **e.as_dict()} for e in TEST_EVENTS]
+    )
+    await broker.close()
+
+    insert.assert_called_once()
+    assert _sql_broker_event_types(broker) == ["user", "slot", "restart"]
+
+
+async def test_pika_broker_publish_many_uses_one_task():
+    broker = PikaEventBroker("host", "username", "password", queues=["queue"])
+    broker._exchange = Mock()
+    broker._exchange.publish = AsyncMock()
+
+    broker.publish_many([e.as_dict() for e in TEST_EVENTS])
+
+    assert len(broker._background_tasks) == 1
+    await asyncio.gather(*broker._background_tasks)
+
+    published = [
+        json.loads(call.args[0].body)
+        for call in broker._exchange.publish.call_args_list
+    ]
+    assert published == [e.as_dict() for e in TEST_EVENTS]
+
+
 async def test_load_custom_broker_name(tmp_path: Path):
     config = EndpointConfig(
         **{
@@ -304,6 +445,153 @@ async def test_kafka_broker_security_protocols(file: Text, exception: Exception)
         producer.list_topics("topic", timeout=1)
 
 
+def _kafka_broker_with_mocked_producer(
+    monkeypatch: MonkeyPatch, **kwargs: Any
+) -> KafkaEventBroker:
+    broker = KafkaEventBroker(
+        "localhost", security_protocol="PLAINTEXT", retry_delay_in_seconds=0, **kwargs
+    )
+    monkeypatch.setattr(broker, "_create_producer", Mock(return_value=Mock()))
+    return broker
+
+
+async def test_kafka_broker_publishes_in_background(monkeypatch: MonkeyPatch):
+    broker = _kafka_broker_with_mocked_producer(monkeypatch, publish_batch_size=2)
+    events = [{"event": "user", "sender_id": str(index)} for index in range(5)]
+
+    for event in events:
+        broker.publish(event)
+
+    # publishing doesn't produce the events right away
+    assert broker.producer is None
+    assert broker.metrics.queue_size == len(events)
+
+    await broker.close()
+
+    produced = [
+        json.loads(call.kwargs["value"])
+        for call in broker.producer.produce.call_args_list
+    ]
+    assert produced == events
+    assert broker.metrics.number_of_published_events == len(events)
+    assert broker.metrics.queue_size == 0
+    assert broker.metrics.max_queue_size == len(events)
+
+
+async def test_kafka_broker_publish_many(monkeypatch: MonkeyPatch):
+    broker = _kafka_broker_with_mocked_producer(monkeypatch)
+    events = [e.as_dict() for e in TEST_EVENTS]
+
+    broker.publish_many(events)
+    await broker.close()
+
+    produced = [
+        json.loads(call.kwargs["value"])
+        for call in broker.producer.produce.call_args_list
+    ]
+    assert produced == events
+
+
+async def test_kafka_broker_retries_buffer_errors(monkeypatch: MonkeyPatch):
+    broker = _kafka_broker_with_mocked_producer(monkeypatch)
+    broker.publish({"event": "user"})
+    broker.publish({"event": "bot"})
+
+    producer = broker._create_producer()
+    producer.produce.side_effect = [None, BufferError("Queue full"), None]
+
+    await broker.close()
+
+    assert producer.produce.call_count == 3
+    producer.poll.assert_any_call(1)
+    assert broker.metrics.number_of_published_events == 2
+    assert broker.metrics.number_of_failed_events == 0
+
+
+async def test_kafka_broker_drops_events_if_queue_is_full(monkeypatch: MonkeyPatch):
+    broker = _kafka_broker_with_mocked_producer(monkeypatch, publish_queue_size=2)
+
+    for index in range(5):
+        broker.publish({"event": "user", "sender_id": str(index)})
+
+    await broker.close()
+
+    assert broker.metrics.number_of_dropped_events == 3
+    assert broker.metrics.number_of_published_events == 2
+
+
+async def test_kafka_broker_spills_events_if_queue_is_full(
+    monkeypatch: MonkeyPatch, tmp_path: Path
+):
+    spill_path = tmp_path / "spilled.jsonl"
+    broker = _kafka_broker_with_mocked_producer(
+        monkeypatch,
+        publish_queue_size=2,
+        queue_full_policy=QUEUE_FULL_POLICY_SPILL,
+        spill_path=str(spill_path),
+    )
+    events = [{"event": "user", "sender_id": str(index)} for index in range(5)]
+
+    for event in events:
+        broker.publish(event)
+
+    assert broker.metrics.number_of_spilled_events == 3
+    assert len(spill_path.read_text().splitlines()) == 3
+
+    await broker.close()
+
+    produced = [
+        json.loads(call.kwargs["value"])
+        for call in broker.producer.produce.call_args_list
+    ]
+    assert produced == events
+    assert spill_path.read_text() == ""
+
+
+async def test_kafka_broker_publishes_new_events_after_spilled_events(
+    monkeypatch: MonkeyPatch, tmp_path: Path
+):
+    spill_path = tmp_path / "spilled.jsonl"
+    broker = _kafka_broker_with_mocked_producer(
+        monkeypatch,
+        publish_queue_size=2,
+        queue_full_policy=QUEUE_FULL_POLICY_SPILL,
+        spill_path=str(spill_path),
+    )
+    events = [{"event": "user", "sender_id": str(index)} for index in range(6)]
+
+    broker.publish_many(events[:5])
+    # take the queued events out of the queue as the publish task would do
+    for _ in range(2):
+        broker._queue.get_nowait()
+        broker._queue.task_done()
+
+    # the queue has room again, but the new event has to wait for the spilled ones
+    broker.publish(events[5])
+    assert spill_path.read_text().splitlines() == [
+        json.dumps(event) for event in events[2:]
+    ]
+
+    # queueing spilled events doesn't rewrite the spill file
+    broker._refill_from_spill_file()
+    assert broker._queue.qsize() == 2
+    assert len(spill_path.read_text().splitlines()) == 4
+
+    await broker.close()
+
+    produced = [
+        json.loads(call.kwargs["value"])
+        for call in broker.producer.produce.call_args_list
+    ]
+    assert produced == events[2:]
+    assert spill_path.read_text() == ""
+
+
+def test_kafka_broker_with_invalid_queue_full_policy():
+    with pytest.raises(ValueError):
+        KafkaEventBroker("localhost", queue_full_policy="block")
+
+
 @pytest.mark.flaky
 async def test_no_pika_logs_if_no_debug_mode(caplog: LogCaptureFixture):
     """
@@ -0,0 +1,273 @@
+import asyncio
+import pickle
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Text
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+from rasa.core.channels.channel import CollectingOutputChannel, UserMessage
+from rasa.core.constants import (
+    ENV_INFERENCE_EXECUTOR_MODE,
+    ENV_INFERENCE_EXECUTOR_WORKERS,
+    ENV_NLU_BATCH_WINDOW_MS,
+    ENV_NLU_MAX_BATCH_SIZE,
+)
+from rasa.core.inference import (
+    INFERENCE_MODE_INLINE,
+    INFERENCE_MODE_PROCESS,
+    INFERENCE_MODE_THREAD,
+    InferenceExecutor,
+    InvalidInferenceExecutorConfig,
+    MessageBatcher,
+    _picklable_inputs,
+    _restore_inputs,
+)
+from rasa.engine.constants import PLACEHOLDER_MESSAGE, PLACEHOLDER_TRACKER
+from rasa.engine.runner.interface import GraphRunner
+from rasa.shared.exceptions import RasaException
+from tests.conftest import AsyncMock
+
+
+class SleepingGraphRunner(GraphRunner):
+    def __init__(self, seconds: float = 0.0) -> None:
+        self.seconds = seconds
+        self.threads = []
+
+    @classmethod
+    def create(cls, *args: Any, **kwargs: Any) -> "SleepingGraphRunner":
+        return cls()
+
+    def run(
+        self,
+        inputs: Optional[Dict[Text, Any]] = None,
+        targets: Optional[List[Text]] = None,
+    ) -> Dict[Text, Any]:
+        self.threads.append(threading.get_ident())
+        time.sleep(self.seconds)
+        return {target: inputs["x"] for target in targets}
+
+
+async def test_inline_executor_runs_on_event_loop_thread():
+    executor = InferenceExecutor(INFERENCE_MODE_INLINE)
+    runner = SleepingGraphRunner()
+
+    assert await executor.run(runner, {"x": 1}, ["a"]) == {"a": 1}
+    assert runner.threads == [threading.get_ident()]
+
+
+async def test_thread_executor_does_not_block_event_loop():
+    executor = InferenceExecutor(INFERENCE_MODE_THREAD, max_workers=1)
+    runner = SleepingGraphRunner(seconds=0.2)
+
+    ticks = 0
+
+    async def tick() -> None:
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticker = asyncio.ensure_future(tick())
+    result = await executor.run(runner, {"x": 1}, ["a"])
+    ticker.cancel()
+
+    assert result == {"a": 1}
+    assert runner.threads[0] != threading.get_ident()
+    # the event loop kept running while the graph was run
+    assert ticks > 5
+    executor.shutdown()
+
+
+async def test_thread_executor_metrics():
+    executor = InferenceExecutor(INFERENCE_MODE_THREAD, max_workers=1)
+    runner = SleepingGraphRunner(seconds=0.05)
+
+    results = await asyncio.gather(
+        *[executor.run(runner, {"x": i}, ["a"]) for i in range(3)]
+    )
+
+    assert results == [{"a": 0}, {"a": 1}, {"a": 2}]
+    metrics = executor.metrics
+    assert metrics.queue_depth == 0
+    assert metrics.max_queue_depth == 2
+    assert metrics.number_of_runs == 3
+    # the last run had to wait for the two previous runs
+    assert metrics.max_wait_time >= 0.09
+    assert metrics.as_dict()["average_wait_time"] == pytest.approx(
+        metrics.total_wait_time / 3
+    )
+    executor.shutdown()
+
+
+def test_executor_from_env(monkeypatch: MonkeyPatch):
+    monkeypatch.setenv(ENV_INFERENCE_EXECUTOR_MODE, "Inline")
+    monkeypatch.setenv(ENV_INFERENCE_EXECUTOR_WORKERS, "3")
+
+    executor = InferenceExecutor.from_env("model.tar.gz")
+
+    assert executor.mode == INFERENCE_MODE_INLINE
+    assert executor.max_workers == 3
+
+
+@pytest.mark.parametrize(
+    "mode,max_workers,model_path",
+    [
+        ("gpu", 1, None),
+        (INFERENCE_MODE_THREAD, 0, None),
+        (INFERENCE_MODE_PROCESS, 1, None),
+    ],
+)
+def test_invalid_executor_config(
+    mode: Text, max_workers: int, model_path: Optional[Text]
+):
+    with pytest.raises(InvalidInferenceExecutorConfig):
+        InferenceExecutor(mode, max_workers, model_path)
+
+
+def test_invalid_number_of_workers_in_env(monkeypatch: MonkeyPatch):
+    monkeypatch.setenv(ENV_INFERENCE_EXECUTOR_WORKERS, "many")
+
+    with pytest.raises(InvalidInferenceExecutorConfig):
+        InferenceExecutor.from_env("model.tar.gz")
+
+
+async def test_batcher_coalesces_items():
+    batches = []
+
+    async def run_batch(items: List[int]) -> List[int]:
+        batches.append(items)
+        return [item * 2 for item in items]
+
+    batcher = MessageBatcher(run_batch, window=0.05, max_batch_size=10)
+
+    results = await asyncio.gather(*[batcher.submit(i) for i in range(3)])
+
+    assert results == [0, 2, 4]
+    assert batches == [[0, 1, 2]]
+
+
+async def test_batcher_runs_full_batch_right_away():
+    batches = []
+
+    async def run_batch(items: List[int]) -> List[int]:
+        batches.append(items)
+        return items
+
+    # the window is too long for the test to finish in time if it was waited for
+    batcher = MessageBatcher(run_batch, window=60, max_batch_size=2)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*[batcher.submit(i) for i in range(4)]), timeout=5
+    )
+
+    assert results == [0, 1, 2, 3]
+    assert batches == [[0, 1], [2, 3]]
+
+
+async def test_batcher_propagates_errors():
+    async def run_batch(items: List[int]) -> List[int]:
+        raise ValueError("broken graph")
+
+    batcher = MessageBatcher(run_batch, window=0.01)
+
+    results = await asyncio.gather(
+        *[batcher.submit(i) for i in range(2)], return_exceptions=True
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+async def test_batcher_fails_items_without_result():
+    async def run_batch(items: List[int]) -> List[int]:
+        return items[:1]
+
+    batcher = MessageBatcher(run_batch, window=0.01)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*[batcher.submit(i) for i in range(3)], return_exceptions=True),
+        timeout=5,
+    )
+
+    assert results[0] == 0
+    assert all(isinstance(result, RasaException) for result in results[1:])
+
+
+@pytest.mark.parametrize(
+    "window_ms,is_enabled", [(None, False), ("0", False), ("5", True)]
+)
+def test_batcher_from_env(
+    monkeypatch: MonkeyPatch, window_ms: Optional[Text], is_enabled: bool
+):
+    if window_ms is None:
+        monkeypatch.delenv(ENV_NLU_BATCH_WINDOW_MS, raising=False)
+    else:
+        monkeypatch.setenv(ENV_NLU_BATCH_WINDOW_MS, window_ms)
+    monkeypatch.setenv(ENV_NLU_MAX_BATCH_SIZE, "8")
+
+    batcher = MessageBatcher.from_env(AsyncMock())
+
+    assert (batcher is not None) == is_enabled
+    if batcher:
+        assert batcher.window == pytest.approx(0.005)
+        assert batcher.max_batch_size == 8
+
+
+async def test_retired_executor_keeps_running_while_in_use():
+    executor = InferenceExecutor(INFERENCE_MODE_THREAD, max_workers=1)
+    runner = SleepingGraphRunner()
+
+    with executor.in_use():
+        assert await executor.run(runner, {"x": 1}, ["a"]) == {"a": 1}
+        executor.retire()
+
+        # the graph can still be run until the executor isn't in use anymore
+        assert await executor.run(runner, {"x": 2}, ["a"]) == {"a": 2}
+
+    with pytest.raises(RuntimeError):
+        await executor.run(runner, {"x": 3}, ["a"])
+
+
+def test_retired_executor_shuts_down_right_away_if_not_in_use():
+    executor = InferenceExecutor(INFERENCE_MODE_THREAD, max_workers=1)
+
+    executor.retire()
+
+    with pytest.raises(RuntimeError):
+        executor._executor.submit(print)
+
+
+def test_messages_are_sent_to_worker_processes_without_output_channel():
+    message = UserMessage(
+        "hello",
+        output_channel=CollectingOutputChannel(),
+        sender_id="some sender",
+        input_channel="rest",
+        metadata={"key": "value"},
+    )
+    inputs = {PLACEHOLDER_MESSAGE: [message], PLACEHOLDER_TRACKER: None}
+
+    picklable_inputs = _picklable_inputs(inputs)
+    restored_message = _restore_inputs(pickle.loads(pickle.dumps(picklable_inputs)))[
+        PLACEHOLDER_MESSAGE
+    ][0]
+
+    assert isinstance(picklable_inputs[PLACEHOLDER_MESSAGE][0], dict)
+    for attribute in ["text", "sender_id", "input_channel", "message_id", "metadata"]:
+        assert getattr(restored_message, attribute) == getattr(message, attribute)
+
+
+def test_process_executor_owns_a_copy_of_the_model(tmp_path: Path):
+    model_path = tmp_path / "model.tar.gz"
+    model_path.write_text("model")
+
+    executor = InferenceExecutor(INFERENCE_MODE_PROCESS, model_path=model_path)
+    model_path.unlink()
+
+    model_copies = list(Path(executor._model_copy_directory).glob("*"))
+    assert [model_copy.read_text() for model_copy in model_copies] == ["model"]
+
+    executor.shutdown()
+    assert not model_copies[0].exists()
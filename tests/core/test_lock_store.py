@@ -2,8 +2,9 @@ import asyncio
 import logging
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Text
+from typing import Any, Optional, Text
 from unittest.mock import Mock, patch
 
 import numpy as np
@@ -32,15 +33,19 @@ class FakeRedisLockStore(RedisLockStore):
 
     # skipcq: PYL-W0231
     # noinspection PyMissingConstructor
-    def __init__(self):
+    def __init__(self, server: Optional[Any] = None):
         import fakeredis
 
-        self.red = fakeredis.FakeStrictRedis()
+        # all connections of the store, e.g. the one of the subscription to lock
+        # releases, have to use the same server to see the same data
+        self.red = fakeredis.FakeStrictRedis(server=server or fakeredis.FakeServer())
 
         # added in redis==3.3.0, but not yet in fakeredis
         self.red.connection_pool.connection_class.health_check_interval = 0
 
         self.key_prefix = DEFAULT_REDIS_LOCK_STORE_KEY_PREFIX
+        self._register_scripts()
+        self._init_lock_release_notifications()
 
 
 def test_issue_ticket():
@@ -330,15 +335,121 @@ async def test_acquire_lock_debug_message(
     )
 
 
+@pytest.mark.parametrize("lock_store", [InMemoryLockStore(), FakeRedisLockStore()])
+async def test_waiting_ticket_is_served_when_lock_is_released(lock_store: LockStore):
+    conversation_id = "test_waiting_ticket_is_served_when_lock_is_released"
+    # the waiting ticket would time out if it was only served after the wait time
+    wait_time_in_seconds = 60
+    served = []
+
+    async def locking_task(number: int) -> None:
+        async with lock_store.lock(
+            conversation_id, wait_time_in_seconds=wait_time_in_seconds
+        ):
+            served.append(number)
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(
+        asyncio.gather(locking_task(1), locking_task(2), locking_task(3)), timeout=10
+    )
+
+    assert served == [1, 2, 3]
+    assert lock_store.get_lock(conversation_id) is None
+
+
+async def test_redis_lock_store_notifies_other_lock_stores():
+    import fakeredis
+
+    server = fakeredis.FakeServer()
+    lock_store = FakeRedisLockStore(server)
+    other_lock_store = FakeRedisLockStore(server)
+    conversation_id = "test_redis_lock_store_notifies_other_lock_stores"
+
+    async def first_task() -> None:
+        async with lock_store.lock(conversation_id):
+            await asyncio.sleep(0.1)
+
+    async def second_task() -> None:
+        await asyncio.sleep(0.01)
+        async with other_lock_store.lock(conversation_id, wait_time_in_seconds=60):
+            pass
+
+    await asyncio.wait_for(asyncio.gather(first_task(), second_task()), timeout=10)
+
+    assert lock_store.get_lock(conversation_id) is None
+
+
+def test_redis_lock_store_issues_unique_tickets_for_concurrent_lock_stores():
+    import fakeredis
+
+    server = fakeredis.FakeServer()
+    lock_stores = [FakeRedisLockStore(server) for _ in range(5)]
+    conversation_id = "test_redis_lock_store_issues_unique_tickets"
+
+    with ThreadPoolExecutor(max_workers=len(lock_stores)) as executor:
+        tickets = list(
+            executor.map(
+                lambda index: lock_stores[index % len(lock_stores)].issue_ticket(
+                    conversation_id
+                ),
+                range(50),
+            )
+        )
+
+    assert sorted(tickets) == list(range(50))
+    lock = lock_stores[0].get_lock(conversation_id)
+    assert [ticket.number for ticket in lock.tickets] == list(range(50))
+
+
+def test_redis_lock_store_removes_expired_tickets():
+    lock_store = FakeRedisLockStore()
+    conversation_id = "test_redis_lock_store_removes_expired_tickets"
+
+    assert lock_store.issue_ticket(conversation_id, 10) == 0
+    assert lock_store.issue_ticket(conversation_id, 0.00001) == 1
+    time.sleep(0.00002)
+
+    lock_store.update_lock(conversation_id)
+    assert [
+        ticket.number for ticket in lock_store.get_lock(conversation_id).tickets
+    ] == [0]
+
+    # the number of the expired ticket is issued again
+    assert lock_store.issue_ticket(conversation_id, 10) == 1
+
+    lock_store.cleanup(conversation_id, 0)
+    assert lock_store.is_someone_waiting(conversation_id)
+
+    lock_store.cleanup(conversation_id, 1)
+    assert lock_store.get_lock(conversation_id) is None
+
+
+def test_redis_lock_store_replaces_lock_of_older_rasa_version():
+    lock_store = FakeRedisLockStore()
+    conversation_id = "test_redis_lock_store_replaces_lock_of_older_rasa_version"
+    # older Rasa versions stored locks as serialized JSON strings without TTL
+    legacy_lock = TicketLock(conversation_id)
+    legacy_lock.issue_ticket(10)
+    lock_store.red.set(lock_store.key_prefix + conversation_id, legacy_lock.dumps())
+
+    assert lock_store.get_lock(conversation_id) is None
+    lock_store.update_lock(conversation_id)
+
+    assert lock_store.issue_ticket(conversation_id, 10) == 0
+    assert [
+        ticket.number for ticket in lock_store.get_lock(conversation_id).tickets
+    ] == [0]
+
+    lock_store.cleanup(conversation_id, 0)
+    assert lock_store.get_lock(conversation_id) is None
+
+
 async def test_redis_lock_store_timeout(monkeypatch: MonkeyPatch):
     import redis.exceptions
 
     lock_store = FakeRedisLockStore()
-    monkeypatch.setattr(
-        lock_store,
-        lock_store.get_or_create_lock.__name__,
-        Mock(side_effect=redis.exceptions.TimeoutError),
-    )
+    issue_ticket_script = Mock(side_effect=redis.exceptions.TimeoutError)
+    monkeypatch.setattr(lock_store, "_issue_ticket_script", issue_ticket_script)
 
     with pytest.raises(LockError):
         async with lock_store.lock("some sender"):
@@ -354,11 +465,8 @@ async def test_redis_lock_store_with_invalid_prefix(monkeypatch: MonkeyPatch):
     lock_store._set_key_prefix(prefix)
     assert lock_store.key_prefix == DEFAULT_REDIS_LOCK_STORE_KEY_PREFIX
 
-    monkeypatch.setattr(
-        lock_store,
-        lock_store.get_or_create_lock.__name__,
-        Mock(side_effect=redis.exceptions.TimeoutError),
-    )
+    issue_ticket_script = Mock(side_effect=redis.exceptions.TimeoutError)
+    monkeypatch.setattr(lock_store, "_issue_ticket_script", issue_ticket_script)
 
     with pytest.raises(LockError):
         async with lock_store.lock("some sender"):
@@ -374,16 +482,17 @@ async def test_redis_lock_store_with_valid_prefix(monkeypatch: MonkeyPatch):
     lock_store._set_key_prefix(prefix)
     assert lock_store.key_prefix == prefix + ":" + DEFAULT_REDIS_LOCK_STORE_KEY_PREFIX
 
-    monkeypatch.setattr(
-        lock_store,
-        lock_store.get_or_create_lock.__name__,
-        Mock(side_effect=redis.exceptions.TimeoutError),
-    )
+    issue_ticket_script = Mock(side_effect=redis.exceptions.TimeoutError)
+    monkeypatch.setattr(lock_store, "_issue_ticket_script", issue_ticket_script)
 
     with pytest.raises(LockError):
         async with lock_store.lock("some sender"):
             pass
 
+    assert issue_ticket_script.call_args.kwargs["keys"] == [
+        lock_store.key_prefix + "some sender"
+    ]
+
 
 def test_create_lock_store_from_endpoint_config(endpoints_path: Text):
     store = read_endpoint_config(endpoints_path, endpoint_type="lock_store")
@@ -19,6 +19,7 @@ from _pytest.logging import LogCaptureFixture
 from aioresponses import aioresponses
 from typing import Optional, Text, List, Callable, Type, Any
 
+from rasa.core.constants import ENV_NLU_BATCH_WINDOW_MS
 from rasa.core.lock_store import InMemoryLockStore
 from rasa.core.policies.ensemble import DefaultPolicyPredictionEnsemble
 from rasa.core.tracker_store import InMemoryTrackerStore
@@ -1486,6 +1487,29 @@ async def test_parse_message_full_model(trained_moodbot_path: Text):
     assert result["intent"]["name"]
 
 
+async def test_parse_messages_in_batches(
+    trained_moodbot_path: Text, monkeypatch: MonkeyPatch
+):
+    unbatched_processor = Agent.load(model_path=trained_moodbot_path).processor
+    assert unbatched_processor.nlu_batcher is None
+
+    monkeypatch.setenv(ENV_NLU_BATCH_WINDOW_MS, "50")
+    processor = Agent.load(model_path=trained_moodbot_path).processor
+    assert processor.nlu_batcher is not None
+
+    texts = ["/greet", "Hello", "I am sad", "great"]
+    run_nlu_graph = MagicMock(wraps=processor._run_nlu_graph)
+    processor.nlu_batcher._run_batch = run_nlu_graph
+
+    results = await asyncio.gather(
+        *[processor.parse_message(UserMessage(text)) for text in texts]
+    )
+
+    run_nlu_graph.assert_called_once()
+    for text, result in zip(texts, results):
+        assert result == await unbatched_processor.parse_message(UserMessage(text))
+
+
 def test_predict_next_with_tracker_nlu_only(trained_nlu_model: Text):
     processor = Agent.load(model_path=trained_nlu_model).processor
     tracker = DialogueStateTracker("some_id", [])
@@ -1,5 +1,5 @@
 import warnings
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 from typing import Text
@@ -83,7 +83,12 @@ async def test_close_resources(loop: AbstractEventLoop):
     broker = SQLEventBroker()
     app = Mock()
     app.ctx.agent.tracker_store.event_broker = broker
+    app.ctx.agent.tracker_store.close = AsyncMock()
+    app.ctx.agent.close_endpoint_sessions = AsyncMock()
 
     with warnings.catch_warnings() as record:
         await run.close_resources(app, loop)
         assert record is None
+
+    app.ctx.agent.tracker_store.close.assert_awaited_once()
+    app.ctx.agent.close_endpoint_sessions.assert_awaited_once()
@@ -1,4 +1,6 @@
+import json
 import logging
+import threading
 import warnings
 from collections import deque
 from contextlib import contextmanager
@@ -614,6 +616,120 @@ async def test_sql_additional_events_with_session_start(domain: Domain):
         assert isinstance(additional_events[0], UserUttered)
 
 
+async def test_sql_save_only_inserts_unpersisted_events(
+    domain: Domain, monkeypatch: MonkeyPatch, tmp_path: Path
+):
+    tracker_store = SQLTrackerStore(domain, db=str(tmp_path / "rasa.db"))
+    sender_id = "test_sql_save_only_inserts_unpersisted_events"
+    await tracker_store.save(
+        DialogueStateTracker.from_events(sender_id, [UserUttered("hi")])
+    )
+
+    tracker = await tracker_store.retrieve(sender_id)
+    tracker.update(BotUttered("hey"))
+    tracker.update(ActionExecuted(ACTION_LISTEN_NAME))
+
+    # the tracker knows which events are new, hence the events don't need to be
+    # counted in the database
+    event_query = Mock()
+    monkeypatch.setattr(tracker_store, "_event_query", event_query)
+    with tracker_store.session_scope() as session:
+        additional_events = list(tracker_store._additional_events(session, tracker))
+    assert additional_events == list(tracker.events)[-2:]
+    event_query.assert_not_called()
+
+    await tracker_store.save(tracker)
+    await tracker_store.save(tracker)
+    monkeypatch.undo()
+
+    retrieved = await tracker_store.retrieve(sender_id)
+    assert list(retrieved.events) == list(tracker.events)
+
+
+async def test_sql_tracker_store_shuts_down_executor_on_close(tmp_path: Path):
+    tracker_store = SQLTrackerStore(db=str(tmp_path / "rasa.db"))
+    await tracker_store.save(DialogueStateTracker.from_events("some-sender", []))
+
+    await tracker_store.close()
+
+    assert tracker_store._executor is not None
+    with pytest.raises(RuntimeError):
+        tracker_store._executor.submit(print)
+
+
+def test_sql_tracker_store_creates_session_start_index(tmp_path: Path):
+    db = str(tmp_path / "rasa.db")
+    tracker_store = SQLTrackerStore(db=db)
+    for index in tracker_store.SQLEvent.__table__.indexes:
+        if index.name == "ix_events_sender_id_type_name_timestamp":
+            index.drop(bind=tracker_store.engine)
+
+    # the index is added to already existing tables
+    tracker_store = SQLTrackerStore(db=db)
+
+    indices = sqlalchemy.inspect(tracker_store.engine).get_indexes("events")
+    assert {index["name"]: index["column_names"] for index in indices}.get(
+        "ix_events_sender_id_type_name_timestamp"
+    ) == [
+        "sender_id",
+        "type_name",
+        "timestamp",
+    ]
+
+
+async def test_sql_tracker_store_runs_queries_off_the_event_loop(
+    domain: Domain, tmp_path: Path, monkeypatch: MonkeyPatch
+):
+    tracker_store = SQLTrackerStore(domain, db=str(tmp_path / "rasa.db"))
+    main_thread = threading.get_ident()
+    query_threads = set()
+
+    session_scope = tracker_store.session_scope
+
+    @contextmanager
+    def recording_session_scope():
+        query_threads.add(threading.get_ident())
+        with session_scope() as session:
+            yield session
+
+    monkeypatch.setattr(tracker_store, "session_scope", recording_session_scope)
+
+    tracker = DialogueStateTracker.from_events(
+        "some-sender", [SessionStarted(), UserUttered("Hola", {"name": "greet"})]
+    )
+    await tracker_store.save(tracker)
+    retrieved = await tracker_store.retrieve("some-sender")
+    keys = await tracker_store.keys()
+
+    assert list(retrieved.events) == list(tracker.events)
+    assert list(keys) == ["some-sender"]
+    assert query_threads and main_thread not in query_threads
+
+
+@pytest.mark.parametrize(
+    "url,engine_kwargs,expected",
+    [
+        ("sqlite:///", {}, 0),
+        ("sqlite:///rasa.db", {}, 1),
+        (
+            "postgresql://admin:pw@localhost:5432/rasa",
+            {"pool_size": 20, "max_overflow": 5},
+            25,
+        ),
+        (
+            "oracle://admin:pw@localhost:5432/rasa",
+            {},
+            rasa.core.tracker_store.SQL_DEFAULT_POOL_SIZE
+            + rasa.core.tracker_store.SQL_DEFAULT_MAX_OVERFLOW,
+        ),
+    ],
+)
+def test_number_of_sql_workers(
+    url: Text, engine_kwargs: Dict[Text, Any], expected: int
+):
+    assert rasa.core.tracker_store.number_of_sql_workers(url, engine_kwargs) == expected
+
+
 async def test_tracker_store_retrieve_ordered_by_id(
     domain: Domain,
 ):
@@ -834,6 +950,31 @@ def test_create_engine_kwargs(
     assert rasa.core.tracker_store.create_engine_kwargs(url) == kwargs
 
 
+@pytest.mark.parametrize(
+    "url,kwargs",
+    [
+        (
+            f"{PGDialect.name}://admin:pw@localhost:5432/rasa",
+            {"pool_size": 3, "max_overflow": 4},
+        ),
+        (
+            f"{OracleDialect.name}://admin:pw@localhost:5432/rasa",
+            {"pool_size": 3, "max_overflow": 4},
+        ),
+        (f"{SQLiteDialect.name}:///", {}),
+    ],
+)
+def test_create_engine_kwargs_with_pool_size(
+    monkeypatch: MonkeyPatch, url: Text, kwargs: Dict[Text, int]
+):
+    set_or_delete_postgresql_schema_env_var(monkeypatch, None)
+
+    assert (
+        rasa.core.tracker_store.create_engine_kwargs(url, pool_size=3, max_overflow=4)
+        == kwargs
+    )
+
+
 @contextmanager
 def does_not_raise():
     """Contextmanager to be used when an expression is not expected to raise an
@@ -1194,7 +1335,7 @@ class MockedRedisTrackerStore(RedisTrackerStore):
         self,
         domain: Domain,
     ) -> None:
-        self.red = fakeredis.FakeStrictRedis()
+        self.red = fakeredis.FakeStrictRedis(decode_responses=True)
         self.key_prefix = DEFAULT_REDIS_TRACKER_STORE_KEY_PREFIX
         self.record_exp = None
         super(RedisTrackerStore, self).__init__(domain, None)
@@ -1227,7 +1368,7 @@ async def test_redis_tracker_store_retrieve(
     assert list(tracker.events) == events_after_restart
 
 
-async def test_redis_tracker_store_merge_trackers_same_session() -> None:
+async def test_redis_tracker_store_save_trackers_same_session() -> None:
     start_session_sequence = [
         ActionExecuted(ACTION_SESSION_START_NAME),
         SessionStarted(),
@@ -1246,12 +1387,16 @@ async def test_redis_tracker_store_merge_trackers_same_session() -> None:
         evts=events,
     )
 
-    actual_tracker = RedisTrackerStore._merge_trackers(prior_tracker, new_tracker)
+    tracker_store = MockedRedisTrackerStore(Domain.empty())
+    await tracker_store.save(prior_tracker)
+    await tracker_store.save(new_tracker)
+
+    actual_tracker = await tracker_store.retrieve_full_tracker("same-session")
 
     assert actual_tracker == new_tracker
 
 
-def test_redis_tracker_store_merge_trackers_overlapping_session() -> None:
+async def test_redis_tracker_store_save_trackers_overlapping_session() -> None:
     prior_tracker_events: List[Event] = [
         ActionExecuted(ACTION_SESSION_START_NAME, timestamp=1),
         SessionStarted(timestamp=2),
@@ -1282,14 +1427,18 @@ def test_redis_tracker_store_merge_trackers_overlapping_session() -> None:
         evts=new_tracker_events,
     )
 
-    actual_tracker = RedisTrackerStore._merge_trackers(prior_tracker, new_tracker)
+    tracker_store = MockedRedisTrackerStore(Domain.empty())
+    await tracker_store.save(prior_tracker)
+    await tracker_store.save(new_tracker)
+
+    actual_tracker = await tracker_store.retrieve_full_tracker("overlapping-session")
 
     expected_events = prior_tracker_events + after_restart_event
 
     assert list(actual_tracker.events) == expected_events
 
 
-def test_redis_tracker_store_merge_trackers_different_session() -> None:
+async def test_redis_tracker_store_save_trackers_different_session() -> None:
     prior_tracker_events: List[Event] = [
         ActionExecuted(ACTION_SESSION_START_NAME, timestamp=1),
         SessionStarted(timestamp=2),
@@ -1314,12 +1463,77 @@ def test_redis_tracker_store_merge_trackers_different_session() -> None:
         evts=new_session,
     )
 
-    actual_tracker = RedisTrackerStore._merge_trackers(prior_tracker, new_tracker)
+    tracker_store = MockedRedisTrackerStore(Domain.empty())
+    await tracker_store.save(prior_tracker)
+    await tracker_store.save(new_tracker)
+
+    actual_tracker = await tracker_store.retrieve_full_tracker("different-session")
 
     expected_events = prior_tracker_events + new_session
     assert list(actual_tracker.events) == expected_events
 
 
+async def test_redis_tracker_store_save_only_appends_new_events(
+    domain: Domain,
+) -> None:
+    tracker_store = MockedRedisTrackerStore(domain)
+    tracker = await tracker_store.get_or_create_tracker("append-only")
+
+    tracker.update(UserUttered("hello", timestamp=1))
+    await tracker_store.save(tracker)
+    tracker.update(BotUttered("Hey!", timestamp=2))
+    await tracker_store.save(tracker)
+    await tracker_store.save(tracker)
+
+    stored_events = tracker_store.red.lrange("tracker:append-only:events", 0, -1)
+    assert [json.loads(event) for event in stored_events] == [
+        event.as_dict() for event in tracker.events
+    ]
+    assert await tracker_store.keys() == {"append-only"}
+
+
+async def test_redis_tracker_store_migrates_serialised_tracker(
+    domain: Domain,
+    tracker_with_restarted_event: DialogueStateTracker,
+    events_after_restart: List[Event],
+) -> None:
+    tracker_store = MockedRedisTrackerStore(domain)
+    sender_id = tracker_with_restarted_event.sender_id
+    tracker_store.red.set(
+        f"tracker:{sender_id}",
+        tracker_store.serialise_tracker(tracker_with_restarted_event),
+    )
+
+    tracker = await tracker_store.retrieve(sender_id)
+    assert list(tracker.events) == events_after_restart
+
+    assert tracker_store.red.get(f"tracker:{sender_id}") is None
+    assert await tracker_store.keys() == {sender_id}
+
+    full_tracker = await tracker_store.retrieve_full_tracker(sender_id)
+    assert full_tracker == tracker_with_restarted_event
+
+
+async def test_redis_tracker_store_keys_with_suffixes_in_conversation_ids(
+    domain: Domain,
+) -> None:
+    tracker_store = MockedRedisTrackerStore(domain)
+    sender_ids = {"a:events", "b:state", "c:state:events", "d"}
+    for sender_id in sender_ids:
+        tracker = await tracker_store.get_or_create_tracker(sender_id)
+        tracker.update(UserUttered("hello", timestamp=1))
+        await tracker_store.save(tracker)
+
+    tracker_store.red.set(
+        "tracker:e:state",
+        tracker_store.serialise_tracker(
+            DialogueStateTracker.from_events("e:state", [])
+        ),
+    )
+
+    assert await tracker_store.keys() == sender_ids | {"e:state"}
+
+
 async def test_tracker_event_diff_engine_event_difference() -> None:
     start_session_sequence = [
         ActionExecuted(ACTION_SESSION_START_NAME),
@@ -1342,3 +1556,60 @@ async def test_tracker_event_diff_engine_event_difference() -> None:
     event_diff = TrackerEventDiffEngine.event_difference(prior_tracker, new_tracker)
 
     assert new_events == event_diff
+
+
+@pytest.mark.parametrize(
+    "tracker_store_type",
+    [
+        InMemoryTrackerStore,
+        MockedRedisTrackerStore,
+        MockedMongoTrackerStore,
+        SQLTrackerStore,
+    ],
+)
+async def test_stream_events_without_retrieving_stored_tracker(
+    tracker_store_type: Type[TrackerStore], domain: Domain, monkeypatch: MonkeyPatch
+) -> None:
+    tracker_store = tracker_store_type(domain)
+    sender_id = "stream-events"
+    await tracker_store.save(
+        DialogueStateTracker.from_events(sender_id, [UserUttered("hi")])
+    )
+
+    tracker = await tracker_store.retrieve(sender_id)
+    new_events = [BotUttered("hey"), ActionExecuted(ACTION_LISTEN_NAME)]
+    for event in new_events:
+        tracker.update(event)
+
+    tracker_store.event_broker = Mock()
+    retrieve = AsyncMock()
+    monkeypatch.setattr(tracker_store, "retrieve", retrieve)
+
+    await tracker_store.save(tracker)
+    await tracker_store.save(tracker)
+
+    retrieve.assert_not_called()
+    # all new events are published at once and saving again publishes nothing
+    tracker_store.event_broker.publish_many.assert_called_once_with(
+        [{"sender_id": sender_id, **event.as_dict()} for event in new_events]
+    )
+
+
+async def test_stream_events_of_tracker_which_was_not_retrieved(
+    domain: Domain,
+) -> None:
+    tracker_store = InMemoryTrackerStore(domain)
+    sender_id = "stream-events-of-new-tracker"
+    await tracker_store.save(
+        DialogueStateTracker.from_events(sender_id, [UserUttered("hi")])
+    )
+
+    tracker_store.event_broker = Mock()
+    tracker = DialogueStateTracker.from_events(
+        sender_id, [UserUttered("hi"), BotUttered("hey")]
+    )
+    await tracker_store.save(tracker)
+
+    tracker_store.event_broker.publish_many.assert_called_once_with(
+        [{"sender_id": sender_id, **tracker.events[-1].as_dict()}]
+    )
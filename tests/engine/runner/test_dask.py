@@ -1,7 +1,9 @@
 from __future__ import annotations
 from typing import Optional
+from unittest.mock import Mock
 
 import pytest
+from _pytest.monkeypatch import MonkeyPatch
 
 from rasa.engine.graph import ExecutionContext, GraphSchema, SchemaNode
 from rasa.engine.exceptions import GraphRunError
@@ -326,3 +328,52 @@ def test_loading_from_previous_node(default_model_storage: ModelStorage):
     results = runner.run()
 
     assert results["load"] == test_value
+
+
+def test_run_graph_is_cached_per_target_set(
+    default_model_storage: ModelStorage, monkeypatch: MonkeyPatch
+):
+    graph_schema = GraphSchema(
+        {
+            "add": SchemaNode(
+                needs={"i1": "first_input", "i2": "second_input"},
+                uses=AddInputs,
+                fn="add",
+                constructor_name="create",
+                config={},
+            ),
+            "subtract_2": SchemaNode(
+                needs={"i": "add"},
+                uses=SubtractByX,
+                fn="subtract_x",
+                constructor_name="create",
+                config={"x": 2},
+                is_target=True,
+            ),
+        }
+    )
+    runner = DaskGraphRunner(
+        graph_schema=graph_schema,
+        model_storage=default_model_storage,
+        execution_context=ExecutionContext(graph_schema=graph_schema, model_id="1"),
+    )
+
+    minimal_graph_schema = Mock(wraps=graph_schema.minimal_graph_schema)
+    monkeypatch.setattr(graph_schema, "minimal_graph_schema", minimal_graph_schema)
+
+    # the graphs for the default targets were built when creating the runner
+    assert runner.run(inputs={"first_input": 3, "second_input": 4}) == {"subtract_2": 5}
+    assert runner.run(
+        inputs={"first_input": 1, "second_input": 2}, targets=["subtract_2"]
+    ) == {"subtract_2": 1}
+    minimal_graph_schema.assert_not_called()
+
+    # other target sets are built once
+    for _ in range(2):
+        assert runner.run(
+            inputs={"first_input": 3, "second_input": 4}, targets=["add"]
+        ) == {"add": 7}
+    minimal_graph_schema.assert_called_once_with(["add"])
+
+    # the inputs of a run are not added to the cached graph
+    assert "first_input" not in runner._run_graph_for_targets(["add"])
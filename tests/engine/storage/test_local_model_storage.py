@@ -2,6 +2,7 @@ import sys
 import uuid
 from datetime import datetime
 from pathlib import Path
+from typing import Text
 
 import freezegun
 import pytest
@@ -12,6 +13,7 @@ from tarsafe import TarSafe
 import rasa.shared.utils.io
 from rasa.engine.graph import GraphModelConfiguration, GraphSchema, SchemaNode
 from rasa.engine.storage.local_model_storage import (
+    MODEL_ARCHIVE_COMPONENTS_DIR,
     MODEL_ARCHIVE_METADATA_FILE,
     LocalModelStorage,
 )
@@ -20,6 +22,7 @@ from rasa.engine.storage.storage import ModelMetadata, ModelStorage
 from rasa.exceptions import UnsupportedModelVersionError
 from rasa.shared.core.domain import Domain
 from rasa.shared.data import TrainingType
+from rasa.shared.exceptions import InvalidConfigException
 from tests.engine.graph_components_test_classes import PersistableTestComponent
 
 
@@ -164,7 +167,18 @@ def test_read_long_resource_names_windows(
     storage.metadata_from_archive(model_archive_path=model_zips / resource_name)
 
 
-def test_create_model_package(tmp_path_factory: TempPathFactory, domain: Domain):
+@pytest.mark.parametrize(
+    "archive_format, archive_name",
+    [("tar.gz", "my-model.tar.gz"), ("tar", "my-model.tar"), ("directory", "my-model")],
+)
+def test_create_model_package(
+    tmp_path_factory: TempPathFactory,
+    domain: Domain,
+    monkeypatch: MonkeyPatch,
+    archive_format: Text,
+    archive_name: Text,
+):
+    monkeypatch.setenv("MODEL_ARCHIVE_FORMAT", archive_format)
     train_model_storage = LocalModelStorage(
         tmp_path_factory.mktemp("train model storage")
     )
@@ -208,7 +222,7 @@ def test_create_model_package(tmp_path_factory: TempPathFactory, domain: Domain)
 
     # Package model
     persisted_model_dir = tmp_path_factory.mktemp("persisted models")
-    archive_path = persisted_model_dir / "my-model.tar.gz"
+    archive_path = persisted_model_dir / archive_name
 
     trained_at = datetime.utcnow()
     with freezegun.freeze_time(trained_at):
@@ -366,3 +380,130 @@ def test_create_model_package_with_non_existing_dir(
     )
 
     assert path.exists()
+
+
+def _create_model_package(
+    model_archive_path: Path, model_storage: ModelStorage
+) -> ModelMetadata:
+    with model_storage.write_to(Resource("resource1")) as directory:
+        (directory / "file.txt").write_text("test")
+
+    return model_storage.create_model_package(
+        model_archive_path,
+        GraphModelConfiguration(
+            GraphSchema({}),
+            GraphSchema({}),
+            TrainingType.BOTH,
+            "test_assistant",
+            None,
+            None,
+            "nlu",
+        ),
+        Domain.empty(),
+    )
+
+
+@pytest.mark.parametrize(
+    "archive_format, archive_name", [("tar.gz", "model.tar.gz"), ("tar", "model.tar")]
+)
+def test_metadata_from_archive_without_extracting_archive(
+    tmp_path: Path,
+    default_model_storage: ModelStorage,
+    monkeypatch: MonkeyPatch,
+    archive_format: Text,
+    archive_name: Text,
+):
+    monkeypatch.setenv("MODEL_ARCHIVE_FORMAT", archive_format)
+    archive_path = tmp_path / archive_name
+    metadata = _create_model_package(archive_path, default_model_storage)
+
+    def extract_archive(*args, **kwargs) -> None:
+        raise AssertionError("The archive must not be extracted.")
+
+    monkeypatch.setattr(
+        LocalModelStorage, "_extract_archive_to_directory", extract_archive
+    )
+
+    assert (
+        LocalModelStorage.metadata_from_archive(archive_path).model_id
+        == metadata.model_id
+    )
+
+
+def test_from_model_archive_read_only_reads_model_directory_in_place(
+    tmp_path_factory: TempPathFactory,
+    default_model_storage: ModelStorage,
+    monkeypatch: MonkeyPatch,
+):
+    monkeypatch.setenv("MODEL_ARCHIVE_FORMAT", "directory")
+    model_directory = tmp_path_factory.mktemp("models") / "model"
+    metadata = _create_model_package(model_directory, default_model_storage)
+
+    storage_path = tmp_path_factory.mktemp("load model storage")
+    (
+        model_storage,
+        packaged_metadata,
+    ) = LocalModelStorage.from_model_archive_read_only(storage_path, model_directory)
+
+    assert packaged_metadata.model_id == metadata.model_id
+    assert not list(storage_path.glob("*"))
+    with model_storage.read_from(Resource("resource1")) as directory:
+        assert directory == model_directory / MODEL_ARCHIVE_COMPONENTS_DIR / "resource1"
+        assert (directory / "file.txt").read_text() == "test"
+
+
+def test_create_model_directory_replaces_existing_model_directory(
+    tmp_path: Path, default_model_storage: ModelStorage, monkeypatch: MonkeyPatch
+):
+    monkeypatch.setenv("MODEL_ARCHIVE_FORMAT", "directory")
+    model_directory = tmp_path / "model"
+    first_metadata = _create_model_package(model_directory, default_model_storage)
+    second_metadata = _create_model_package(model_directory, default_model_storage)
+
+    assert first_metadata.model_id != second_metadata.model_id
+    assert (
+        LocalModelStorage.metadata_from_archive(model_directory).model_id
+        == second_metadata.model_id
+    )
+
+
+def test_create_model_directory_with_existing_other_directory(
+    tmp_path: Path, default_model_storage: ModelStorage, monkeypatch: MonkeyPatch
+):
+    monkeypatch.setenv("MODEL_ARCHIVE_FORMAT", "directory")
+    model_directory = tmp_path / "model"
+    model_directory.mkdir()
+    (model_directory / "my-notes.txt").touch()
+
+    with pytest.raises(ValueError):
+        _create_model_package(model_directory, default_model_storage)
+
+    assert (model_directory / "my-notes.txt").is_file()
+
+
+@pytest.mark.parametrize("archive_name", ["my-model", "my-model.zip"])
+def test_create_model_package_uses_default_format_regardless_of_suffix(
+    tmp_path: Path, default_model_storage: ModelStorage, archive_name: Text
+):
+    archive_path = tmp_path / archive_name
+    metadata = _create_model_package(archive_path, default_model_storage)
+
+    assert archive_path.is_file()
+    with TarSafe.open(archive_path, "r:gz") as tar:
+        assert tar.getnames()[0] == MODEL_ARCHIVE_METADATA_FILE
+    assert (
+        LocalModelStorage.metadata_from_archive(archive_path).model_id
+        == metadata.model_id
+    )
+
+
+def test_create_model_package_with_invalid_format(
+    tmp_path: Path, default_model_storage: ModelStorage, monkeypatch: MonkeyPatch
+):
+    monkeypatch.setenv("MODEL_ARCHIVE_FORMAT", "zip")
+    archive_path = tmp_path / "model.zip"
+
+    with pytest.raises(InvalidConfigException):
+        _create_model_package(archive_path, default_model_storage)
+
+    assert not archive_path.exists()
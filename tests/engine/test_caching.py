@@ -1,7 +1,10 @@
 import dataclasses
 import logging
+import os
 import shutil
+import sqlite3
 import uuid
+from datetime import datetime
 from pathlib import Path
 from typing import Dict, Text, Optional, Any, Callable
 from unittest.mock import Mock
@@ -12,14 +15,17 @@ from _pytest.monkeypatch import MonkeyPatch
 from sqlalchemy.exc import OperationalError
 
 import rasa.shared.utils.io
+import rasa.utils.common
 import rasa.shared.utils.common
 from rasa.engine.caching import (
+    CacheStatistics,
     LocalTrainingCache,
     CACHE_LOCATION_ENV,
     DEFAULT_CACHE_NAME,
     CACHE_SIZE_ENV,
     CACHE_DB_NAME_ENV,
     TrainingCache,
+    UNTRACKED_CONTENT_GRACE_PERIOD,
 )
 import tests.conftest
 from rasa.engine.storage.local_model_storage import LocalModelStorage
@@ -460,20 +466,21 @@ def test_cache_exceeds_size_but_not_in_database(
     # Pretend we have a cache of size `max_cached_size`
     monkeypatch.setenv(CACHE_SIZE_ENV, str(max_cache_size))
 
-    cache = LocalTrainingCache()
-
     # Fill cache with something which is not in the cache metadata
-    sub_dir = cache._cache_location / "some dir"
+    cache_location = LocalTrainingCache._get_cache_location()
+    sub_dir = cache_location / "some dir"
     sub_dir.mkdir()
 
     # one subdirectory which needs deletion
     tests.conftest.create_test_file_with_size(sub_dir, max_cache_size)
     # one file which needs deletion
     test_file = tests.conftest.create_test_file_with_size(
-        cache._cache_location, max_cache_size
+        cache_location, max_cache_size
     )
 
-    # Cache an item
+    cache = LocalTrainingCache()
+
+    # Cache an item. Content which isn't tracked doesn't count towards the cache size.
     fingerprint_key = uuid.uuid4().hex
     output = TestCacheableOutput({"something to cache": "dasdaasda"}, size_in_mb=2)
     output_fingerprint = uuid.uuid4().hex
@@ -485,8 +492,222 @@ def test_cache_exceeds_size_but_not_in_database(
     assert cache.get_cached_result(
         output_fingerprint, "some_node", default_model_storage
     )
+
+    # Recent content might be a result which another process is about to add
+    cache.prune(max_cache_size)
+    assert sub_dir.is_dir()
+    assert test_file.is_file()
+
+    # Older content which isn't tracked is deleted when pruning the cache
+    changed_at = (datetime.now() - UNTRACKED_CONTENT_GRACE_PERIOD).timestamp() - 1
+    for item in [sub_dir, test_file]:
+        os.utime(item, (changed_at, changed_at))
+    cache.prune(max_cache_size)
+
     assert not sub_dir.is_dir()
     assert not test_file.is_file()
+    assert cache.get_cached_result(
+        output_fingerprint, "some_node", default_model_storage
+    )
+
+
+def test_evicting_results_deletes_old_untracked_content(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+    local_cache_creator: Callable[..., LocalTrainingCache],
+    default_model_storage: ModelStorage,
+):
+    monkeypatch.setenv(CACHE_SIZE_ENV, "5")
+
+    cache_location = tmp_path / "cache"
+    cache = local_cache_creator(cache_location)
+
+    # results of processes which crashed before they added the cache entry
+    orphaned_result = cache_location / "orphaned result"
+    orphaned_result.mkdir()
+    tests.conftest.create_test_file_with_size(orphaned_result, 1)
+    changed_at = (datetime.now() - UNTRACKED_CONTENT_GRACE_PERIOD).timestamp() - 1
+    os.utime(orphaned_result, (changed_at, changed_at))
+    recent_result = cache_location / "recent result"
+    recent_result.mkdir()
+
+    for _ in range(2):
+        cache.cache_output(
+            uuid.uuid4().hex,
+            TestCacheableOutput({"something to cache": "dasdaasda"}, size_in_mb=2),
+            uuid.uuid4().hex,
+            default_model_storage,
+        )
+
+    # nothing had to be evicted yet
+    assert orphaned_result.is_dir()
+
+    cache.cache_output(
+        uuid.uuid4().hex,
+        TestCacheableOutput({"something to cache": "dasdaasda"}, size_in_mb=2),
+        uuid.uuid4().hex,
+        default_model_storage,
+    )
+
+    assert not orphaned_result.exists()
+    assert recent_result.is_dir()
+    assert cache.statistics().number_of_results == 2
+
+
+def test_bulk_delete_using_lru_with_stored_sizes(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+    local_cache_creator: Callable[..., LocalTrainingCache],
+    default_model_storage: ModelStorage,
+):
+    monkeypatch.setenv(CACHE_SIZE_ENV, "7")
+
+    cache_location = tmp_path / "cache"
+    cache = local_cache_creator(cache_location)
+
+    output_fingerprints = []
+    for _ in range(3):
+        output_fingerprint = uuid.uuid4().hex
+        cache.cache_output(
+            uuid.uuid4().hex,
+            TestCacheableOutput({"something to cache": "dasdaasda"}, size_in_mb=2),
+            output_fingerprint,
+            default_model_storage,
+        )
+        output_fingerprints.append(output_fingerprint)
+
+    statistics = cache.statistics()
+    assert statistics.number_of_entries == 3
+    assert statistics.number_of_results == 3
+    assert statistics.size_in_bytes == pytest.approx(6 * 1_048_576, rel=0.01)
+
+    # caching 4 MiB requires deleting the two least recently used results at once
+    directory_size_in_bytes = rasa.utils.common.directory_size_in_bytes
+
+    def size_of_output(path: Path, *args: Any, **kwargs: Any) -> int:
+        assert path != cache_location, "The cache directory must not be walked."
+        return directory_size_in_bytes(path, *args, **kwargs)
+
+    monkeypatch.setattr(rasa.utils.common, "directory_size_in_bytes", size_of_output)
+    cache.cache_output(
+        uuid.uuid4().hex,
+        TestCacheableOutput({"something to cache": "dasdaasda"}, size_in_mb=4),
+        uuid.uuid4().hex,
+        default_model_storage,
+    )
+
+    for output_fingerprint in output_fingerprints[:2]:
+        assert (
+            cache.get_cached_result(
+                output_fingerprint, "some_node", default_model_storage
+            )
+            is None
+        )
+    assert cache.get_cached_result(
+        output_fingerprints[2], "some_node", default_model_storage
+    )
+    assert cache.statistics().size_in_bytes == pytest.approx(6 * 1_048_576, rel=0.01)
+
+
+def test_prune_cache(
+    tmp_path: Path,
+    local_cache_creator: Callable[..., LocalTrainingCache],
+    default_model_storage: ModelStorage,
+):
+    cache_location = tmp_path / "cache"
+    cache = local_cache_creator(cache_location)
+    for _ in range(3):
+        cache.cache_output(
+            uuid.uuid4().hex,
+            TestCacheableOutput({"something to cache": "dasdaasda"}, size_in_mb=1),
+            uuid.uuid4().hex,
+            default_model_storage,
+        )
+
+    assert cache.prune(max_size_in_mb=2.5) == 1
+    assert cache.statistics().number_of_results == 2
+
+    assert cache.prune(max_size_in_mb=0) == 2
+    assert cache.statistics().size_in_bytes == 0
+    assert list(cache_location.glob("*")) == [cache_location / DEFAULT_CACHE_NAME]
+
+
+def _create_cache_of_previous_version(cache_location: Path) -> Path:
+    result_location = cache_location / "some result"
+    result_location.mkdir()
+    tests.conftest.create_test_file_with_size(result_location, 1)
+
+    # create the database like previous Rasa versions did
+    connection = sqlite3.connect(cache_location / DEFAULT_CACHE_NAME)
+    connection.execute(
+        "CREATE TABLE cache_entry (fingerprint_key VARCHAR NOT NULL PRIMARY KEY, "
+        "output_fingerprint_key VARCHAR NOT NULL, last_used DATETIME NOT NULL, "
+        "rasa_version VARCHAR(255) NOT NULL, result_location VARCHAR, "
+        "result_type VARCHAR)"
+    )
+    connection.execute(
+        "INSERT INTO cache_entry VALUES (?, ?, ?, ?, ?, ?)",
+        (
+            "fingerprint",
+            "output fingerprint",
+            "2023-01-01 00:00:00.000000",
+            rasa.__version__,
+            str(result_location),
+            rasa.shared.utils.common.module_path_from_instance(TestCacheableOutput({})),
+        ),
+    )
+    connection.commit()
+    connection.close()
+
+    return result_location
+
+
+def test_add_result_sizes_to_cache_of_previous_version(
+    tmp_path: Path, local_cache_creator: Callable[..., LocalTrainingCache]
+):
+    result_location = _create_cache_of_previous_version(tmp_path)
+
+    cache = local_cache_creator(tmp_path)
+
+    assert cache.statistics().size_in_bytes == (
+        rasa.utils.common.directory_size_in_bytes(result_location)
+    )
+    assert cache.get_cached_output_fingerprint("fingerprint") == "output fingerprint"
+    assert result_location.is_dir()
+
+
+def test_inspect_cache_of_previous_version_read_only(
+    tmp_path: Path, monkeypatch: MonkeyPatch
+):
+    result_location = _create_cache_of_previous_version(tmp_path)
+    database = tmp_path / DEFAULT_CACHE_NAME
+    untracked_file = tests.conftest.create_test_file_with_size(tmp_path, 1)
+    os.utime(untracked_file, (0, 0))
+    modified_at = database.stat().st_mtime_ns
+    monkeypatch.setattr(LocalTrainingCache, "_get_cache_location", lambda: tmp_path)
+
+    cache = LocalTrainingCache(read_only=True)
+
+    assert cache.statistics() == CacheStatistics(
+        number_of_entries=1,
+        number_of_results=1,
+        size_in_bytes=rasa.utils.common.directory_size_in_bytes(result_location),
+    )
+    # neither the database nor the cache directory were changed
+    assert database.stat().st_mtime_ns == modified_at
+    assert untracked_file.is_file()
+
+
+def test_inspect_missing_cache_read_only(tmp_path: Path, monkeypatch: MonkeyPatch):
+    cache_location = tmp_path / "cache"
+    monkeypatch.setattr(
+        LocalTrainingCache, "_get_cache_location", lambda: cache_location
+    )
+
+    cache = LocalTrainingCache(read_only=True)
+
+    assert cache.statistics() == CacheStatistics(0, 0, 0)
+    assert not cache_location.exists()
 
 
 def test_clean_up_of_cached_result_if_database_fails(
@@ -1,6 +1,9 @@
 from typing import Dict, Text, Any
 
 import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+from rasa.constants import ENV_TRACKER_GENERATION_PROCESSES
 from rasa.graph_components.providers.training_tracker_provider import (
     TrainingTrackerProvider,
 )
@@ -13,6 +16,7 @@ from rasa.shared.core.training_data.story_reader.yaml_story_reader import (
     YAMLStoryReader,
 )
 from rasa.shared.core.training_data.structures import StoryGraph
+from rasa.shared.exceptions import InvalidConfigException
 
 
 @pytest.mark.parametrize(
@@ -82,3 +86,23 @@ def test_generated_trackers_can_omit_unset_slots(
 
     states_with_unset_slots = trackers[0].past_states(domain, omit_unset_slots=False)
     assert all(["slots" in state for state in states_with_unset_slots])
+
+
+@pytest.mark.parametrize("num_processes", ["0", "two"])
+def test_generating_trackers_with_invalid_number_of_processes(
+    default_model_storage: ModelStorage,
+    default_execution_context: ExecutionContext,
+    monkeypatch: MonkeyPatch,
+    num_processes: Text,
+):
+    monkeypatch.setenv(ENV_TRACKER_GENERATION_PROCESSES, num_processes)
+    steps = YAMLStoryReader().read_from_file("data/test_yaml_stories/stories.yml")
+    component = TrainingTrackerProvider.create(
+        TrainingTrackerProvider.get_default_config(),
+        default_model_storage,
+        Resource("xy"),
+        default_execution_context,
+    )
+
+    with pytest.raises(InvalidConfigException):
+        component.provide(story_graph=StoryGraph(steps), domain=Domain.empty())
@@ -15,14 +15,11 @@ async def test_kafka_event_broker_valid():
         partition_by_sender=True,
     )
 
-    try:
-        broker.publish(
-            {"sender_id": "valid_test", "event": "user", "text": "hello world!"},
-            retries=5,
-        )
-        assert broker.producer.poll() == 1
-    finally:
-        await broker.close()
+    broker.publish({"sender_id": "valid_test", "event": "user", "text": "hello world!"})
+    await broker.close()
+
+    assert broker.metrics.number_of_published_events == 1
+    assert broker.metrics.number_of_failed_events == 0
 
 
 @pytest.mark.broker
@@ -34,21 +31,20 @@ async def test_kafka_event_broker_buffer_error_is_handled(caplog: LogCaptureFixt
         sasl_password="password",
         partition_by_sender=True,
         queue_size=1,
+        retries=5,
     )
 
     event_count = 100
-    try:
+    with caplog.at_level(logging.DEBUG):
         for i in range(event_count):
-            with caplog.at_level(logging.DEBUG):
-                broker.publish(
-                    {
-                        "sender_id": "valid_test",
-                        "event": "user",
-                        "text": "hello world!",
-                    },
-                    retries=5,
-                )
-        assert "Queue full" in caplog.text
-        assert broker.producer.poll() == 1
-    finally:
+            broker.publish(
+                {
+                    "sender_id": "valid_test",
+                    "event": "user",
+                    "text": "hello world!",
+                }
+            )
         await broker.close()
+
+    assert "Queue full" in caplog.text
+    assert broker.metrics.number_of_published_events == event_count
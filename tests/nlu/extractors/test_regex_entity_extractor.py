@@ -1,9 +1,11 @@
 import copy
+import re
 from rasa.engine.graph import ExecutionContext
 from rasa.engine.storage.storage import ModelStorage
 from typing import Any, Text, Dict, List, Callable
 
 import pytest
+from _pytest.monkeypatch import MonkeyPatch
 
 from rasa.engine.storage.resource import Resource
 from rasa.shared.nlu.training_data.training_data import TrainingData
@@ -329,3 +331,33 @@ def test_process_does_not_overwrite_any_entities(
             EXTRACTOR: RegexEntityExtractor.__name__,
         },
     ]
+
+
+def test_process_does_not_compile_patterns_again(
+    default_model_storage: ModelStorage, monkeypatch: MonkeyPatch
+):
+    compiled_patterns = []
+    compile = re.compile
+
+    def counting_compile(pattern: Text, *args: Any, **kwargs: Any) -> re.Pattern:
+        compiled_patterns.append(pattern)
+        return compile(pattern, *args, **kwargs)
+
+    monkeypatch.setattr(re, "compile", counting_compile)
+
+    patterns = [
+        {"name": f"pattern_{index}", "pattern": f"\\b[a-z]+{index}\\b"}
+        for index in range(10)
+    ]
+    extractor = RegexEntityExtractor(
+        RegexEntityExtractor.get_default_config(),
+        default_model_storage,
+        Resource("regex"),
+        patterns=patterns,
+    )
+    assert compiled_patterns == [pattern["pattern"] for pattern in patterns]
+
+    for _ in range(5):
+        extractor.process([Message(data={TEXT: "order pizza number3 to Berlin"})])
+
+    assert len(compiled_patterns) == len(patterns)
@@ -721,6 +721,50 @@ def test_count_vector_featurizer_process_by_attribute(
     assert action_name_sen_vecs is None
 
 
+@pytest.mark.parametrize("analyzer", ["word", "char_wb"])
+def test_count_vector_featurizer_process_batch_like_single_messages(
+    analyzer: Text,
+    create_featurizer: Callable[..., CountVectorsFeaturizer],
+    whitespace_tokenizer: WhitespaceTokenizer,
+):
+    ftr = create_featurizer({"analyzer": analyzer})
+
+    train_data = TrainingData(
+        [
+            Message(data={TEXT: "hello there", INTENT: "greet"}),
+            Message(data={TEXT: "goodbye my friend", INTENT: "goodbye"}),
+            Message(data={TEXT: "hello hello again", INTENT: "greet"}),
+        ]
+    )
+    whitespace_tokenizer.process_training_data(train_data)
+    ftr.train(train_data)
+
+    texts = ["hello my friend", "", "unknown words only", "goodbye goodbye"]
+    batch = [Message(data={TEXT: text}) for text in texts]
+    single_messages = [Message(data={TEXT: text}) for text in texts]
+    whitespace_tokenizer.process(batch)
+    whitespace_tokenizer.process(single_messages)
+
+    ftr.process(batch)
+    for message in single_messages:
+        ftr.process([message])
+
+    for batch_message, single_message in zip(batch, single_messages):
+        batch_features = batch_message.get_sparse_features(TEXT, [])
+        single_features = single_message.get_sparse_features(TEXT, [])
+
+        for batch_feature, single_feature in zip(batch_features, single_features):
+            if single_feature is None:
+                assert batch_feature is None
+                continue
+
+            assert isinstance(batch_feature.features, scipy.sparse.coo_matrix)
+            assert batch_feature.features.shape == single_feature.features.shape
+            assert np.all(
+                batch_feature.features.toarray() == single_feature.features.toarray()
+            )
+
+
 @pytest.mark.parametrize(
     "initial_train_text, additional_train_text, "
     "initial_vocabulary_size, final_vocabulary_size",
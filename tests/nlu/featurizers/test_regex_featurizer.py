@@ -1,8 +1,10 @@
 from typing import Text, List, Any, Tuple, Callable, Dict, Optional
 
 import dataclasses
+import re
 import numpy as np
 import pytest
+from _pytest.monkeypatch import MonkeyPatch
 
 from rasa.engine.graph import ExecutionContext
 from rasa.engine.storage.resource import Resource
@@ -626,3 +628,32 @@ def test_vocabulary_expand_for_finetuning(
         if pattern["name"] == "hello"
     ]
     assert pattern_to_check == [new_patterns[1]]
+
+
+def test_process_does_not_compile_patterns_again(
+    create_featurizer: Callable[..., RegexFeaturizer],
+    whitespace_tokenizer: WhitespaceTokenizer,
+    monkeypatch: MonkeyPatch,
+):
+    compiled_patterns = []
+    compile = re.compile
+
+    def counting_compile(pattern: Text, *args: Any, **kwargs: Any) -> re.Pattern:
+        compiled_patterns.append(pattern)
+        return compile(pattern, *args, **kwargs)
+
+    monkeypatch.setattr(re, "compile", counting_compile)
+
+    patterns = [
+        {"name": f"pattern_{index}", "pattern": f"\\b[a-z]+{index}\\b"}
+        for index in range(10)
+    ]
+    featurizer = create_featurizer(known_patterns=patterns)
+    assert compiled_patterns == [pattern["pattern"] for pattern in patterns]
+
+    for _ in range(5):
+        message = Message(data={TEXT: "order pizza number3 to Berlin"})
+        whitespace_tokenizer.process([message])
+        featurizer.process([message])
+
+    assert len(compiled_patterns) == len(patterns)
@@ -1,4 +1,6 @@
-from typing import Dict, List, Text
+from typing import Any, Dict, List, Text, Tuple
+
+import re
 
 import pytest
 
@@ -13,7 +15,14 @@ from rasa.shared.nlu.training_data.message import Message
         (
             {"name": "person", "elements": ["Max", "John"]},
             {},
-            [{"name": "person", "pattern": "(\\bMax\\b|\\bJohn\\b)"}],
+            [
+                {
+                    "name": "person",
+                    "pattern": "(\\bMax\\b|\\bJohn\\b)",
+                    "elements": ["Max", "John"],
+                    "use_word_boundaries": True,
+                }
+            ],
         ),
         ({}, {}, []),
         (
@@ -26,7 +35,12 @@ from rasa.shared.nlu.training_data.message import Message
             {"name": "zipcode", "pattern": "[0-9]{5}"},
             [
                 {"name": "zipcode", "pattern": "[0-9]{5}"},
-                {"name": "person", "pattern": "(\\bMax\\b|\\bJohn\\b)"},
+                {
+                    "name": "person",
+                    "pattern": "(\\bMax\\b|\\bJohn\\b)",
+                    "elements": ["Max", "John"],
+                    "use_word_boundaries": True,
+                },
             ],
         ),
         (
@@ -38,6 +52,14 @@ from rasa.shared.nlu.training_data.message import Message
                     "name": "plates",
                     "pattern": "(\\btacos\\b|\\bbeef\\b|\\bmapo\\ "
                     "tofu\\b|\\bburrito\\b|\\blettuce\\ wrap\\b)",
+                    "elements": [
+                        "tacos",
+                        "beef",
+                        "mapo tofu",
+                        "burrito",
+                        "lettuce wrap",
+                    ],
+                    "use_word_boundaries": True,
                 },
             ],
         ),
@@ -102,7 +124,14 @@ def test_extract_patterns_use_only_entities_regexes(
         (
             "person",
             {"name": "person", "elements": ["Max", "John"]},
-            [{"name": "person", "pattern": "(\\bMax\\b|\\bJohn\\b)"}],
+            [
+                {
+                    "name": "person",
+                    "pattern": "(\\bMax\\b|\\bJohn\\b)",
+                    "elements": ["Max", "John"],
+                    "use_word_boundaries": True,
+                }
+            ],
         ),
         ("entity", {"name": "person", "elements": ["Max", "John"]}, []),
     ],
@@ -150,7 +179,14 @@ def test_extract_patterns_use_only_entities_lookup_tables(
             {"name": "zipcode", "pattern": "[0-9]{5}"},
             True,
             False,
-            [{"name": "person", "pattern": "(\\bMax\\b|\\bJohn\\b)"}],
+            [
+                {
+                    "name": "person",
+                    "pattern": "(\\bMax\\b|\\bJohn\\b)",
+                    "elements": ["Max", "John"],
+                    "use_word_boundaries": True,
+                }
+            ],
         ),
         (
             {"name": "person", "elements": ["Max", "John"]},
@@ -218,3 +254,103 @@ def test_regex_validation(
     assert "Model training failed." in str(e.value)
     assert "not a valid regex." in str(e.value)
     assert "Please update your nlu training data configuration" in str(e.value)
+
+
+@pytest.mark.parametrize(
+    "elements, text, use_word_boundaries, case_sensitive, expected_spans",
+    [
+        (["Max", "John"], "Max and John", True, True, [(0, 3), (8, 12)]),
+        (["Max", "John"], "max and john", True, True, []),
+        (["Max", "John"], "max and JOHN", True, False, [(0, 3), (8, 12)]),
+        (["Max"], "Maxima and Max_ and Max!", True, True, [(20, 23)]),
+        (["Max"], "Maxima and Max_", False, True, [(0, 3), (11, 14)]),
+        # like the regex alternation the first and not the longest element matches
+        (["new", "new york"], "new york", False, True, [(0, 3)]),
+        (["new york", "new"], "new york", False, True, [(0, 8)]),
+        (["new", "new york"], "new yorkshire", True, True, [(0, 3)]),
+        (["aa"], "aaaaa", False, True, [(0, 2), (2, 4)]),
+        (["Straße", "(b)"], "STRASSE straße (B)", False, False, [(8, 14), (15, 18)]),
+        (["ſ"], "S s ſ", True, False, [(0, 1), (2, 3), (4, 5)]),
+    ],
+)
+def test_lookup_table_matcher(
+    elements: List[Text],
+    text: Text,
+    use_word_boundaries: bool,
+    case_sensitive: bool,
+    expected_spans: List[Tuple[int, int]],
+):
+    matcher = pattern_utils.LookupTableMatcher(
+        elements, use_word_boundaries, case_sensitive
+    )
+
+    assert list(matcher.finditer(text)) == expected_spans
+
+    regex = pattern_utils._generate_lookup_regex(
+        {"name": "table", "elements": elements}, use_word_boundaries
+    )
+    flags = 0 if case_sensitive else re.IGNORECASE
+    assert [
+        match.span() for match in re.finditer(regex, text, flags=flags)
+    ] == expected_spans
+
+
+@pytest.mark.parametrize(
+    "pattern, expected_matcher",
+    [
+        ({"name": "zipcode", "pattern": "[0-9]{5}"}, False),
+        (
+            {
+                "name": "person",
+                "pattern": "(\\bMax\\b|\\bJohn\\b)",
+                "elements": ["Max", "John"],
+                "use_word_boundaries": True,
+            },
+            True,
+        ),
+        (
+            {
+                "name": "person",
+                "pattern": "(\\bMax\\b|\\b\\b)",
+                "elements": ["Max", ""],
+                "use_word_boundaries": True,
+            },
+            False,
+        ),
+    ],
+)
+def test_create_lookup_matcher(pattern: Dict[Text, Any], expected_matcher: bool):
+    matcher = pattern_utils.create_lookup_matcher(pattern)
+
+    assert (matcher is not None) == expected_matcher
+
+
+def test_matchers_compile_patterns_once(monkeypatch: pytest.MonkeyPatch):
+    patterns = [
+        {"name": f"pattern_{index}", "pattern": f"\\b[a-z]+{index}\\b"}
+        for index in range(5)
+    ]
+    patterns.append(
+        {
+            "name": "person",
+            "pattern": "(\\bMax\\b|\\bJohn\\b)",
+            "elements": ["Max", "John"],
+            "use_word_boundaries": True,
+        }
+    )
+    matchers = pattern_utils.create_matchers(patterns, case_sensitive=False)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Pattern was compiled on the hot path.")
+
+    monkeypatch.setattr(re, "compile", fail)
+    monkeypatch.setattr(re, "finditer", fail)
+
+    assert [list(matcher.finditer("abc3 def4 john")) for matcher in matchers] == [
+        [],
+        [],
+        [],
+        [(0, 4)],
+        [(5, 9)],
+        [(10, 14)],
+    ]
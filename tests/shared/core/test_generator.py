@@ -1,4 +1,17 @@
+from typing import Any, List, Text, Tuple
+from unittest.mock import Mock
+
+from _pytest.monkeypatch import MonkeyPatch
+
 import rasa.shared.core.generator
+from rasa.shared.core.constants import ACTION_LISTEN_NAME
+from rasa.shared.core.domain import Domain
+from rasa.shared.core.events import ActionExecuted
+from rasa.shared.core.generator import TrackerWithCachedStates, TrainingDataGenerator
+from rasa.shared.core.training_data.story_reader.yaml_story_reader import (
+    YAMLStoryReader,
+)
+from rasa.shared.core.training_data.structures import STORY_START, StoryGraph
 
 
 def test_subsample_array_read_only():
@@ -18,3 +31,95 @@ def test_subsample_array():
 
     assert len(r) == 5
     assert set(r).issubset(t)
+
+
+def _generate_trackers(
+    stories_path: Text, num_processes: int, **kwargs: Any
+) -> Tuple[Domain, List[TrackerWithCachedStates]]:
+    steps = YAMLStoryReader().read_from_file(stories_path)
+    domain = Domain.empty()
+    generator = TrainingDataGenerator(
+        StoryGraph(steps), domain, num_processes=num_processes, **kwargs
+    )
+    return domain, generator.generate()
+
+
+def test_partition_story_steps_keeps_connected_steps_together():
+    reader = YAMLStoryReader()
+    steps = reader.read_from_file("data/test_yaml_stories/stories.yml")
+    steps += reader.read_from_file("data/test_yaml_stories/stories_with_cycle.yml")
+    generator = TrainingDataGenerator(
+        StoryGraph(steps), Domain.empty(), num_processes=3
+    )
+    ordered_steps = generator.story_graph.ordered_steps()
+
+    partitions = generator._partition_story_steps(ordered_steps)
+
+    assert len(partitions) == 3
+    assert sum(len(partition) for partition in partitions) == len(ordered_steps)
+
+    partition_by_checkpoint = {}
+    for index, partition in enumerate(partitions):
+        assert partition == [step for step in ordered_steps if step in partition]
+        for step in partition:
+            for checkpoint in step.start_checkpoints + step.end_checkpoints:
+                name = generator._find_start_checkpoint_name(checkpoint.name)
+                if name != STORY_START:
+                    assert partition_by_checkpoint.setdefault(name, index) == index
+
+
+def test_partition_story_steps_with_one_process():
+    steps = YAMLStoryReader().read_from_file("data/test_yaml_stories/stories.yml")
+    generator = TrainingDataGenerator(StoryGraph(steps), Domain.empty())
+    ordered_steps = generator.story_graph.ordered_steps()
+
+    assert generator._partition_story_steps(ordered_steps) == [ordered_steps]
+
+
+def test_generate_in_processes_without_augmentation():
+    domain, trackers = _generate_trackers(
+        "data/test_yaml_stories/stories.yml", 1, augmentation_factor=0
+    )
+    parallel_domain, parallel_trackers = _generate_trackers(
+        "data/test_yaml_stories/stories.yml", 2, augmentation_factor=0
+    )
+
+    assert len(parallel_trackers) == len(trackers)
+    assert {tuple(t.past_states_for_hashing(domain)) for t in trackers} == {
+        tuple(t.past_states_for_hashing(parallel_domain)) for t in parallel_trackers
+    }
+
+
+def test_generate_in_processes_is_deterministic():
+    domain, trackers = _generate_trackers("data/test_yaml_stories/stories.yml", 2)
+    other_domain, other_trackers = _generate_trackers(
+        "data/test_yaml_stories/stories.yml", 2
+    )
+
+    assert len(trackers) > 7
+    assert all(t.domain is domain for t in trackers)
+    assert [tuple(t.past_states_for_hashing(domain)) for t in trackers] == [
+        tuple(t.past_states_for_hashing(other_domain)) for t in other_trackers
+    ]
+
+
+def test_generate_in_processes_removes_duplicate_finished_trackers(
+    monkeypatch: MonkeyPatch,
+):
+    domain = Domain.empty()
+    generator = TrainingDataGenerator(StoryGraph([]), domain, num_processes=2)
+    tracker = TrackerWithCachedStates("", domain.slots, domain=domain)
+    tracker.update(ActionExecuted(ACTION_LISTEN_NAME))
+
+    # both partitions finish a tracker with the same featurization
+    results = [
+        ([tracker.copy("first")], [], set()),
+        ([tracker.copy("second")], [], set()),
+    ]
+    monkeypatch.setattr(generator, "_run_partitions", Mock(return_value=results))
+
+    finished_trackers, _ = generator._generate_in_processes(
+        [[], []], is_rule_data=False, min_num_aug_phases=0
+    )
+
+    assert [t.sender_id for t in finished_trackers] == ["first"]
@@ -1,3 +1,4 @@
+import copy
 import datetime
 import json
 import logging
@@ -7,10 +8,12 @@ import time
 from pathlib import Path
 import tempfile
 from typing import List, Text, Dict, Any, Type
+from unittest.mock import Mock
 
 import fakeredis
 import freezegun
 import pytest
+from _pytest.monkeypatch import MonkeyPatch
 
 from rasa.core.actions.action import ActionExtractSlots
 from rasa.core.channels import CollectingOutputChannel
@@ -25,6 +28,7 @@ from rasa.shared.core.constants import (
     LOOP_NAME,
     REQUESTED_SLOT,
     LOOP_INTERRUPTED,
+    USER,
 )
 from rasa.shared.constants import (
     ASSISTANT_ID_KEY,
@@ -98,7 +102,7 @@ class MockRedisTrackerStore(RedisTrackerStore):
         super().__init__(_domain)
 
         # Patch the Redis connection in RedisTrackerStore using fakeredis
-        self.red = fakeredis.FakeStrictRedis()
+        self.red = fakeredis.FakeStrictRedis(decode_responses=True)
 
         # added in redis==3.3.0, but not yet in fakeredis
         self.red.connection_pool.connection_class.health_check_interval = 0
@@ -1616,3 +1620,82 @@ def test_assistant_id_is_not_added_to_events_with_assistant_id():
         ActionExecuted(action_name="test", metadata={ASSISTANT_ID_KEY: "old_name"})
     )
     assert tracker.events[-1].metadata[ASSISTANT_ID_KEY] == "old_name"
+
+
+def test_unpersisted_events():
+    tracker = DialogueStateTracker.from_events("test", [UserUttered("hi")])
+    # it's unknown which events were persisted
+    assert tracker.unpersisted_events() is None
+
+    tracker.mark_events_as_persisted()
+    assert tracker.unpersisted_events() == []
+
+    new_events = [BotUttered("hey"), ActionExecuted(ACTION_LISTEN_NAME)]
+    tracker.update_with_events(new_events, domain=None)
+    assert tracker.unpersisted_events() == new_events
+
+
+def test_unpersisted_events_with_truncated_events():
+    tracker = DialogueStateTracker("test", slots=None, max_event_history=2)
+    tracker.update(UserUttered("hi"))
+    tracker.mark_events_as_persisted()
+
+    tracker.update(BotUttered("hey"))
+    assert tracker.unpersisted_events() == [BotUttered("hey")]
+
+    # the latest persisted event was removed from the tracker
+    tracker.update(ActionExecuted(ACTION_LISTEN_NAME))
+    tracker.update(UserUttered("bye"))
+    assert tracker.unpersisted_events() is None
+
+
+@pytest.mark.parametrize("ignore_rule_only_turns", [True, False])
+def test_past_states_are_computed_incrementally(
+    domain: Domain, monkeypatch: MonkeyPatch, ignore_rule_only_turns: bool
+):
+    events = [
+        ActionExecuted(ACTION_LISTEN_NAME),
+        UserUttered("hi", intent={"name": "greet"}),
+        ActionExecuted("utter_greet", hide_rule_turn=True),
+        ActionExecuted(ACTION_LISTEN_NAME),
+        UserUttered("bye", intent={"name": "goodbye"}),
+        SlotSet("name", "Peter"),
+        ActionExecuted("utter_goodbye"),
+        ActionExecuted(ACTION_LISTEN_NAME),
+        UserUttered("hi again", intent={"name": "greet"}),
+        UserUtteranceReverted(),
+        UserUttered("hi", intent={"name": "greet"}),
+    ]
+    tracker = DialogueStateTracker("default", domain.slots)
+
+    init_copy = Mock(wraps=tracker.init_copy)
+    monkeypatch.setattr(tracker, "init_copy", init_copy)
+
+    for index, event in enumerate(events):
+        tracker.update(event)
+        states = tracker.past_states(
+            domain, ignore_rule_only_turns=ignore_rule_only_turns
+        )
+        # the same states are computed when the history is replayed from scratch
+        expected = DialogueStateTracker.from_events(
+            "default", events[: index + 1], domain.slots
+        ).past_states(domain, ignore_rule_only_turns=ignore_rule_only_turns)
+        assert states == expected
+
+    # the history is only replayed again once a reverted event was applied
+    assert init_copy.call_count == 2
+
+
+def test_past_states_cache_is_not_modified_by_caller(domain: Domain):
+    tracker = DialogueStateTracker.from_events(
+        "default",
+        [ActionExecuted(ACTION_LISTEN_NAME), UserUttered("hi", {"name": "greet"})],
+        domain.slots,
+    )
+
+    states = tracker.past_states(domain)
+    del states[-1][USER]
+
+    assert USER in tracker.past_states(domain)[-1]
+    # copies of the tracker don't share the cache
+    assert not copy.deepcopy(tracker).past_states_cache
@@ -26,6 +26,22 @@ def test_get_latest_model(tmp_path: Path):
     assert rasa.model.get_latest_model(str(path)) == path_of_latest
 
 
+def test_get_latest_model_with_model_directories(tmp_path: Path):
+    path = tmp_path / "test_get_latest_model"
+    path.mkdir()
+    Path(path / "model_one.tar").touch()
+    (path / "not_a_model").mkdir()
+
+    # create second model later to be registered as distinct in Windows
+    time.sleep(0.1)
+    model_directory = path / "model_two"
+    model_directory.mkdir()
+    Path(model_directory / "metadata.json").touch()
+
+    assert rasa.model.get_latest_model(str(path)) == str(model_directory)
+    assert rasa.model.get_latest_model(str(model_directory)) == str(model_directory)
+
+
 def test_get_local_model(trained_rasa_model: str):
     assert rasa.model.get_local_model(trained_rasa_model) == trained_rasa_model
 
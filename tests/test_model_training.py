@@ -1088,3 +1088,60 @@ def test_check_unresolved_slots(capsys: CaptureFixture):
         ]
     )
     assert rasa.model_training._check_unresolved_slots(domain, stories) is None
+
+
+@pytest.mark.parametrize(
+    "archive_format, fixed_model_name, expected_model_name",
+    [
+        ("tar.gz", "my-model", "my-model.tar.gz"),
+        ("tar", "my-model", "my-model.tar"),
+        ("tar", "my-model.tar", "my-model.tar"),
+        ("tar.gz", "my.model", "my.model.tar.gz"),
+        ("directory", "my-model", "my-model"),
+    ],
+)
+def test_determine_model_name_with_archive_format(
+    monkeypatch: MonkeyPatch,
+    archive_format: Text,
+    fixed_model_name: Text,
+    expected_model_name: Text,
+):
+    monkeypatch.setenv("MODEL_ARCHIVE_FORMAT", archive_format)
+
+    model_name = rasa.model_training._determine_model_name(
+        fixed_model_name, TrainingType.BOTH
+    )
+
+    assert model_name == expected_model_name
+
+
+@pytest.mark.parametrize(
+    "archive_format, fixed_model_name, expected_model_name",
+    [
+        ("directory", "my-model.tar.gz", "my-model"),
+        ("tar", "my-model.tar.gz", "my-model.tar"),
+        ("tar.gz", "my-model.tar", "my-model.tar.gz"),
+        ("tar.gz", "my-model.tgz", "my-model.tar.gz"),
+    ],
+)
+def test_determine_model_name_with_suffix_of_other_archive_format(
+    monkeypatch: MonkeyPatch,
+    archive_format: Text,
+    fixed_model_name: Text,
+    expected_model_name: Text,
+):
+    monkeypatch.setenv("MODEL_ARCHIVE_FORMAT", archive_format)
+
+    with pytest.warns(UserWarning, match=archive_format):
+        model_name = rasa.model_training._determine_model_name(
+            fixed_model_name, TrainingType.BOTH
+        )
+
+    assert model_name == expected_model_name
+
+
+def test_determine_model_name_with_invalid_archive_format(monkeypatch: MonkeyPatch):
+    monkeypatch.setenv("MODEL_ARCHIVE_FORMAT", "zip")
+
+    with pytest.raises(InvalidConfigException):
+        rasa.model_training._determine_model_name(None, TrainingType.BOTH)
@@ -0,0 +1,49 @@
+import time
+from typing import Callable, Dict, List, Text
+
+import pytest
+
+from rasa.engine.storage.resource import Resource
+from rasa.engine.storage.storage import ModelStorage
+from rasa.nlu.extractors.regex_entity_extractor import RegexEntityExtractor
+from rasa.shared.nlu.constants import TEXT
+from rasa.shared.nlu.training_data.message import Message
+
+NUMBER_OF_MESSAGES = 200
+
+MESSAGE_TEXT = "I would like to order pizza number 42 to 12345 Berlin, Bakerstreet 7"
+
+
+def _patterns(number_of_patterns: int) -> List[Dict[Text, Text]]:
+    return [
+        {"name": f"pattern_{index}", "pattern": f"\\b[a-z]+{index}\\b"}
+        for index in range(number_of_patterns)
+    ]
+
+
+def _seconds_per_message(process: Callable[[], None]) -> float:
+    start = time.perf_counter()
+    for _ in range(NUMBER_OF_MESSAGES):
+        process()
+    return (time.perf_counter() - start) / NUMBER_OF_MESSAGES
+
+
+@pytest.mark.parametrize("number_of_patterns", [10, 100, 1000])
+def test_regex_entity_extractor_benchmark(
+    number_of_patterns: int,
+    default_model_storage: ModelStorage,
+    record_property: Callable[[Text, object], None],
+):
+    # the timings depend on the machine, hence they are only recorded in the test
+    # report (e.g. with `--junitxml`) instead of being compared to a threshold
+    extractor = RegexEntityExtractor(
+        RegexEntityExtractor.get_default_config(),
+        default_model_storage,
+        Resource("regex_benchmark"),
+        patterns=_patterns(number_of_patterns),
+    )
+
+    def process() -> None:
+        extractor.process([Message(data={TEXT: MESSAGE_TEXT})])
+
+    record_property("seconds_per_message", _seconds_per_message(process))
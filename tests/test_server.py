@@ -65,6 +65,7 @@ from rasa.shared.core.events import (
     SessionStarted,
 )
 from rasa.shared.core.trackers import DialogueStateTracker
+from rasa.shared.exceptions import InvalidConfigException
 from rasa.shared.nlu.constants import (
     INTENT_NAME_KEY,
     ENTITY_ATTRIBUTE_TYPE,
@@ -196,6 +197,7 @@ async def test_status(rasa_app: SanicASGITestClient, trained_rasa_model: Text):
     assert response.status == HTTPStatus.OK
     assert "model_id" in response.json
     assert model_file == Path(trained_rasa_model).name
+    assert response.json["inference"]["queue_depth"] == 0
 
 
 async def test_status_nlu_only(
@@ -325,6 +327,73 @@ async def test_parse_on_invalid_emulation_mode(rasa_app: SanicASGITestClient):
     assert response.status == HTTPStatus.BAD_REQUEST
 
 
+async def test_parse_batch(rasa_app: SanicASGITestClient):
+    texts = ["hello", "/greet", "bye"]
+    _, single_response = await rasa_app.post("/model/parse", json={"text": "hello"})
+
+    _, response = await rasa_app.post(
+        "/model/parse/batch", json=[texts[0], {"text": texts[1]}, texts[2]]
+    )
+
+    assert response.status == HTTPStatus.OK
+    assert [parse_data["text"] for parse_data in response.json] == texts
+    assert response.json[0] == single_response.json
+    assert response.json[1]["intent"] == {"name": "greet", "confidence": 1.0}
+
+
+async def test_parse_batch_stream(stack_agent: Agent, monkeypatch: MonkeyPatch):
+    monkeypatch.setenv(rasa.constants.ENV_MAX_PARSE_BATCH_SIZE, "2")
+    rasa_app = rasa.server.create_app(agent=stack_agent).asgi_client
+    texts = ["hello", "/greet", "bye"]
+
+    _, response = await rasa_app.post(
+        "/model/parse/batch?stream=true", json={"messages": texts}
+    )
+
+    assert response.status == HTTPStatus.OK
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [parse_data["text"] for parse_data in lines] == texts
+
+
+async def test_parse_batch_normalises_messages(rasa_app: SanicASGITestClient):
+    _, single_response = await rasa_app.post("/model/parse", json={"text": ["hello"]})
+
+    _, response = await rasa_app.post("/model/parse/batch", json=[{"text": ["hello"]}])
+
+    assert response.status == HTTPStatus.OK
+    assert response.json == [single_response.json]
+
+
+@pytest.mark.parametrize(
+    "payload", [{"text": "hello"}, [{"message": "hello"}], ["hello", 1], [{"text": 1}]]
+)
+async def test_parse_batch_with_invalid_payload(
+    rasa_app: SanicASGITestClient, payload: Any
+):
+    _, response = await rasa_app.post("/model/parse/batch", json=payload)
+
+    assert response.status == HTTPStatus.BAD_REQUEST
+
+
+async def test_parse_batch_too_large(stack_agent: Agent, monkeypatch: MonkeyPatch):
+    monkeypatch.setenv(rasa.constants.ENV_MAX_PARSE_BATCH_SIZE, "2")
+    rasa_app = rasa.server.create_app(agent=stack_agent).asgi_client
+
+    _, response = await rasa_app.post("/model/parse/batch", json=["hello", "hi", "bye"])
+
+    assert response.status == HTTPStatus.BAD_REQUEST
+
+
+@pytest.mark.parametrize("max_batch_size", ["0", "-1", "many", "1.5"])
+def test_create_app_with_invalid_max_parse_batch_size(
+    empty_agent: Agent, monkeypatch: MonkeyPatch, max_batch_size: Text
+):
+    monkeypatch.setenv(rasa.constants.ENV_MAX_PARSE_BATCH_SIZE, max_batch_size)
+
+    with pytest.raises(InvalidConfigException):
+        rasa.server.create_app(empty_agent)
+
+
 async def test_train_nlu_success(
     rasa_app: SanicASGITestClient,
     stack_config_path: Text,
@@ -1,3 +1,5 @@
+import json
+
 from yarl import URL
 
 
@@ -6,4 +8,8 @@ def latest_request(mocked, request_type, path):
 
 
 def json_of_latest_request(r):
-    return r[-1].kwargs["json"]
+    kwargs = r[-1].kwargs
+    if "json" in kwargs:
+        return kwargs["json"]
+
+    return json.loads(kwargs["data"])
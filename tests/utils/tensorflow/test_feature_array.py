@@ -1,10 +1,20 @@
+from pathlib import Path
+from typing import Any, Dict, Text
+
 import numpy as np
 import scipy.sparse
+from safetensors.numpy import save_file
 
+import rasa.shared.utils.io
 from rasa.utils.tensorflow.feature_array import (
     _recursive_serialize,
     _serialize_nested_data,
     _deserialize_nested_data,
+    deserialize_nested_feature_arrays,
+    serialize_nested_feature_arrays,
+    PACKED_ARRAY,
+    PACKED_DENSE,
+    PACKED_SPARSE,
 )
 from rasa.utils.tensorflow.model_data import RasaModelData
 
@@ -195,3 +205,98 @@ def test_serialize_and_deserialize_model_data(model_data: RasaModelData):
             actual_data["entities"]["tag_ids"][0][i]
             == loaded_data["entities"]["tag_ids"][0][i]
         ).all()
+
+
+def _assert_features_equal(actual: Any, loaded: Any) -> None:
+    if isinstance(actual, scipy.sparse.spmatrix):
+        assert isinstance(loaded, scipy.sparse.spmatrix)
+        assert actual.shape == loaded.shape
+        assert (actual.toarray() == loaded.toarray()).all()
+    elif isinstance(actual, (list, np.ndarray)) and isinstance(
+        actual[0], (list, np.ndarray, scipy.sparse.spmatrix)
+    ):
+        assert len(actual) == len(loaded)
+        for actual_item, loaded_item in zip(actual, loaded):
+            _assert_features_equal(actual_item, loaded_item)
+    else:
+        assert np.array_equal(np.asarray(actual), np.asarray(loaded))
+
+
+def _assert_model_data_equal(
+    actual_data: Dict[Text, Any], loaded_data: Dict[Text, Any]
+) -> None:
+    assert actual_data.keys() == loaded_data.keys()
+    for key, sub_key_to_features in actual_data.items():
+        assert sub_key_to_features.keys() == loaded_data[key].keys()
+        for sub_key, feature_arrays in sub_key_to_features.items():
+            loaded_feature_arrays = loaded_data[key][sub_key]
+            assert len(feature_arrays) == len(loaded_feature_arrays)
+            for actual, loaded in zip(feature_arrays, loaded_feature_arrays):
+                assert actual.number_of_dimensions == loaded.number_of_dimensions
+                assert actual.is_sparse == loaded.is_sparse
+                assert actual.units == loaded.units
+                _assert_features_equal(actual, loaded)
+
+
+def test_serialize_packed_model_data(model_data: RasaModelData):
+    data_dict = {}
+    metadata = []
+    _serialize_nested_data(
+        model_data.data, "component", data_dict, metadata, pack_feature_arrays=True
+    )
+
+    feature_types = {
+        (component["key"], sub_component["key"]): [
+            feature["type"] for feature in sub_component["features"]
+        ]
+        for component in metadata
+        for sub_component in component["components"]
+    }
+    assert feature_types == {
+        ("text", "sentence"): [PACKED_DENSE, PACKED_SPARSE],
+        ("action_text", "sequence"): [PACKED_SPARSE, PACKED_DENSE],
+        ("dialogue", "sentence"): [PACKED_DENSE],
+        ("label", "ids"): [PACKED_ARRAY],
+        ("entities", "tag_ids"): [PACKED_DENSE],
+    }
+    # the number of tensors doesn't depend on the number of examples
+    assert len(data_dict) == 19
+
+    loaded_data = _deserialize_nested_data(metadata, data_dict)
+
+    _assert_model_data_equal(model_data.data, loaded_data)
+
+
+def test_serialize_packed_model_data_to_files(
+    model_data: RasaModelData, tmp_path: Path
+):
+    data_file = str(tmp_path / "data.st")
+    metadata_file = str(tmp_path / "metadata.json")
+
+    serialize_nested_feature_arrays(model_data.data, data_file, metadata_file)
+    loaded_data = deserialize_nested_feature_arrays(data_file, metadata_file)
+
+    _assert_model_data_equal(model_data.data, loaded_data)
+
+
+def test_deserialize_feature_arrays_which_are_not_packed(
+    model_data: RasaModelData, tmp_path: Path
+):
+    data_file = str(tmp_path / "data.st")
+    metadata_file = str(tmp_path / "metadata.json")
+
+    # models which were trained with older versions store a tensor per matrix
+    data_dict = {}
+    metadata = []
+    _serialize_nested_data(model_data.data, "component", data_dict, metadata)
+    save_file(data_dict, data_file)
+    rasa.shared.utils.io.dump_obj_as_json_to_file(metadata_file, metadata)
+
+    loaded_data = deserialize_nested_feature_arrays(data_file, metadata_file)
+
+    assert len(loaded_data["action_text"]["sequence"][0]) == 5
+    for i in range(5):
+        _assert_features_equal(
+            model_data.data["text"]["sentence"][1][i],
+            loaded_data["text"]["sentence"][1][i],
+        )
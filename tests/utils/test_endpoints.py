@@ -1,8 +1,11 @@
+import asyncio
+import threading
 import structlog
 from pathlib import Path
 from typing import Text, Optional, Union
 from unittest.mock import Mock
 
+import aiohttp
 import pytest
 from aioresponses import aioresponses
 
@@ -155,6 +158,95 @@ async def test_request_non_json_response():
         assert not response
 
 
+async def test_request_reuses_pooled_session():
+    with aioresponses() as mocked:
+        endpoint = endpoint_utils.EndpointConfig(
+            "https://example.com/", connection_limit=5, connection_limit_per_host=2
+        )
+
+        mocked.post("https://example.com/test", payload={"ok": True}, repeat=True)
+
+        await endpoint.request("post", subpath="test")
+        session = endpoint.pooled_session()
+        await endpoint.request("post", subpath="test")
+
+        assert endpoint.pooled_session() is session
+        assert session.connector.limit == 5
+        assert session.connector.limit_per_host == 2
+        assert len(latest_request(mocked, "post", "https://example.com/test")) == 2
+
+        await endpoint.close()
+
+        assert session.closed
+        assert endpoint.pooled_session() is not session
+
+        await endpoint.close()
+
+
+def test_pooled_session_of_finished_loop_is_closed():
+    endpoint = endpoint_utils.EndpointConfig("https://example.com/")
+
+    async def pooled_session() -> aiohttp.ClientSession:
+        return endpoint.pooled_session()
+
+    loop = asyncio.new_event_loop()
+    previous_session = loop.run_until_complete(pooled_session())
+
+    async def replace_session() -> None:
+        session = endpoint.pooled_session()
+        # let the session of the previous loop close
+        await asyncio.sleep(0)
+
+        assert session is not previous_session
+        assert previous_session.closed
+        await endpoint.close()
+
+    asyncio.run(replace_session())
+    loop.close()
+
+
+async def test_pooled_session_of_loop_in_other_thread_is_closed_on_its_loop():
+    endpoint = endpoint_utils.EndpointConfig("https://example.com/")
+    other_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+    thread.start()
+
+    async def pooled_session() -> aiohttp.ClientSession:
+        return endpoint.pooled_session()
+
+    try:
+        previous_session = asyncio.run_coroutine_threadsafe(
+            pooled_session(), other_loop
+        ).result(timeout=5)
+
+        session = endpoint.pooled_session()
+
+        # wait until the loop in the other thread ran the scheduled close
+        asyncio.run_coroutine_threadsafe(asyncio.sleep(0), other_loop).result(timeout=5)
+        assert session is not previous_session
+        assert previous_session.closed
+    finally:
+        other_loop.call_soon_threadsafe(other_loop.stop)
+        thread.join(timeout=5)
+        other_loop.close()
+        await endpoint.close()
+
+
+def test_endpoint_config_copy_keeps_connection_settings():
+    endpoint = endpoint_utils.EndpointConfig(
+        "https://example.com/",
+        connection_limit=5,
+        connection_limit_per_host=2,
+        keepalive_timeout=30,
+    )
+
+    copied = endpoint.copy()
+
+    assert copied.connection_limit == 5
+    assert copied.connection_limit_per_host == 2
+    assert copied.keepalive_timeout == 30
+
+
 @pytest.mark.parametrize(
     "filename, endpoint_type",
     [("data/test_endpoints/example_endpoints.yml", "tracker_store")],